@@ -37,7 +37,7 @@ class EmailAccountService:
                 updated_at=datetime.now()
             )
             saved_entity = self._email_account_repo.save(account_entity)
-            logger.info(f"Created email account: {saved_entity.name}")
+            logger.info("Created email account: %s", saved_entity.name)
 
             # Return ORM for API compatibility
             from infrastructure.persistence.mappers.email_mapper import EmailAccountMapper
@@ -57,7 +57,7 @@ class EmailAccountService:
             from infrastructure.persistence.mappers.email_mapper import EmailAccountMapper
             return EmailAccountMapper.to_model(entity)
         except Exception as e:
-            logger.exception(f"Error getting email account {account_id}")
+            logger.exception("Error getting email account %s", account_id)
             raise e
 
     def get_all_accounts(self) -> List[EmailAccountORM]:
@@ -88,13 +88,13 @@ class EmailAccountService:
 
             entity.updated_at = datetime.now()
             updated_entity = self._email_account_repo.update(entity)
-            logger.info(f"Updated email account: {updated_entity.name}")
+            logger.info("Updated email account: %s", updated_entity.name)
 
             # Return ORM for API compatibility
             from infrastructure.persistence.mappers.email_mapper import EmailAccountMapper
             return EmailAccountMapper.to_model(updated_entity)
         except Exception as e:
-            logger.exception(f"Error updating email account {account_id}")
+            logger.exception("Error updating email account %s", account_id)
             raise e
 
     def delete_account(self, account_id: int) -> bool:
@@ -106,10 +106,10 @@ class EmailAccountService:
 
             result = self._email_account_repo.delete(account_id)
             if result:
-                logger.info(f"Deleted email account: {entity.name}")
+                logger.info("Deleted email account: %s", entity.name)
             return result
         except Exception as e:
-            logger.exception(f"Error deleting email account {account_id}")
+            logger.exception("Error deleting email account %s", account_id)
             raise e
 
 
@@ -139,7 +139,7 @@ class ClassifiedEmailService:
             )
 
             if existing:
-                logger.warning(f"Email already exists for account {email_data.email_account_id}, IMAP ID {email_data.imap_id}")
+                logger.warning("Email already exists for account %s, IMAP ID %s", email_data.email_account_id, email_data.imap_id)
                 raise ValueError("Email with this IMAP ID already exists for this account")
 
             email_entity = ClassifiedEmail(
@@ -158,7 +158,7 @@ class ClassifiedEmailService:
                 updated_at=datetime.now()
             )
             saved_entity = self._classified_email_repo.save(email_entity)
-            logger.info(f"Created classified email: {saved_entity.id} from {saved_entity.sender}")
+            logger.info("Created classified email: %s from %s", saved_entity.id, saved_entity.sender)
 
             # Return ORM for API compatibility
             from infrastructure.persistence.mappers.email_mapper import ClassifiedEmailMapper
@@ -176,7 +176,7 @@ class ClassifiedEmailService:
             ).filter(ClassifiedEmailORM.id == email_id).one_or_none()
             return model
         except Exception as e:
-            logger.exception(f"Error getting classified email {email_id}")
+            logger.exception("Error getting classified email %s", email_id)
             raise e
 
     def get_email_by_imap_id(self, email_account_id: int, imap_id: str) -> Optional[ClassifiedEmailORM]:
@@ -190,7 +190,7 @@ class ClassifiedEmailService:
             from infrastructure.persistence.mappers.email_mapper import ClassifiedEmailMapper
             return ClassifiedEmailMapper.to_model(entity)
         except Exception as e:
-            logger.exception(f"Error getting email by IMAP ID {imap_id}")
+            logger.exception("Error getting email by IMAP ID %s", imap_id)
             raise e
 
     def get_all_emails(self,
@@ -255,13 +255,13 @@ class ClassifiedEmailService:
 
             entity.updated_at = datetime.now()
             updated_entity = self._classified_email_repo.update(entity)
-            logger.info(f"Updated classification for email {updated_entity.id}")
+            logger.info("Updated classification for email %s", updated_entity.id)
 
             # Return ORM for API compatibility
             from infrastructure.persistence.mappers.email_mapper import ClassifiedEmailMapper
             return ClassifiedEmailMapper.to_model(updated_entity)
         except Exception as e:
-            logger.exception(f"Error updating classified email {email_id}")
+            logger.exception("Error updating classified email %s", email_id)
             raise e
 
     def delete_email(self, email_id: int) -> bool:
@@ -273,8 +273,8 @@ class ClassifiedEmailService:
 
             result = self._classified_email_repo.delete(email_id)
             if result:
-                logger.info(f"Deleted classified email {email_id}")
+                logger.info("Deleted classified email %s", email_id)
             return result
         except Exception as e:
-            logger.exception(f"Error deleting classified email {email_id}")
+            logger.exception("Error deleting classified email %s", email_id)
             raise e
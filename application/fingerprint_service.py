@@ -1,35 +1,80 @@
 import logging
 from datetime import datetime
+from typing import List, Optional
 
 from domain.repositories.fingerprint_repository import FingerprintRepository
 from domain.entities.fingerprint import Fingerprint
+from domain.services.minhash_service import MinHashService
 
 logger = logging.getLogger(__name__)
 
 class FingerprintService:
     """Application service for fingerprint operations - uses repository pattern."""
 
-    def __init__(self, fingerprint_repository: FingerprintRepository):
+    def __init__(self, fingerprint_repository: FingerprintRepository, minhash_service: MinHashService):
         self._fingerprint_repo = fingerprint_repository
+        self._minhash = minhash_service
 
     def create_fingerprint(self, visitor_id: str, components: dict) -> Fingerprint:
         """Create or update a fingerprint."""
         try:
+            # MinHash signature and LSH buckets for near-duplicate visitor linking
+            signature = self._minhash.signature(components)
+            buckets = self._minhash.band_keys(signature)
+
             # Check if fingerprint already exists
             existing = self._fingerprint_repo.find_by_visitor_id(visitor_id)
 
             if existing:
                 # Update existing fingerprint
                 existing.components = components
+                existing.minhash_signature = signature
+                existing.lsh_buckets = buckets
                 return self._fingerprint_repo.save(existing)
             else:
                 # Create new fingerprint domain entity
                 fingerprint = Fingerprint(
                     visitor_id=visitor_id,
                     components=components,
-                    created_at=datetime.now()
+                    created_at=datetime.now(),
+                    minhash_signature=signature,
+                    lsh_buckets=buckets
                 )
                 return self._fingerprint_repo.save(fingerprint)
         except Exception as e:
             logger.exception("Error creating fingerprint")
             raise e
+
+    def search_fingerprints(
+        self,
+        timezone: Optional[str] = None,
+        platform: Optional[str] = None,
+        screen_resolution: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Fingerprint]:
+        """Find fingerprints by their indexed component fields."""
+        filters = {
+            column: value
+            for column, value in (
+                ("timezone", timezone),
+                ("platform", platform),
+                ("screen_resolution", screen_resolution),
+            )
+            if value is not None
+        }
+        try:
+            return self._fingerprint_repo.find_by_components(filters, limit=limit, offset=offset)
+        except Exception as e:
+            logger.exception("Error searching fingerprints")
+            raise e
+
+    def reextract_indexed_components(self, batch_size: int = 1000) -> int:
+        """Refill the indexed component columns after FINGERPRINT_INDEXED_COMPONENTS changed."""
+        try:
+            changed = self._fingerprint_repo.reextract_indexed_components(batch_size)
+            logger.info("Re-extracted the indexed components of %d fingerprints", changed)
+            return changed
+        except Exception as e:
+            logger.exception("Error re-extracting fingerprint components")
+            raise e
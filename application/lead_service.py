@@ -28,6 +28,7 @@ from infrastructure.persistence.models import (
     RecommendedPackModel as RecommendedPackORM,
     LeadModel as LeadORM
 )
+from infrastructure.observability import timed
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -124,6 +125,7 @@ class LeadService:
 
         return concern
 
+    @timed("db")
     def create_lead(self, lead_payload: LeadPayload, altcha: str, visitor_id: str) -> LeadORM:
         """Create a new lead - returns ORM model for API compatibility."""
         try:
@@ -148,7 +150,7 @@ class LeadService:
             pack_name = self._scoring_service.recommend_pack(lead_payload.concerns)
             recommended_pack_orm = self._session.query(RecommendedPackORM).filter_by(name=pack_name).first()
             if not recommended_pack_orm:
-                logger.error(f"Recommended pack '{pack_name}' not found in the database.")
+                logger.error("Recommended pack '%s' not found in the database.", pack_name)
                 recommended_pack_orm = self._session.query(RecommendedPackORM).filter_by(name='conformité').first()
 
             recommended_pack = RecommendedPack(
@@ -159,7 +161,7 @@ class LeadService:
             # Get urgency
             urgency_orm = self._session.query(LeadUrgencyORM).filter_by(name=lead_payload.urgency).first()
             if not urgency_orm:
-                logger.warning(f"Urgency '{lead_payload.urgency}' not found, defaulting to 'moyen terme'.")
+                logger.warning("Urgency '%s' not found, defaulting to 'moyen terme'.", lead_payload.urgency)
                 urgency_orm = self._session.query(LeadUrgencyORM).filter_by(name='moyen terme').first()
 
             urgency = LeadUrgency(
@@ -217,36 +219,42 @@ class LeadService:
             self._session.commit()
 
             # Return ORM model for API compatibility
-            lead_orm = self._session.query(LeadORM).filter(LeadORM.id == saved_lead.id).first()
-            return lead_orm
+            return self._lead_repo.find_for_response(saved_lead.id)
 
         except Exception as e:
             logger.exception("Error creating lead")
             raise e
 
+    @timed("db")
     def get_all_leads(self) -> List[LeadORM]:
         """Get all leads - returns ORM models for API compatibility."""
         try:
-            leads = self._lead_repo.find_all()
-            # Convert back to ORM for API compatibility
-            lead_ids = [lead.id for lead in leads]
-            return self._session.query(LeadORM).filter(LeadORM.id.in_(lead_ids)).all()
+            return self._lead_repo.find_all_for_response()
         except Exception as e:
             logger.exception("Error getting all leads")
             raise e
 
+    @timed("db")
     def get_lead_by_id(self, lead_id: int) -> Optional[LeadORM]:
         """Get lead by ID - returns ORM model for API compatibility."""
         try:
-            lead = self._lead_repo.find_by_id(lead_id)
-            if not lead:
-                return None
-            # Convert back to ORM for API compatibility
-            return self._session.query(LeadORM).filter(LeadORM.id == lead.id).first()
+            return self._lead_repo.find_for_response(lead_id)
+        except Exception as e:
+            logger.exception("Error getting lead by id %s", lead_id)
+            raise e
+
+    @timed("db")
+    def get_leads_by_visitor_ids(self, visitor_ids: List[str]) -> List[LeadORM]:
+        """Get leads submitted by any of the given visitors - returns ORM models for API compatibility."""
+        if not visitor_ids:
+            return []
+        try:
+            return self._lead_repo.find_by_visitor_ids_for_response(visitor_ids)
         except Exception as e:
-            logger.exception(f"Error getting lead by id {lead_id}")
+            logger.exception("Error getting leads by visitor ids")
             raise e
 
+    @timed("db")
     def update_lead_notes(self, lead_id: int, notes: str) -> LeadORM:
         """Update lead notes - returns ORM model for API compatibility."""
         try:
@@ -279,13 +287,14 @@ class LeadService:
                 )
                 self._note_repo.save(note)
 
-                self._session.refresh(lead_orm)
+                lead_orm = self._lead_repo.find_for_response(lead_id)
 
             return lead_orm
         except Exception as e:
-            logger.exception(f"Error updating notes for lead {lead_id}")
+            logger.exception("Error updating notes for lead %s", lead_id)
             raise e
 
+    @timed("db")
     def update_lead(self, lead_id: int, lead_update: LeadUpdateRequest) -> Optional[LeadORM]:
         """Update lead - returns ORM model for API compatibility."""
         lead_orm = self.get_lead_by_id(lead_id)
@@ -373,5 +382,4 @@ class LeadService:
                     setattr(lead_orm, field, value)
 
         self._session.commit()
-        self._session.refresh(lead_orm)
-        return lead_orm
+        return self._lead_repo.find_for_response(lead_id)
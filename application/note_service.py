@@ -7,6 +7,7 @@ from domain.contact import NoteCreateRequest
 from application.notification_service import EmailNotificationService
 # Still need access to Lead ORM for email notification until we migrate it
 from infrastructure.persistence.models import LeadModel as Lead
+from infrastructure.observability import phase, timed
 
 logger = logging.getLogger(__name__)
 
@@ -20,23 +21,24 @@ class NoteService:
     def create_note(self, lead: Lead, note_create_request: NoteCreateRequest, author_name: str) -> Note:
         """Create a note for a lead."""
         try:
-            # Find reason
-            reason = self._note_repo.find_reason_by_name(note_create_request.reason)
-            if not reason:
-                raise ValueError(f"Reason '{note_create_request.reason}' not found")
+            with phase("db"):
+                # Find reason
+                reason = self._note_repo.find_reason_by_name(note_create_request.reason)
+                if not reason:
+                    raise ValueError(f"Reason '{note_create_request.reason}' not found")
 
-            # Create note domain entity
-            note = Note(
-                id=None,
-                note=note_create_request.note,
-                created_at=datetime.now(),
-                author_name=author_name,
-                lead_id=lead.id,
-                reason=reason
-            )
+                # Create note domain entity
+                note = Note(
+                    id=None,
+                    note=note_create_request.note,
+                    created_at=datetime.now(),
+                    author_name=author_name,
+                    lead_id=lead.id,
+                    reason=reason
+                )
 
-            # Save via repository
-            saved_note = self._note_repo.save(note)
+                # Save via repository
+                saved_note = self._note_repo.save(note)
 
             # Send email notifications if requested
             recipients = []
@@ -58,10 +60,11 @@ class NoteService:
             logger.exception("Error creating note")
             raise e
 
+    @timed("db")
     def get_notes_by_lead_id(self, lead_id: int) -> list[Note]:
         """Get all notes for a lead."""
         try:
             return self._note_repo.find_by_lead_id(lead_id)
         except Exception as e:
-            logger.exception(f"Error getting notes for lead {lead_id}")
+            logger.exception("Error getting notes for lead %s", lead_id)
             raise e
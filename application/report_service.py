@@ -23,7 +23,7 @@ class ReportService:
         try:
             # Check if fingerprint exists
             if not self._fingerprint_repo.exists(visitor_id):
-                logger.warning(f"Fingerprint not found for visitorId {visitor_id}")
+                logger.warning("Fingerprint not found for visitorId %s", visitor_id)
                 return None
 
             # Create report domain entity
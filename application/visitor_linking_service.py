@@ -0,0 +1,124 @@
+import logging
+import os
+from typing import Dict, List, Optional
+
+from domain.repositories.fingerprint_repository import FingerprintRepository
+from domain.entities.fingerprint import Fingerprint
+from domain.services.minhash_service import MinHashService
+
+logger = logging.getLogger(__name__)
+
+# Minimum estimated Jaccard similarity for two visitors to be linked
+DEFAULT_LINK_THRESHOLD = float(os.environ.get("VISITOR_LINK_THRESHOLD", "0.7"))
+# Candidates read per LSH bucket; bounds the cost of buckets shared by many identical devices
+DEFAULT_BUCKET_CANDIDATES = int(os.environ.get("VISITOR_LINK_BUCKET_CANDIDATES", "50"))
+
+
+class VisitorLinkingService:
+    """Application service linking near-duplicate visitors through MinHash/LSH."""
+
+    def __init__(
+        self,
+        fingerprint_repository: FingerprintRepository,
+        minhash_service: MinHashService,
+        threshold: float = DEFAULT_LINK_THRESHOLD,
+        bucket_candidates: int = DEFAULT_BUCKET_CANDIDATES
+    ):
+        self._fingerprint_repo = fingerprint_repository
+        self._minhash = minhash_service
+        self._threshold = threshold
+        self._bucket_candidates = bucket_candidates
+
+    def _find_similar(self, fingerprint: Fingerprint) -> List[str]:
+        """Find visitors whose fingerprint is a near-duplicate, via LSH bucket lookups."""
+        buckets = self._minhash.band_keys(fingerprint.minhash_signature)
+        candidates = self._fingerprint_repo.find_lsh_candidates(
+            buckets, fingerprint.visitor_id, per_bucket=self._bucket_candidates
+        )
+        return [
+            candidate.visitor_id
+            for candidate in candidates
+            if self._minhash.similarity(
+                fingerprint.minhash_signature, candidate.minhash_signature
+            ) >= self._threshold
+        ]
+
+    def index_missing_signatures(self, batch_size: int = 500) -> int:
+        """Compute signatures and buckets for fingerprints stored before linking existed."""
+        indexed = 0
+        after: Optional[str] = None
+        while True:
+            page = self._fingerprint_repo.find_page(
+                after_visitor_id=after, limit=batch_size, unsigned_only=True
+            )
+            if not page:
+                return indexed
+            for fingerprint in page:
+                if not fingerprint.components:
+                    continue
+                fingerprint.minhash_signature = self._minhash.signature(fingerprint.components)
+                fingerprint.lsh_buckets = self._minhash.band_keys(fingerprint.minhash_signature)
+                self._fingerprint_repo.save(fingerprint)
+                indexed += 1
+            after = page[-1].visitor_id
+
+    def link_visitors(self, batch_size: int = 500) -> int:
+        """Cluster near-duplicate visitors and persist the clusters. Returns linked visitor count."""
+        try:
+            indexed = self.index_missing_signatures(batch_size)
+            if indexed:
+                logger.info("Indexed %d fingerprints without MinHash signature", indexed)
+
+            # Union-find over visitor IDs; each lookup only touches shared buckets
+            parent: Dict[str, str] = {}
+
+            def find(visitor_id: str) -> str:
+                parent.setdefault(visitor_id, visitor_id)
+                while parent[visitor_id] != visitor_id:
+                    parent[visitor_id] = parent[parent[visitor_id]]
+                    visitor_id = parent[visitor_id]
+                return visitor_id
+
+            def union(a: str, b: str) -> None:
+                root_a, root_b = find(a), find(b)
+                if root_a != root_b:
+                    # The smallest visitor ID is the cluster ID, keeping clusters stable between runs
+                    low, high = sorted((root_a, root_b))
+                    parent[high] = low
+
+            after: Optional[str] = None
+            while True:
+                page = self._fingerprint_repo.find_page(after_visitor_id=after, limit=batch_size)
+                if not page:
+                    break
+                for fingerprint in page:
+                    if fingerprint.minhash_signature:
+                        for other in self._find_similar(fingerprint):
+                            union(fingerprint.visitor_id, other)
+                after = page[-1].visitor_id
+
+            clusters = {visitor_id: find(visitor_id) for visitor_id in parent}
+            self._fingerprint_repo.replace_visitor_links(clusters)
+            logger.info(
+                "Linked %d visitors into %d clusters", len(clusters), len(set(clusters.values()))
+            )
+            return len(clusters)
+        except Exception as e:
+            logger.exception("Error linking visitors")
+            raise e
+
+    def get_linked_visitor_ids(self, visitor_id: str) -> Optional[List[str]]:
+        """Get the visitors linked to a visitor, None when the fingerprint is unknown."""
+        try:
+            fingerprint = self._fingerprint_repo.find_by_visitor_id(visitor_id)
+            if not fingerprint:
+                return None
+
+            # Stored clusters, plus fresh LSH matches for fingerprints written since the last run
+            linked = set(self._fingerprint_repo.find_cluster_members(visitor_id))
+            if fingerprint.minhash_signature:
+                linked.update(self._find_similar(fingerprint))
+            return sorted(linked)
+        except Exception as e:
+            logger.exception("Error getting linked visitors for %s", visitor_id)
+            raise e
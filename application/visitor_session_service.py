@@ -0,0 +1,109 @@
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from domain.repositories.report_repository import ReportRepository
+from domain.repositories.visitor_session_repository import VisitorSessionRepository
+from domain.entities.report import Report
+from domain.entities.visitor_session import VisitorSession
+
+logger = logging.getLogger(__name__)
+
+# Inactivity gap after which a visitor's next page starts a new session
+DEFAULT_SESSION_GAP_MINUTES = int(os.environ.get("SESSION_GAP_MINUTES", "30"))
+# Pages kept per session; longer sessions (usually bots) still count every report
+MAX_SESSION_PAGES = 500
+# Reports younger than this are left for the next run: a report whose ID was
+# allocated before a higher, already committed one may still be uncommitted,
+# and the watermark must not move past it.
+DEFAULT_SETTLE_SECONDS = int(os.environ.get("SESSION_SETTLE_SECONDS", "60"))
+WATERMARK_NAME = "sessions"
+
+
+class VisitorSessionService:
+    """Application service reconstructing visitor sessions from page reports."""
+
+    def __init__(
+        self,
+        report_repository: ReportRepository,
+        visitor_session_repository: VisitorSessionRepository,
+        gap: timedelta = timedelta(minutes=DEFAULT_SESSION_GAP_MINUTES),
+        settle: timedelta = timedelta(seconds=DEFAULT_SETTLE_SECONDS)
+    ):
+        self._report_repo = report_repository
+        self._session_repo = visitor_session_repository
+        self._gap = gap
+        self._settle = settle
+
+    @staticmethod
+    def _start_session(report: Report) -> VisitorSession:
+        return VisitorSession(
+            id=None,
+            visitor_id=report.visitor_id,
+            started_at=report.created_at,
+            ended_at=report.created_at,
+            pages=[report.page],
+            report_count=1,
+            last_report_id=report.id
+        )
+
+    @staticmethod
+    def _extend_session(visitor_session: VisitorSession, report: Report) -> None:
+        if len(visitor_session.pages) < MAX_SESSION_PAGES:
+            visitor_session.pages.append(report.page)
+        visitor_session.ended_at = max(visitor_session.ended_at, report.created_at)
+        visitor_session.report_count += 1
+        visitor_session.last_report_id = report.id
+
+    def reconstruct_sessions(self, batch_size: int = 1000) -> int:
+        """
+        Fold the reports written since the last run into sessions.
+
+        The run stops at the last report older than the settle window, so
+        reports still being committed by concurrent writers are not skipped.
+        Reports are streamed per visitor in time order, so only the session being
+        built is held in memory. The first new report of a visitor may extend the
+        visitor's latest stored session. Returns the number of reports processed.
+        """
+        try:
+            after_id = self._session_repo.get_watermark(WATERMARK_NAME)
+            up_to_id = self._report_repo.max_id(created_before=datetime.now(timezone.utc) - self._settle)
+            if up_to_id <= after_id:
+                return 0
+
+            processed = 0
+            current: Optional[VisitorSession] = None
+            dirty = False
+            for report in self._report_repo.stream_between(after_id, up_to_id, batch_size):
+                if current is None or current.visitor_id != report.visitor_id:
+                    if dirty:
+                        self._session_repo.save(current)
+                    current = self._session_repo.find_latest_for_visitor(report.visitor_id)
+                    dirty = False
+
+                if current is not None and report.created_at - current.ended_at <= self._gap:
+                    self._extend_session(current, report)
+                else:
+                    if dirty:
+                        self._session_repo.save(current)
+                    current = self._start_session(report)
+                dirty = True
+                processed += 1
+
+            if dirty:
+                self._session_repo.save(current)
+            self._session_repo.commit_watermark(WATERMARK_NAME, up_to_id)
+            logger.info("Folded %d reports into sessions (reports %d..%d)", processed, after_id + 1, up_to_id)
+            return processed
+        except Exception as e:
+            logger.exception("Error reconstructing sessions")
+            raise e
+
+    def get_session_before(self, visitor_id: str, moment: datetime) -> Optional[VisitorSession]:
+        """Get the visitor session that led up to a moment, such as a lead submission."""
+        try:
+            return self._session_repo.find_latest_for_visitor(visitor_id, started_before=moment)
+        except Exception as e:
+            logger.exception("Error getting session for visitor %s", visitor_id)
+            raise e
@@ -0,0 +1,78 @@
+"""Compare the native ASGI entry point with the legacy a2wsgi-wrapped one under gunicorn.
+
+Both configurations run through gunicorn.conf.py with the same worker count,
+against a throwaway SQLite database. Two workloads are measured: GET
+/altcha-challenge/ (no database) and POST /report/ (one insert per request).
+
+The legacy leg needs an explicit WSGI interface: uvicorn's auto-detection
+treats the a2wsgi callable as an ASGI2 app and answers every request with a
+500, which is how the old `-k uvicorn.workers.UvicornWorker
+infrastructure.web.wsgi:app` command behaves with current uvicorn releases.
+
+Usage: python -m benchmarks.asgi_vs_wsgi [--workers 1] [--duration 10] [--concurrency 32]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import uuid
+
+import httpx
+from uvicorn_worker import UvicornWorker
+
+from benchmarks.common import altcha_payload, free_port, load, migrate, serve
+
+CONFIGURATIONS = {
+    "asgi": ("infrastructure.web.asgi:app", None),
+    "a2wsgi": ("infrastructure.web.wsgi:app", "benchmarks.asgi_vs_wsgi.WSGIUvicornWorker"),
+}
+
+
+class WSGIUvicornWorker(UvicornWorker):
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "interface": "wsgi"}
+
+
+def run_configuration(name: str, database_url: str, workers: int, duration: float, concurrency: int) -> list:
+    port = free_port()
+    app_module, worker_class = CONFIGURATIONS[name]
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", app_module]
+    if worker_class:
+        command[-1:-1] = ["-k", worker_class]
+    env = {"GUNICORN_BIND": f"127.0.0.1:{port}", "WEB_CONCURRENCY": str(workers), "GUNICORN_LOG_LEVEL": "warning"}
+    results = []
+    with serve(command, database_url, port, env) as base_url:
+        altcha = altcha_payload(base_url)
+        visitor_id = str(uuid.uuid4())
+        httpx.post(f"{base_url}/fingerprint/", json={"visitorId": visitor_id, "components": {}, "altcha": altcha})
+
+        workloads = {
+            "altcha_challenge": lambda client, n, i: client.get("/altcha-challenge/"),
+            "report": lambda client, n, i: client.post(
+                "/report/", json={"visitorId": visitor_id, "page": f"/bench/{n}/{i}", "altcha": altcha}
+            ),
+        }
+        for workload, send in workloads.items():
+            results.append({"entrypoint": name, "workload": workload, **load(base_url, send, duration, concurrency)})
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=1, help="gunicorn workers per configuration")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per workload")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent in-flight requests")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        migrate(database_url)
+        for name in CONFIGURATIONS:
+            for result in run_configuration(name, database_url, args.workers, args.duration, args.concurrency):
+                print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
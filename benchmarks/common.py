@@ -0,0 +1,114 @@
+"""Helpers shared by the HTTP benchmarks: throwaway database, server process, load loop."""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+import httpx
+from altcha import Payload, solve_challenge
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HMAC_KEY = os.environ.get("ALTCHA_HMAC_KEY", "benchmark-hmac-key")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def migrate(database_url: str) -> None:
+    """Bring a (fresh) database to the Alembic head."""
+    subprocess.run(
+        [sys.executable, "run_migrations.py"],
+        cwd=ROOT_DIR, env=dict(os.environ, DATABASE_URL=database_url, ENV="benchmark"),
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"{base_url}/altcha-challenge/", timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not start within {timeout}s")
+
+
+@contextmanager
+def serve(command: list, database_url: str, port: int, env: dict = None, stdout=subprocess.DEVNULL):
+    """Run a server command from the repository root and yield its base URL once it answers."""
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        command,
+        cwd=ROOT_DIR,
+        env=dict(os.environ, DATABASE_URL=database_url, ENV="benchmark", ALTCHA_HMAC_KEY=HMAC_KEY, **(env or {})),
+        stdout=stdout,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_ready(base_url)
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def altcha_payload(base_url: str) -> str:
+    """Solve one challenge; the payload is reused for every request so verification cost stays server-side."""
+    challenge = httpx.get(f"{base_url}/altcha-challenge/").json()
+    solution = solve_challenge(
+        challenge["challenge"], challenge["salt"], challenge["algorithm"], challenge["maxNumber"]
+    )
+    return Payload(
+        challenge["algorithm"], challenge["challenge"], solution.number, challenge["salt"], challenge["signature"]
+    ).to_base64()
+
+
+async def _load(base_url: str, send, duration: float, concurrency: int) -> dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=10.0) as client:
+        latencies = []
+        errors = 0
+        deadline = time.monotonic() + duration
+
+        async def worker(n: int):
+            nonlocal errors
+            i = 0
+            while time.monotonic() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await send(client, n, i)
+                    failed = response.status_code != 200
+                except httpx.TransportError:
+                    failed = True
+                latencies.append(time.perf_counter() - started)
+                errors += failed
+                i += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+    }
+
+
+def load(base_url: str, send, duration: float, concurrency: int) -> dict:
+    """Keep `concurrency` requests in flight for `duration` seconds.
+
+    `send(client, worker_number, iteration)` issues one request and returns the response.
+    """
+    return asyncio.run(_load(base_url, send, duration, concurrency))
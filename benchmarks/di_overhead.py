@@ -0,0 +1,97 @@
+"""Micro-benchmark of per-request dependency resolution.
+
+Times the service factories FastAPI calls on every request: the previous
+implementation (function-level imports, every repository and stateless
+service rebuilt per call, reproduced below as the reference) against the
+container-backed factories in the app. No query is issued, so this is pure
+DI overhead.
+
+Usage: python -m benchmarks.di_overhead [--number 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+os.environ.setdefault("ENV", "benchmark")
+
+from application.fingerprint_service import FingerprintService  # noqa: E402
+from application.lead_service import LeadService  # noqa: E402
+from application.note_service import NoteService  # noqa: E402
+from application.notification_service import EmailNotificationService  # noqa: E402
+from application.report_service import ReportService  # noqa: E402
+from infrastructure.database import SessionLocal  # noqa: E402
+from infrastructure.mail.sender import EmailSender  # noqa: E402
+from infrastructure.web import app as web_app  # noqa: E402
+from infrastructure.web import ingestion  # noqa: E402
+
+
+def legacy_get_lead_service(db):
+    from infrastructure.persistence.repositories.sqlalchemy_lead_repository import SqlAlchemyLeadRepository
+    from infrastructure.persistence.repositories.sqlalchemy_contact_repository import SqlAlchemyContactRepository
+    from infrastructure.persistence.repositories.sqlalchemy_company_repository import SqlAlchemyCompanyRepository
+    from infrastructure.persistence.repositories.sqlalchemy_position_repository import SqlAlchemyPositionRepository
+    from infrastructure.persistence.repositories.sqlalchemy_concern_repository import SqlAlchemyConcernRepository
+    from infrastructure.persistence.repositories.sqlalchemy_note_repository import SqlAlchemyNoteRepository
+    from domain.services.lead_scoring_service import LeadScoringService
+    return LeadService(
+        session=db,
+        lead_repository=SqlAlchemyLeadRepository(db),
+        contact_repository=SqlAlchemyContactRepository(db),
+        company_repository=SqlAlchemyCompanyRepository(db),
+        position_repository=SqlAlchemyPositionRepository(db),
+        concern_repository=SqlAlchemyConcernRepository(db),
+        note_repository=SqlAlchemyNoteRepository(db),
+        scoring_service=LeadScoringService(),
+    )
+
+
+def legacy_get_note_service(db):
+    from infrastructure.persistence.repositories.sqlalchemy_note_repository import SqlAlchemyNoteRepository
+    return NoteService(SqlAlchemyNoteRepository(db), EmailNotificationService(EmailSender()))
+
+
+def legacy_get_fingerprint_service(db):
+    from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
+    from domain.services.minhash_service import MinHashService
+    return FingerprintService(SqlAlchemyFingerprintRepository(db), MinHashService())
+
+
+def legacy_get_report_service(db):
+    from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
+    from infrastructure.persistence.repositories.sqlalchemy_report_repository import SqlAlchemyReportRepository
+    return ReportService(SqlAlchemyReportRepository(db), SqlAlchemyFingerprintRepository(db))
+
+
+CASES = {
+    "lead": (legacy_get_lead_service, web_app.get_lead_service),
+    "note": (legacy_get_note_service, lambda db: web_app.get_note_service(db, web_app.get_email_notification_service())),
+    "fingerprint": (legacy_get_fingerprint_service, ingestion.get_fingerprint_service),
+    "report": (legacy_get_report_service, ingestion.get_report_service),
+}
+
+
+def per_call_us(factory, db, number: int) -> float:
+    return min(timeit.repeat(lambda: factory(db), number=number, repeat=5)) / number * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        for name, (legacy, current) in CASES.items():
+            before = per_call_us(legacy, db, args.number)
+            after = per_call_us(current, db, args.number)
+            print(json.dumps({"service": name, "before_us": round(before, 2), "after_us": round(after, 2)}))
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Startup profile built on `python -X importtime`.
+
+Imports a module in a fresh interpreter, parses the importtime trace and
+prints the total import time, the heaviest top-level packages (summed self
+time) and the heaviest individual imports (cumulative time).
+
+Usage: python -m benchmarks.importtime [--module infrastructure.web.app] [--top 15] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import List
+
+from benchmarks.common import ROOT_DIR
+
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_budget.json")
+
+
+@dataclass
+class ImportRecord:
+    name: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def load_budget() -> dict:
+    with open(BUDGET_FILE, encoding="utf-8") as budget:
+        return json.load(budget)
+
+
+def parse_importtime(trace: str) -> List[ImportRecord]:
+    """Parse `-X importtime` stderr lines: `import time: self [us] | cumulative | imported package`."""
+    records = []
+    for line in trace.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        stripped = name.lstrip(" ")
+        records.append(ImportRecord(
+            name=stripped.strip(),
+            depth=(len(name) - len(stripped) - 1) // 2,
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+        ))
+    return records
+
+
+def profile_import(module: str, env: dict = None) -> List[ImportRecord]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, env=dict(os.environ, **(env or {})), capture_output=True, text=True, check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def summarize(records: List[ImportRecord], top: int) -> dict:
+    by_package = defaultdict(int)
+    for record in records:
+        by_package[record.name.split(".")[0]] += record.self_us
+    return {
+        "total_ms": round(sum(r.cumulative_us for r in records if r.depth == 0) / 1000, 1),
+        "modules": len(records),
+        "packages": [
+            {"package": name, "self_ms": round(us / 1000, 1)}
+            for name, us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+        "imports": [
+            {"module": r.name, "cumulative_ms": round(r.cumulative_us / 1000, 1)}
+            for r in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]
+        ],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="infrastructure.web.app")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    summary = summarize(profile_import(args.module, {"ENV": os.environ.get("ENV", "benchmark")}), args.top)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    budget = load_budget()["import_ms"]
+    print(f"{args.module}: {summary['total_ms']} ms, {summary['modules']} modules (budget {budget} ms)")
+    print("\nHeaviest packages (self time):")
+    for row in summary["packages"]:
+        print(f"  {row['self_ms']:>8.1f} ms  {row['package']}")
+    print("\nHeaviest imports (cumulative):")
+    for row in summary["imports"]:
+        print(f"  {row['cumulative_ms']:>8.1f} ms  {row['module']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Compare beacon throughput of the full API and the lean ingestion app.
+
+Each app is started as a single uvicorn worker (one core) against a throwaway
+SQLite database, then hammered with concurrent POST /report/ requests for a
+fixed duration. A single ALTCHA solution is solved up front and reused, so the
+server-side verification cost is part of every measured request.
+
+Usage: python -m benchmarks.ingestion_rps [--duration 10] [--concurrency 32]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import uuid
+
+import httpx
+
+from benchmarks.common import altcha_payload, free_port, load, migrate, serve
+
+APPS = {
+    "full": "infrastructure.web.app:app",
+    "ingestion": "infrastructure.web.ingestion_app:app",
+}
+
+
+def run_app(name: str, database_url: str, duration: float, concurrency: int) -> dict:
+    port = free_port()
+    command = [sys.executable, "-m", "uvicorn", APPS[name], "--port", str(port), "--workers", "1"]
+    with serve(command, database_url, port) as base_url:
+        altcha = altcha_payload(base_url)
+        visitor_id = str(uuid.uuid4())
+        httpx.post(f"{base_url}/fingerprint/", json={
+            "visitorId": visitor_id,
+            "components": {"timezone": {"value": "Europe/Paris"}, "platform": {"value": "Linux x86_64"}},
+            "altcha": altcha,
+        })
+
+        def send(client, n, i):
+            return client.post("/report/", json={"visitorId": visitor_id, "page": f"/bench/{n}/{i}", "altcha": altcha})
+
+        result = load(base_url, send, duration, concurrency)
+    result["rps_per_core"] = result.pop("rps")
+    return {"app": name, **result}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per app")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent in-flight requests")
+    parser.add_argument("--apps", nargs="+", choices=sorted(APPS), default=["full", "ingestion"])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        migrate(database_url)
+        for name in args.apps:
+            print(json.dumps(run_app(name, database_url, args.duration, args.concurrency)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
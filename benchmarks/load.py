@@ -0,0 +1,250 @@
+"""Per-endpoint latency and throughput of the API under a scripted mixed load.
+
+The ASGI app runs in this process, driven through httpx's ASGITransport, so
+no server, network or OIDC provider is involved: the provider is replaced by
+a local RSA key whose JWKS the app fetches through its usual cache, and every
+request carries a token signed with it, so authentication is measured too.
+The database is a throwaway SQLite file, migrated and filled by
+benchmarks.seed, unless --database-url points at one already seeded.
+
+Each worker picks its next request from a weighted mix of read endpoints,
+note creation and page reports, with a random generator seeded per worker,
+so two runs send the same sequence. One JSON line per endpoint is printed
+(requests, errors, rps, p50/p95/p99) and a summary line with the commit.
+--output stores the whole result; --compare adds the p95 of a stored result
+and the ratio to it, to spot regressions between commits.
+
+Usage: python -m benchmarks.load [--duration 10] [--concurrency 8] [--leads 500] [--output FILE] [--compare FILE]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from benchmarks.common import HMAC_KEY, ROOT_DIR, migrate
+
+ISSUER = "https://oidc.benchmark.invalid"
+KEY_ID = "benchmark"
+
+
+def stub_oidc(auth) -> str:
+    """Serve a local signing key in place of the OIDC provider; returns a bearer token for it."""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from jose import jwk, jwt
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    jwks = {"keys": [dict(jwk.construct(public_pem, "RS256").to_dict(), kid=KEY_ID, use="sig")]}
+
+    async def get_oidc_config():
+        return {"issuer": ISSUER, "jwks_uri": f"{ISSUER}/jwks"}
+
+    async def get_jwks(oidc_config):
+        return jwks
+
+    auth.get_oidc_config = get_oidc_config
+    auth.get_jwks = get_jwks
+    claims = {"sub": "benchmark", "iss": ISSUER, "iat": int(time.time()), "exp": int(time.time()) + 86400}
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": KEY_ID})
+
+
+def fixtures(engine) -> dict:
+    """IDs the scenario draws from, read back from the seeded database."""
+    from sqlalchemy import select
+
+    from infrastructure.persistence.models import ClassifiedEmailModel, LeadModel, NoteReasonModel
+
+    with engine.connect() as connection:
+        leads = connection.execute(select(LeadModel.id, LeadModel.fingerprint_visitor_id)).all()
+        emails = connection.execute(select(ClassifiedEmailModel.id)).scalars().all()
+        reasons = connection.execute(select(NoteReasonModel.name)).scalars().all()
+    if not leads or not emails:
+        raise RuntimeError("the database holds no leads or classified emails: seed it first")
+    return {
+        "lead_ids": [lead_id for lead_id, _ in leads],
+        "visitor_ids": [visitor_id for _, visitor_id in leads if visitor_id],
+        "email_ids": list(emails),
+        "reasons": list(reasons),
+    }
+
+
+def scenario(data: dict, altcha: str):
+    """(endpoint, weight, request builder) triples; a builder returns (method, url, json body)."""
+    return [
+        ("GET /leads/", 2, lambda rng: ("GET", "/leads/", None)),
+        ("GET /leads/{lead_id}", 20, lambda rng: ("GET", f"/leads/{rng.choice(data['lead_ids'])}", None)),
+        ("GET /leads/{lead_id}/notes", 15,
+         lambda rng: ("GET", f"/leads/{rng.choice(data['lead_ids'])}/notes", None)),
+        ("POST /leads/{lead_id}/notes", 5, lambda rng: ("POST", f"/leads/{rng.choice(data['lead_ids'])}/notes", {
+            "note": "Benchmark note", "reason": rng.choice(data["reasons"]), "send_to_contact": False,
+        })),
+        ("GET /classified-emails/", 5,
+         lambda rng: ("GET", f"/classified-emails/?lead_id={rng.choice(data['lead_ids'])}", None)),
+        ("GET /classified-emails/{email_id}", 10,
+         lambda rng: ("GET", f"/classified-emails/{rng.choice(data['email_ids'])}", None)),
+        ("GET /fingerprints/", 5, lambda rng: ("GET", "/fingerprints/?limit=50", None)),
+        ("GET /visitors/{visitor_id}/linked", 5,
+         lambda rng: ("GET", f"/visitors/{rng.choice(data['visitor_ids'])}/linked", None)),
+        ("GET /note-reasons/", 3, lambda rng: ("GET", "/note-reasons/", None)),
+        ("POST /report/", 25, lambda rng: ("POST", "/report/", {
+            "visitorId": rng.choice(data["visitor_ids"]), "page": f"/bench/{rng.randrange(100)}", "altcha": altcha,
+        })),
+        ("GET /altcha-challenge/", 5, lambda rng: ("GET", "/altcha-challenge/", None)),
+    ]
+
+
+async def solve_altcha(client) -> str:
+    """One solved challenge, reused so that verification cost stays server-side."""
+    from altcha import Payload, solve_challenge
+
+    challenge = (await client.get("/altcha-challenge/")).json()
+    # Solved off the loop: the app runs on it.
+    solution = await asyncio.to_thread(
+        solve_challenge, challenge["challenge"], challenge["salt"], challenge["algorithm"], challenge["maxNumber"]
+    )
+    return Payload(
+        challenge["algorithm"], challenge["challenge"], solution.number, challenge["salt"], challenge["signature"]
+    ).to_base64()
+
+
+def percentile(latencies: list, fraction: float) -> float:
+    """Nearest-rank percentile of sorted latencies, in milliseconds."""
+    return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000, 2)
+
+
+async def run(app, token: str, engine, duration: float, concurrency: int, seed: int) -> dict:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", headers=headers, timeout=30.0
+    ) as client:
+        mix = scenario(fixtures(engine), await solve_altcha(client))
+        names = [name for name, _, _ in mix]
+        weights = [weight for _, weight, _ in mix]
+        builders = {name: build for name, _, build in mix}
+        # Authenticate once so the JWKS fetch is not charged to the first requests.
+        await client.get("/note-reasons/")
+        deadline = time.monotonic() + duration
+
+        async def worker(n: int):
+            rng = random.Random(f"{seed}-{n}")
+            while time.monotonic() < deadline:
+                name = rng.choices(names, weights)[0]
+                method, url, body = builders[name](rng)
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, url, json=body)
+                    failed = response.status_code >= 400 or "warning" in response.text[:20]
+                except Exception:
+                    failed = True
+                latencies[name].append(time.perf_counter() - started)
+                errors[name] += failed
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    endpoints = {}
+    for name in names:
+        samples = sorted(latencies[name])
+        if not samples:
+            continue
+        endpoints[name] = {
+            "requests": len(samples),
+            "errors": errors[name],
+            "rps": round(len(samples) / elapsed, 1),
+            "p50_ms": percentile(samples, 0.50),
+            "p95_ms": percentile(samples, 0.95),
+            "p99_ms": percentile(samples, 0.99),
+        }
+    total = sum(endpoint["requests"] for endpoint in endpoints.values())
+    return {"endpoints": endpoints, "requests": total, "rps": round(total / elapsed, 1), "seconds": round(elapsed, 1)}
+
+
+def commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(result: dict, baseline: dict) -> None:
+    """Add the baseline p95 and the ratio to it to every endpoint the baseline also measured."""
+    for name, endpoint in result["endpoints"].items():
+        before = baseline.get("endpoints", {}).get(name)
+        if before and before.get("p95_ms"):
+            endpoint["baseline_p95_ms"] = before["p95_ms"]
+            endpoint["p95_ratio"] = round(endpoint["p95_ms"] / before["p95_ms"], 2)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent in-flight requests")
+    parser.add_argument("--leads", type=int, default=500, help="leads to seed into the throwaway database")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the data set and of the request sequence")
+    parser.add_argument("--database-url", help="an already migrated and seeded database to use instead")
+    parser.add_argument("--output", help="write the full result to this JSON file")
+    parser.add_argument("--compare", help="a result written by --output to compare p95 latencies with")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url
+        if database_url is None:
+            database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            migrate(database_url)
+        # The app reads its settings at import time.
+        os.environ.update(DATABASE_URL=database_url, ENV="benchmark", ALTCHA_HMAC_KEY=HMAC_KEY)
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+        os.environ.setdefault("PROFILE_DIR", os.path.join(tmp, "profiles"))
+
+        from infrastructure.database import engine
+        from infrastructure.web import auth
+        from infrastructure.web.app import app
+
+        if args.database_url is None:
+            from benchmarks.seed import seed
+            seed(engine, leads=args.leads, seed=args.seed)
+
+        token = stub_oidc(auth)
+        result = asyncio.run(run(app, token, engine, args.duration, args.concurrency, args.seed))
+
+    result = {
+        "commit": commit(),
+        "config": {"duration": args.duration, "concurrency": args.concurrency, "leads": args.leads, "seed": args.seed},
+        **result,
+    }
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(result, json.load(baseline))
+    for name, endpoint in result["endpoints"].items():
+        print(json.dumps({"endpoint": name, **endpoint}))
+    print(json.dumps({"commit": result["commit"], "requests": result["requests"], "rps": result["rps"]}))
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(result, output, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Request latency with synchronous vs queued logging, at INFO and DEBUG.
+
+Runs the API under gunicorn (one worker) once per combination of LOG_QUEUE
+(0: records formatted and written by the request thread, 1: handed to the
+listener thread) and LOG_LEVEL, with the worker's stdout going to a file as
+it would to a container log. Every request logs its Server-Timing line at
+INFO, and its statement count at DEBUG. Workloads: GET /altcha-challenge/
+(async, logs from the event loop) and POST /report/ (sync, one insert).
+POST /lead/ is left out: without an SMTP server, its failing notification
+logs two tracebacks per request.
+
+Usage: python -m benchmarks.logging_latency [--duration 10] [--concurrency 16]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import uuid
+
+import httpx
+
+from benchmarks.common import altcha_payload, free_port, load, migrate, serve
+
+CONFIGURATIONS = [
+    ("sync", "INFO"), ("queue", "INFO"),
+    ("sync", "DEBUG"), ("queue", "DEBUG"),
+]
+
+
+def run_configuration(pipeline: str, level: str, database_url: str, log_path: str, duration: float,
+                      concurrency: int) -> list:
+    port = free_port()
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "infrastructure.web.asgi:app"]
+    env = {
+        "GUNICORN_BIND": f"127.0.0.1:{port}", "WEB_CONCURRENCY": "1", "GUNICORN_LOG_LEVEL": "warning",
+        "LOG_QUEUE": "1" if pipeline == "queue" else "0", "LOG_LEVEL": level,
+    }
+    results = []
+    with open(log_path, "w") as log, serve(command, database_url, port, env, stdout=log) as base_url:
+        altcha = altcha_payload(base_url)
+        visitor_id = str(uuid.uuid4())
+        httpx.post(f"{base_url}/fingerprint/", json={"visitorId": visitor_id, "components": {}, "altcha": altcha})
+
+        workloads = {
+            "altcha_challenge": lambda client, n, i: client.get("/altcha-challenge/"),
+            "report": lambda client, n, i: client.post(
+                "/report/", json={"visitorId": visitor_id, "page": f"/bench/{n}/{i}", "altcha": altcha}
+            ),
+        }
+        for workload, send in workloads.items():
+            log.flush()
+            before = os.path.getsize(log_path)
+            result = load(base_url, send, duration, concurrency)
+            results.append({
+                "logging": pipeline, "level": level, "workload": workload, **result,
+                "log_bytes_per_request": round((os.path.getsize(log_path) - before) / max(result["requests"], 1)),
+            })
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load per configuration")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent in-flight requests")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        migrate(database_url)
+        for pipeline, level in CONFIGURATIONS:
+            log_path = os.path.join(tmp, f"{pipeline}-{level}.log")
+            for result in run_configuration(pipeline, level, database_url, log_path, args.duration, args.concurrency):
+                print(json.dumps(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
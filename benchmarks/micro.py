@@ -0,0 +1,174 @@
+"""Micro-benchmarks of the per-row work behind the lead and email endpoints.
+
+Each case runs a function over a batch of in-memory rows the size of a real
+response or workload (a page of leads, an inbox listing): the mappers between
+ORM models and domain entities, the maturity score of a submission, the
+LeadResponse validation FastAPI performs on ORM leads and the potential
+score. No database is involved; the ORM objects are transient and carry
+their relationships. Time per op is the best of a few repeats. Allocations
+per op are counted by tracemalloc over one batch: the memory blocks and
+bytes the results hold, and the peak, which includes the temporaries.
+
+Baselines are stored in benchmarks/micro_baseline.json, and
+tests/test_micro_benchmarks.py (`pytest -m benchmark`) fails when a case
+becomes markedly slower or allocates more than its baseline.
+
+Usage: python -m benchmarks.micro [--cases lead_to_domain ...] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from domain.contact import LeadPayload
+from domain.services.lead_scoring_service import LeadScoringService
+from infrastructure.persistence.mappers.email_mapper import ClassifiedEmailMapper
+from infrastructure.persistence.mappers.lead_mapper import LeadMapper
+from infrastructure.persistence.models import (
+    ClassifiedEmailModel,
+    CompanyModel,
+    ConcernModel,
+    ContactModel,
+    LeadModel,
+    LeadStatusModel,
+    LeadUrgencyModel,
+    PositionModel,
+    RecommendedPackModel,
+)
+from infrastructure.web.dtos import LeadResponse
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "micro_baseline.json")
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def lead_models(count: int) -> list:
+    """Transient leads with every relationship LeadResponse reads."""
+    statuses = [LeadStatusModel(id=i, name=name) for i, name in enumerate(["nouveau", "relancé", "gagné"], 1)]
+    urgencies = [LeadUrgencyModel(id=i, name=name) for i, name in enumerate(["immédiat", "ce mois", "moyen terme"], 1)]
+    packs = [RecommendedPackModel(id=i, name=name) for i, name in enumerate(["conformité", "confiance"], 1)]
+    positions = [PositionModel(id=i, title=title) for i, title in enumerate(["CTO", "DSI", "RSSI"], 1)]
+    concerns = [ConcernModel(id=i, label=label) for i, label in enumerate(["RGPD", "NIS2", "Sauvegardes"], 1)]
+    leads = []
+    for i in range(count):
+        created = START + timedelta(minutes=i)
+        leads.append(LeadModel(
+            id=i + 1, submission_date=created, estimated_users=10 * i, problem_summary=f"Lead {i} summary",
+            maturity_score=i % 5, altcha_solution="altcha", fingerprint_visitor_id=f"visitor-{i}",
+            created_at=created, updated_at=created,
+            contact=ContactModel(
+                id=i + 1, name=f"Contact {i}", email=f"contact{i}@example.com", phone="+33 6 00 00 00 00",
+                job_title=["CTO", "Office manager", "Consultant"][i % 3], conscent=True,
+                created_at=created, updated_at=created,
+            ),
+            company=CompanyModel(id=i + 1, name=f"Company {i}", size=[20, 300, 5000][i % 3]),
+            status=statuses[i % len(statuses)], urgency=urgencies[i % len(urgencies)],
+            recommended_pack=packs[i % len(packs)],
+            positions=positions[:1 + i % len(positions)], concerns=concerns[:1 + i % len(concerns)],
+        ))
+    return leads
+
+
+def email_models(count: int) -> list:
+    return [
+        ClassifiedEmailModel(
+            id=i + 1, email_account_id=1, imap_id=str(i), sender=f"contact{i}@example.com",
+            recipients="sales@example.com", subject=f"Re: lead {i}", email_date=START + timedelta(hours=i),
+            classification="demande de devis", emergency_level=1 + i % 5, abstract=f"Message {i}",
+            lead_id=i + 1, created_at=START, updated_at=START,
+        )
+        for i in range(count)
+    ]
+
+
+def lead_payloads(count: int) -> list:
+    return [
+        LeadPayload(
+            name=f"Contact {i}", email=f"contact{i}@example.com", job_title=["CTO", "Consultant"][i % 2],
+            company_name=f"Company {i}", company_size=[20, 300][i % 2], positions=["CTO"],
+            concerns=["RGPD", "NIS2", "Sauvegardes"][:1 + i % 3], estimated_users=10 * i,
+            urgency="ce mois", conscent=True,
+        )
+        for i in range(count)
+    ]
+
+
+def cases() -> dict:
+    """name -> (batch, function run over the batch)."""
+    leads = lead_models(100)
+    lead_entities = [LeadMapper.to_domain(lead) for lead in leads]
+    emails = email_models(200)
+    email_entities = [ClassifiedEmailMapper.to_domain(email) for email in emails]
+    payloads = lead_payloads(1000)
+    scoring = LeadScoringService()
+    scored_leads = lead_models(1000)
+    return {
+        "lead_to_domain": (leads, lambda batch: [LeadMapper.to_domain(lead) for lead in batch]),
+        "lead_to_model": (lead_entities, lambda batch: [LeadMapper.to_model(lead) for lead in batch]),
+        "email_to_domain": (emails, lambda batch: [ClassifiedEmailMapper.to_domain(email) for email in batch]),
+        "email_to_model": (email_entities, lambda batch: [ClassifiedEmailMapper.to_model(email) for email in batch]),
+        "maturity_score": (payloads, lambda batch: [scoring.calculate_maturity_score(payload) for payload in batch]),
+        "lead_response": (leads, lambda batch: [LeadResponse.model_validate(lead) for lead in batch]),
+        "potential_score": (scored_leads, lambda batch: [lead.potential_score for lead in batch]),
+    }
+
+
+def measure(batch: list, run, repeat: int = 5) -> dict:
+    """Time and allocations per op of run(batch)."""
+    timer = timeit.Timer(lambda: run(batch))
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = run(batch)
+        peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    allocated = [stat for stat in after.compare_to(before, "lineno") if stat.size_diff > 0]
+    del result
+    return {
+        "batch": len(batch),
+        "us_per_op": round(seconds / len(batch) * 1e6, 3),
+        "allocs_per_op": round(sum(stat.count_diff for stat in allocated) / len(batch), 1),
+        "bytes_per_op": round(sum(stat.size_diff for stat in allocated) / len(batch)),
+        "peak_bytes_per_op": round(peak_bytes / len(batch)),
+    }
+
+
+def run_cases(names=None) -> dict:
+    return {name: measure(batch, run) for name, (batch, run) in cases().items() if not names or name in names}
+
+
+def load_baseline() -> dict:
+    with open(BASELINE_FILE, encoding="utf-8") as baseline:
+        return json.load(baseline)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cases", nargs="+", help="run only these cases")
+    parser.add_argument("--update-baseline", action="store_true", help=f"store the results in {BASELINE_FILE}")
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.cases)
+    for name, result in results.items():
+        print(json.dumps({"case": name, **result}))
+    if args.update_baseline:
+        baseline = load_baseline() if os.path.exists(BASELINE_FILE) else {}
+        baseline.update(results)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as output:
+            json.dump(baseline, output, indent=2, sort_keys=True)
+            output.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""Behaviour of the connection pool as concurrency crosses its capacity.
+
+Threads stand in for threadpool-run request handlers: each checks out a
+connection, runs a query and holds the connection for --hold-ms (the time a
+handler spends between its first query and commit). Below pool_size +
+max_overflow checkouts never wait; above it they queue, latency climbs with
+the queue and, once the wait exceeds pool_timeout, checkouts fail.
+
+Usage: python -m benchmarks.pool_saturation [--pool-size 5] [--max-overflow 5]
+       [--pool-timeout 1] [--hold-ms 20] [--duration 3] [--concurrency 5,10,20,40]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from infrastructure.pool import InstrumentedQueuePool, pool_status
+
+
+def run(engine, concurrency: int, duration: float, hold: float) -> dict:
+    latencies, errors, peak = [], [0], [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                    with lock:
+                        peak[0] = max(peak[0], pool_status(engine)["in_use"])
+                    time.sleep(hold)
+            except PoolTimeoutError:
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    before = pool_status(engine)
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    after = pool_status(engine)
+
+    checkouts = after["checkouts"] - before["checkouts"]
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "timeouts": errors[0],
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 1) if latencies else None,
+        "mean_wait_ms": round((after["wait_seconds_total"] - before["wait_seconds_total"]) / max(checkouts, 1) * 1000, 2),
+        "peak_in_use": peak[0],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=5)
+    parser.add_argument("--pool-timeout", type=float, default=1.0)
+    parser.add_argument("--hold-ms", type=float, default=20.0)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--concurrency", default="5,10,20,40")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp, 'pool.db')}",
+            connect_args={"check_same_thread": False},
+            poolclass=InstrumentedQueuePool,
+            pool_size=args.pool_size,
+            max_overflow=args.max_overflow,
+            pool_timeout=args.pool_timeout,
+        )
+        try:
+            for concurrency in (int(c) for c in args.concurrency.split(",")):
+                print(json.dumps(run(engine, concurrency, args.duration, args.hold_ms / 1000)))
+        finally:
+            engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Micro-benchmark of per-call overhead of the repository lookups.
+
+Each lookup runs against an in-memory SQLite database holding a handful of
+rows, so the time is almost entirely Python: building the statement,
+computing its cache key, binding, executing and loading the row. The
+previous implementation (a session.query() chain built on every call,
+reproduced below as the reference) is timed against the repository method,
+which executes a statement prebuilt at import time.
+
+Usage: python -m benchmarks.repository_lookups [--number 5000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+os.environ.setdefault("ENV", "benchmark")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session, joinedload  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from infrastructure.database import Base  # noqa: E402
+from infrastructure.persistence.models import (  # noqa: E402
+    ClassifiedEmailModel,
+    ContactModel,
+    EmailAccountModel,
+    FingerprintModel,
+    LeadModel,
+    NoteReasonModel,
+)
+from infrastructure.persistence.repositories import (  # noqa: E402
+    SqlAlchemyClassifiedEmailRepository,
+    SqlAlchemyContactRepository,
+    SqlAlchemyFingerprintRepository,
+    SqlAlchemyLeadRepository,
+    SqlAlchemyNoteRepository,
+)
+
+
+def seed(session: Session):
+    session.add_all([
+        ContactModel(name="Ada", email="ada@example.com"),
+        NoteReasonModel(name="Call"),
+        FingerprintModel(visitorId="visitor-1", components={}),
+        EmailAccountModel(name="inbox", imap_host="imap.example.com", imap_username="u", imap_password="p"),
+    ])
+    session.flush()
+    session.add(ClassifiedEmailModel(email_account_id=1, imap_id="42", sender="a@example.com", recipients="b@example.com"))
+    session.commit()
+
+
+def cases(session: Session) -> dict:
+    """name: (legacy query chain, repository method); the lead lookup misses, the others hit."""
+    query = session.query
+    contacts = SqlAlchemyContactRepository(session)
+    notes = SqlAlchemyNoteRepository(session)
+    emails = SqlAlchemyClassifiedEmailRepository(session)
+    fingerprints = SqlAlchemyFingerprintRepository(session)
+    leads = SqlAlchemyLeadRepository(session)
+    return {
+        "contact.find_by_email": (
+            lambda: query(ContactModel).filter(ContactModel.email == "ada@example.com").one_or_none(),
+            lambda: contacts.find_by_email("ada@example.com"),
+        ),
+        "note.find_reason_by_name": (
+            lambda: query(NoteReasonModel).filter(NoteReasonModel.name == "Call").one_or_none(),
+            lambda: notes.find_reason_by_name("Call"),
+        ),
+        "classified_email.find_by_account_and_imap_id": (
+            lambda: query(ClassifiedEmailModel).filter(
+                ClassifiedEmailModel.email_account_id == 1, ClassifiedEmailModel.imap_id == "42"
+            ).one_or_none(),
+            lambda: emails.find_by_account_and_imap_id(1, "42"),
+        ),
+        "fingerprint.find_by_visitor_id": (
+            lambda: query(FingerprintModel).filter(FingerprintModel.visitorId == "visitor-1").one_or_none(),
+            lambda: fingerprints.find_by_visitor_id("visitor-1"),
+        ),
+        "fingerprint.exists": (
+            lambda: query(FingerprintModel).filter(FingerprintModel.visitorId == "visitor-1").count() > 0,
+            lambda: fingerprints.exists("visitor-1"),
+        ),
+        "lead.find_by_id": (
+            lambda: query(LeadModel).options(
+                joinedload(LeadModel.contact),
+                joinedload(LeadModel.company),
+                joinedload(LeadModel.status),
+                joinedload(LeadModel.urgency),
+                joinedload(LeadModel.recommended_pack),
+                joinedload(LeadModel.positions),
+                joinedload(LeadModel.concerns)
+            ).filter(LeadModel.id == 1).one_or_none(),
+            lambda: leads.find_by_id(1),
+        ),
+    }
+
+
+def per_call_us(call, number: int) -> float:
+    return min(timeit.repeat(call, number=number, repeat=5)) / number * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5000, help="calls per timing run")
+    args = parser.parse_args(argv)
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed(session)
+        for name, (legacy, current) in cases(session).items():
+            before = per_call_us(legacy, args.number)
+            after = per_call_us(current, args.number)
+            print(json.dumps({"method": name, "before_us": round(before, 2), "after_us": round(after, 2)}))
+    engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
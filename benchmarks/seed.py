@@ -0,0 +1,218 @@
+"""Deterministic synthetic CRM data for the benchmarks.
+
+Seeds a migrated database (SQLite or PostgreSQL) with `leads` leads and, for
+each, a contact and a company, a few positions and concerns, notes,
+classified emails, and the visitor behind the lead: a fingerprint and its
+page reports. Twice as many anonymous visitors, with their reports, come on
+top. The same seed and counts always produce the same rows.
+
+Rows are written with multi-row INSERTs (executemany), in batches, inside one
+transaction; primary keys are assigned here so no row needs a RETURNING.
+Seed an empty database: names, emails and visitor IDs are unique per seed.
+
+Usage: python -m benchmarks.seed DATABASE_URL [--leads 1000] [--seed 0] [--migrate]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("ENV", "benchmark")
+
+from sqlalchemy import create_engine, func, insert, select  # noqa: E402
+
+from domain.services.minhash_service import MinHashService  # noqa: E402
+from infrastructure.persistence.models import (  # noqa: E402
+    ClassifiedEmailModel,
+    CompanyModel,
+    ConcernModel,
+    ContactModel,
+    EmailAccountModel,
+    FingerprintModel,
+    LeadConcernModel,
+    LeadModel,
+    LeadPositionModel,
+    LeadStatusModel,
+    LeadUrgencyModel,
+    NoteModel,
+    NoteReasonModel,
+    PositionModel,
+    RecommendedPackModel,
+    ReportModel,
+)
+
+BATCH = 1000
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+TIMEZONES = ["Europe/Paris", "Europe/Brussels", "America/Montreal", "Africa/Casablanca", "Europe/Geneva"]
+PLATFORMS = ["Win32", "MacIntel", "Linux x86_64", "iPhone"]
+RESOLUTIONS = ["1920x1080", "2560x1440", "1440x900", "390x844"]
+PAGES = ["/", "/offres", "/offres/conformite", "/offres/confiance", "/blog", "/contact", "/a-propos"]
+POSITIONS = ["CTO", "DSI", "RSSI", "DPO", "CEO", "DAF", "Responsable IT"]
+CONCERNS = ["RGPD", "NIS2", "ISO 27001", "Sauvegardes", "Phishing", "Cloud", "Accès distants"]
+CLASSIFICATIONS = ["demande de devis", "support", "relance", "facturation", None]
+
+
+def _insert(connection, model, rows):
+    for start in range(0, len(rows), BATCH):
+        connection.execute(insert(model), rows[start:start + BATCH])
+
+
+def _next_id(connection, model) -> int:
+    return (connection.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _ids_by_name(connection, model, column) -> dict:
+    return {name: id_ for id_, name in connection.execute(select(model.id, column))}
+
+
+def _ensure(connection, model, column, names) -> list:
+    """IDs of the rows named `names`, inserting the missing ones."""
+    existing = _ids_by_name(connection, model, column)
+    missing = [name for name in names if name not in existing]
+    if missing:
+        next_id = _next_id(connection, model)
+        _insert(connection, model, [{"id": next_id + i, column.key: name} for i, name in enumerate(missing)])
+        existing = _ids_by_name(connection, model, column)
+    return [existing[name] for name in names]
+
+
+def _fingerprint(rng: random.Random, minhash: MinHashService, visitor_id: str, created_at: datetime) -> dict:
+    components = {
+        "timezone": {"value": rng.choice(TIMEZONES)},
+        "platform": {"value": rng.choice(PLATFORMS)},
+        "screenResolution": {"value": rng.choice(RESOLUTIONS)},
+        "languages": {"value": [["fr-FR", "fr"]]},
+        "hardwareConcurrency": {"value": rng.choice([4, 8, 12, 16])},
+    }
+    return {
+        "visitorId": visitor_id,
+        "components": components,
+        "created_at": created_at,
+        "timezone": components["timezone"]["value"],
+        "platform": components["platform"]["value"],
+        "screen_resolution": components["screenResolution"]["value"],
+        "minhash_signature": minhash.signature(components),
+    }
+
+
+def seed(engine, leads: int = 1000, seed: int = 0, notes_per_lead: int = 3, emails_per_lead: int = 2,
+         reports_per_visitor: int = 5) -> dict:
+    """Insert the synthetic data set; returns the number of rows per table."""
+    rng = random.Random(seed)
+    minhash = MinHashService()
+    prefix = f"s{seed}"
+    rows = {name: [] for name in (
+        "companies", "contacts", "leads", "lead_positions", "lead_concerns", "notes",
+        "email_accounts", "classified_emails", "fingerprints", "reports",
+    )}
+
+    with engine.begin() as connection:
+        statuses = list(_ids_by_name(connection, LeadStatusModel, LeadStatusModel.name).values())
+        urgencies = list(_ids_by_name(connection, LeadUrgencyModel, LeadUrgencyModel.name).values())
+        packs = list(_ids_by_name(connection, RecommendedPackModel, RecommendedPackModel.name).values())
+        reasons = list(_ids_by_name(connection, NoteReasonModel, NoteReasonModel.name).values())
+        if not (statuses and urgencies and reasons):
+            raise RuntimeError("lookup tables are empty: migrate the database first (--migrate)")
+        positions = _ensure(connection, PositionModel, PositionModel.title, POSITIONS)
+        concerns = _ensure(connection, ConcernModel, ConcernModel.label, CONCERNS)
+
+        company_id = _next_id(connection, CompanyModel)
+        contact_id = _next_id(connection, ContactModel)
+        lead_id = _next_id(connection, LeadModel)
+        note_id = _next_id(connection, NoteModel)
+        account_id = _next_id(connection, EmailAccountModel)
+        email_id = _next_id(connection, ClassifiedEmailModel)
+        report_id = _next_id(connection, ReportModel)
+
+        rows["email_accounts"].append({
+            "id": account_id, "name": f"{prefix} inbox", "imap_host": "imap.example.com", "imap_port": 993,
+            "imap_username": f"{prefix}@example.com", "imap_password": "secret", "imap_use_ssl": 1,
+        })
+
+        def visit(visitor_id: str, first_seen: datetime):
+            rows["fingerprints"].append(_fingerprint(rng, minhash, visitor_id, first_seen))
+            for r in range(reports_per_visitor):
+                rows["reports"].append({
+                    "id": report_id + len(rows["reports"]), "visitorId": visitor_id,
+                    "page": rng.choice(PAGES), "created_at": first_seen + timedelta(minutes=3 * r),
+                })
+
+        for i in range(leads):
+            submitted = START + timedelta(minutes=37 * i)
+            visitor_id = f"{prefix}-visitor-{i}"
+            visit(visitor_id, submitted - timedelta(minutes=20))
+            rows["companies"].append({"id": company_id + i, "name": f"{prefix} company {i}", "size": rng.randint(1, 5000)})
+            rows["contacts"].append({
+                "id": contact_id + i, "name": f"Contact {i}", "email": f"{prefix}.contact{i}@example.com",
+                "phone": f"+33 6 {rng.randint(10000000, 99999999)}", "job_title": rng.choice(POSITIONS),
+                "conscent": rng.random() < 0.8,
+            })
+            rows["leads"].append({
+                "id": lead_id + i, "submission_date": submitted, "estimated_users": rng.randint(1, 2000),
+                "problem_summary": f"Synthetic lead {i}: " + " ".join(rng.sample(CONCERNS, 3)),
+                "contact_id": contact_id + i, "company_id": company_id + i,
+                "recommended_pack_id": rng.choice(packs) if packs else None,
+                "maturity_score": rng.randint(0, 100), "urgency_id": rng.choice(urgencies),
+                "status_id": rng.choice(statuses), "fingerprint_visitor_id": visitor_id,
+                "altcha_solution": f"{prefix}-altcha-{i}",
+            })
+            for position in rng.sample(positions, rng.randint(1, 3)):
+                rows["lead_positions"].append({"lead_id": lead_id + i, "position_id": position})
+            for concern in rng.sample(concerns, rng.randint(1, 3)):
+                rows["lead_concerns"].append({"lead_id": lead_id + i, "concern_id": concern})
+            for n in range(notes_per_lead):
+                rows["notes"].append({
+                    "id": note_id + len(rows["notes"]), "note": f"Note {n} on lead {i}",
+                    "created_at": submitted + timedelta(days=n + 1), "author_name": "seed",
+                    "lead_id": lead_id + i, "reason_id": rng.choice(reasons),
+                })
+            for e in range(emails_per_lead):
+                rows["classified_emails"].append({
+                    "id": email_id + len(rows["classified_emails"]), "email_account_id": account_id,
+                    "imap_id": f"{prefix}-{i}-{e}", "sender": f"{prefix}.contact{i}@example.com",
+                    "recipients": "sales@example.com", "subject": f"Re: lead {i}",
+                    "email_date": submitted + timedelta(hours=e + 1),
+                    "classification": rng.choice(CLASSIFICATIONS), "emergency_level": rng.randint(1, 5),
+                    "abstract": f"Message {e} about lead {i}", "lead_id": lead_id + i,
+                })
+
+        for v in range(2 * leads):
+            visit(f"{prefix}-anonymous-{v}", START + timedelta(minutes=17 * v))
+
+        # Parents before children.
+        for name, model in (
+            ("companies", CompanyModel), ("contacts", ContactModel), ("fingerprints", FingerprintModel),
+            ("leads", LeadModel), ("lead_positions", LeadPositionModel), ("lead_concerns", LeadConcernModel),
+            ("notes", NoteModel), ("email_accounts", EmailAccountModel),
+            ("classified_emails", ClassifiedEmailModel), ("reports", ReportModel),
+        ):
+            _insert(connection, model, rows[name])
+
+    return {name: len(table_rows) for name, table_rows in rows.items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("database_url")
+    parser.add_argument("--leads", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--migrate", action="store_true", help="bring the database to the Alembic head first")
+    args = parser.parse_args(argv)
+
+    if args.migrate:
+        from benchmarks.common import migrate
+        migrate(args.database_url)
+    engine = create_engine(args.database_url)
+    try:
+        print(json.dumps(seed(engine, leads=args.leads, seed=args.seed)))
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
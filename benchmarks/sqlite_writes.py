@@ -0,0 +1,143 @@
+"""Concurrent write throughput on SQLite, as the ingestion workers produce it.
+
+`--processes` processes (the gunicorn workers), each running `--threads`
+threads (the threadpool), record page reports with ReportService: a
+fingerprint lookup followed by an insert and a commit. Three profiles run
+against a fresh database:
+
+- default: the plain engine (rollback journal, deferred transactions)
+- tuned: the SQLite profile (WAL, synchronous=NORMAL, busy_timeout, ...)
+- queued: the SQLite profile plus one WriteQueue per process
+
+Usage: python -m benchmarks.sqlite_writes [--processes 4] [--threads 8] [--duration 5]
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from application.report_service import ReportService
+from infrastructure.database import Base
+from infrastructure.persistence.models import FingerprintModel
+from infrastructure.persistence.repositories import SqlAlchemyFingerprintRepository, SqlAlchemyReportRepository
+from infrastructure.sqlite import WriteQueue, configure_sqlite
+
+PROFILES = ("default", "tuned", "queued")
+VISITORS = 50
+
+
+def make_engine(url: str, profile: str):
+    engine = create_engine(url, connect_args={"check_same_thread": False}, pool_size=32, max_overflow=0)
+    return engine if profile == "default" else configure_sqlite(engine)
+
+
+def record_report(session: Session, n: int):
+    service = ReportService(SqlAlchemyReportRepository(session), SqlAlchemyFingerprintRepository(session))
+    return service.create_report(visitor_id=f"visitor-{n % VISITORS}", page=f"/page/{n}")
+
+
+def worker_process(url: str, profile: str, threads: int, deadline: float, results):
+    engine = make_engine(url, profile)
+    write_queue = WriteQueue(engine) if profile == "queued" else None
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+
+    def writer(offset: int):
+        n = offset
+        while time.time() < deadline:
+            n += threads
+            started = time.perf_counter()
+            try:
+                if write_queue is not None:
+                    write_queue.submit(lambda session: record_report(session, n))
+                else:
+                    with Session(engine) as session:
+                        if profile == "tuned":
+                            # What run_write() does for requests when the queue is off.
+                            session.connection(execution_options={"sqlite_begin": "IMMEDIATE"})
+                        record_report(session, n)
+            except OperationalError:
+                # "database is locked": busy_timeout exceeded or a deferred transaction could not upgrade
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    pool = [threading.Thread(target=writer, args=(offset,)) for offset in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    if write_queue is not None:
+        write_queue.close()
+    engine.dispose()
+    results.put((latencies, errors[0]))
+
+
+def run(profile: str, processes: int, threads: int, duration: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'writes.db')}"
+        setup = make_engine(url, profile)
+        Base.metadata.create_all(setup)
+        with Session(setup) as session:
+            session.add_all(FingerprintModel(visitorId=f"visitor-{n}", components={}) for n in range(VISITORS))
+            session.commit()
+        setup.dispose()
+
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        deadline = time.time() + duration
+        workers = [
+            context.Process(target=worker_process, args=(url, profile, threads, deadline, results))
+            for _ in range(processes)
+        ]
+        for process in workers:
+            process.start()
+        latencies, errors = [], 0
+        for _ in workers:
+            process_latencies, process_errors = results.get()
+            latencies += process_latencies
+            errors += process_errors
+        for process in workers:
+            process.join()
+
+    latencies.sort()
+    return {
+        "profile": profile,
+        "writes": len(latencies),
+        "locked_errors": errors,
+        "writes_per_s": round(len(latencies) / duration, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2) if latencies else None,
+        "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2) if latencies else None,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--profile", choices=PROFILES, action="append", help="default: all profiles")
+    args = parser.parse_args(argv)
+    # ReportService logs every failed write with its traceback.
+    logging.disable(logging.CRITICAL)
+
+    for profile in args.profile or PROFILES:
+        print(json.dumps(run(profile, args.processes, args.threads, args.duration)), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
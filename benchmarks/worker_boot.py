@@ -0,0 +1,73 @@
+"""Measure worker boot time with the unconditional Alembic upgrade vs the migration gate.
+
+Starts `--workers` fresh interpreters at once (like gunicorn forking its
+workers) against a throwaway SQLite database already at head. Each imports the
+API and then either runs `alembic upgrade head` through env.py, as every worker
+did before, or the `migrate_if_needed` gate the lifespan now uses.
+
+Usage: python -m benchmarks.worker_boot [--workers 4] [--rounds 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import ROOT_DIR, migrate
+
+BOOT_SCRIPT = """
+import json, time
+started = time.perf_counter()
+import infrastructure.web.app
+imported = time.perf_counter()
+if {mode!r} == "upgrade":
+    from run_migrations import run_migrations
+    run_migrations()
+else:
+    from run_migrations import migrate_if_needed
+    migrate_if_needed()
+done = time.perf_counter()
+print(json.dumps({{"import_s": imported - started, "migrate_s": done - imported, "total_s": done - started}}))
+"""
+
+
+def boot_workers(mode: str, database_url: str, workers: int) -> list:
+    env = dict(os.environ, DATABASE_URL=database_url, ENV="benchmark")
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", BOOT_SCRIPT.format(mode=mode)],
+            cwd=ROOT_DIR, env=env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        for _ in range(workers)
+    ]
+    return [json.loads(process.communicate()[0].strip().splitlines()[-1]) for process in processes]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4, help="workers booted concurrently")
+    parser.add_argument("--rounds", type=int, default=3, help="boots per mode")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        migrate(database_url)
+        for mode in ("upgrade", "gate"):
+            samples = []
+            for _ in range(args.rounds):
+                samples.extend(boot_workers(mode, database_url, args.workers))
+            print(json.dumps({
+                "mode": mode,
+                "workers": args.workers,
+                "migrate_ms_mean": round(statistics.mean(s["migrate_s"] for s in samples) * 1000, 1),
+                "boot_ms_mean": round(statistics.mean(s["total_s"] for s in samples) * 1000, 1),
+                "boot_ms_max": round(max(s["total_s"] for s in samples) * 1000, 1),
+            }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
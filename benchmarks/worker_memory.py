@@ -0,0 +1,101 @@
+"""Measure resident and unique memory of a gunicorn deployment, with and without preload.
+
+For each mode, starts gunicorn.conf.py with `--workers` workers, warms every
+worker with a burst of requests, then sums /proc/<pid>/smaps_rollup over the
+master and its workers:
+
+- rss: resident set, counting shared pages once per process
+- pss: proportional set, shared pages split between the processes sharing them
+- uss: private (unique) pages, what the process would free on exit
+
+Linux only.
+
+Usage: python -m benchmarks.worker_memory [--workers 4] [--requests 400]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import HMAC_KEY, ROOT_DIR, free_port, migrate, wait_ready
+
+
+def smaps_rollup(pid: int) -> dict:
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup", encoding="ascii") as rollup:
+        for line in rollup:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def process_tree(pid: int) -> list:
+    """The gunicorn master and its workers."""
+    workers = subprocess.run(["pgrep", "-P", str(pid)], capture_output=True, text=True).stdout.split()
+    return [pid] + [int(worker) for worker in workers]
+
+
+def measure(preload: bool, database_url: str, workers: int, requests: int) -> dict:
+    port = free_port()
+    command = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "infrastructure.web.asgi:app"]
+    env = {
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_PRELOAD": "1" if preload else "0",
+    }
+    server = subprocess.Popen(
+        command, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        env=dict(os.environ, DATABASE_URL=database_url, ENV="benchmark", ALTCHA_HMAC_KEY=HMAC_KEY, **env),
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        wait_ready(base_url)
+        with httpx.Client(base_url=base_url) as client:
+            for i in range(requests):
+                # A new connection each time spreads the requests over the workers.
+                client.post("/report/", json={"visitorId": "memory", "page": f"/{i}", "altcha": "x"},
+                            headers={"Connection": "close"})
+        time.sleep(1)
+        pids = process_tree(server.pid)
+        per_process = [smaps_rollup(pid) for pid in pids]
+    finally:
+        server.terminate()
+        server.wait()
+    totals = {key: round(sum(p[key] for p in per_process) / 1024, 1) for key in ("rss", "pss", "uss")}
+    return {
+        "preload": preload,
+        "processes": len(pids),
+        "rss_mb": totals["rss"],
+        "pss_mb": totals["pss"],
+        "uss_mb": totals["uss"],
+        "worker_uss_mb": round(sum(p["uss"] for p in per_process[1:]) / 1024 / max(len(pids) - 1, 1), 1),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=400, help="warm-up requests spread over the workers")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        migrate(database_url)
+        for preload in (False, True):
+            print(json.dumps(measure(preload, database_url, args.workers, args.requests)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,7 +25,10 @@ from infrastructure.web.dtos import (
     NoteReasonResponse,
     NoteCreateRequest,
     FingerprintRequest,
+    FingerprintResponse,
     ReportRequest,
+    LinkedVisitorsResponse,
+    VisitorSessionResponse,
     EmailAccountCreate,
     EmailAccountUpdate,
     EmailAccountResponse,
@@ -52,7 +55,10 @@ __all__ = [
     'NoteReasonResponse',
     'NoteCreateRequest',
     'FingerprintRequest',
+    'FingerprintResponse',
     'ReportRequest',
+    'LinkedVisitorsResponse',
+    'VisitorSessionResponse',
     'EmailAccountCreate',
     'EmailAccountUpdate',
     'EmailAccountResponse',
@@ -8,6 +8,7 @@ from .concern import Concern
 from .note import Note, NoteReason
 from .fingerprint import Fingerprint
 from .report import Report
+from .visitor_session import VisitorSession
 from .email import EmailAccount, ClassifiedEmail, EmailClassificationHistory
 
 __all__ = [
@@ -23,6 +24,7 @@ __all__ = [
     'NoteReason',
     'Fingerprint',
     'Report',
+    'VisitorSession',
     'EmailAccount',
     'ClassifiedEmail',
     'EmailClassificationHistory',
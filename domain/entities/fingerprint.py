@@ -1,8 +1,8 @@
 """Fingerprint domain entity - pure business object."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 @dataclass
@@ -12,3 +12,12 @@ class Fingerprint:
     visitor_id: str
     components: Dict[str, Any]
     created_at: datetime
+
+    # Hot component fields, extracted from ``components`` at write time
+    timezone: Optional[str] = None
+    platform: Optional[str] = None
+    screen_resolution: Optional[str] = None
+
+    # MinHash signature and LSH bucket keys used for near-duplicate linking
+    minhash_signature: Optional[List[int]] = None
+    lsh_buckets: List[str] = field(default_factory=list)
@@ -0,0 +1,18 @@
+"""Visitor session domain entity - pure business object."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+
+@dataclass
+class VisitorSession:
+    """Pure domain entity representing a run of page visits with no long gap between them."""
+
+    id: Optional[int]
+    visitor_id: str
+    started_at: datetime
+    ended_at: datetime
+    pages: List[str] = field(default_factory=list)
+    report_count: int = 0
+    last_report_id: Optional[int] = None
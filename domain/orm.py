@@ -28,6 +28,10 @@ from infrastructure.persistence.models import (
     NoteReasonModel as NoteReason,
     FingerprintModel as Fingerprint,
     ReportModel as Report,
+    FingerprintLshBucketModel as FingerprintLshBucket,
+    VisitorLinkModel as VisitorLink,
+    VisitorSessionModel as VisitorSession,
+    JobWatermarkModel as JobWatermark,
     EmailAccountModel as EmailAccount,
     ClassifiedEmailModel as ClassifiedEmail,
     EmailClassificationHistoryModel as EmailClassificationHistory,
@@ -52,6 +56,10 @@ __all__ = [
     'NoteReason',
     'Fingerprint',
     'Report',
+    'FingerprintLshBucket',
+    'VisitorLink',
+    'VisitorSession',
+    'JobWatermark',
     'EmailAccount',
     'ClassifiedEmail',
     'EmailClassificationHistory',
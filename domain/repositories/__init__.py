@@ -8,6 +8,7 @@ from .concern_repository import ConcernRepository
 from .note_repository import NoteRepository
 from .fingerprint_repository import FingerprintRepository
 from .report_repository import ReportRepository
+from .visitor_session_repository import VisitorSessionRepository
 from .email_repository import EmailAccountRepository, ClassifiedEmailRepository
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     'NoteRepository',
     'FingerprintRepository',
     'ReportRepository',
+    'VisitorSessionRepository',
     'EmailAccountRepository',
     'ClassifiedEmailRepository',
 ]
@@ -1,7 +1,7 @@
 """Fingerprint repository interface - domain layer defines the contract."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from domain.entities.fingerprint import Fingerprint
 
 
@@ -10,7 +10,7 @@ class FingerprintRepository(ABC):
 
     @abstractmethod
     def save(self, fingerprint: Fingerprint) -> Fingerprint:
-        """Persist a new fingerprint."""
+        """Persist a new or updated fingerprint, replacing its LSH buckets."""
         pass
 
     @abstractmethod
@@ -22,3 +22,39 @@ class FingerprintRepository(ABC):
     def exists(self, visitor_id: str) -> bool:
         """Check if fingerprint exists."""
         pass
+
+    @abstractmethod
+    def find_by_components(
+        self, filters: Dict[str, str], limit: int = 100, offset: int = 0
+    ) -> List[Fingerprint]:
+        """Find fingerprints matching indexed component values (timezone, platform, ...)."""
+        pass
+
+    @abstractmethod
+    def find_page(
+        self, after_visitor_id: Optional[str] = None, limit: int = 500, unsigned_only: bool = False
+    ) -> List[Fingerprint]:
+        """Find the next page of fingerprints ordered by visitor ID (keyset pagination)."""
+        pass
+
+    @abstractmethod
+    def reextract_indexed_components(self, batch_size: int = 1000) -> int:
+        """Refill the indexed component columns from the stored components; returns the rows changed."""
+        pass
+
+    @abstractmethod
+    def find_lsh_candidates(
+        self, buckets: List[str], exclude_visitor_id: str, per_bucket: int = 50
+    ) -> List[Fingerprint]:
+        """Find fingerprints sharing at least one LSH bucket, at most per_bucket per bucket."""
+        pass
+
+    @abstractmethod
+    def find_cluster_members(self, visitor_id: str) -> List[str]:
+        """Find the other visitor IDs linked into the same cluster."""
+        pass
+
+    @abstractmethod
+    def replace_visitor_links(self, clusters: Dict[str, str]) -> None:
+        """Replace all visitor links with the given visitor ID -> cluster ID mapping."""
+        pass
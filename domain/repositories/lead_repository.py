@@ -1,7 +1,7 @@
 """Lead repository interface - domain layer defines the contract."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional
 from domain.entities.lead import Lead
 
 
@@ -23,6 +23,21 @@ class LeadRepository(ABC):
         """Get all leads with relationships."""
         pass
 
+    @abstractmethod
+    def find_for_response(self, lead_id: int) -> Optional[Any]:
+        """Find the persistence model of a lead with everything the API response reads loaded."""
+        pass
+
+    @abstractmethod
+    def find_all_for_response(self) -> List[Any]:
+        """Get the persistence models of all leads, loaded for the API response."""
+        pass
+
+    @abstractmethod
+    def find_by_visitor_ids_for_response(self, visitor_ids: List[str]) -> List[Any]:
+        """Get the persistence models of the leads of any of the visitors, newest first, loaded for the API response."""
+        pass
+
     @abstractmethod
     def update(self, lead: Lead) -> Lead:
         """Update existing lead."""
@@ -1,7 +1,8 @@
 """Report repository interface - domain layer defines the contract."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional
 from domain.entities.report import Report
 
 
@@ -22,3 +23,13 @@ class ReportRepository(ABC):
     def find_by_visitor_id(self, visitor_id: str) -> List[Report]:
         """Find all reports for a visitor."""
         pass
+
+    @abstractmethod
+    def max_id(self, created_before: Optional[datetime] = None) -> int:
+        """Get the highest report ID, optionally among reports created before a moment; 0 when there are none."""
+        pass
+
+    @abstractmethod
+    def stream_between(self, after_id: int, up_to_id: int, batch_size: int = 1000) -> Iterator[Report]:
+        """Stream reports with after_id < id <= up_to_id ordered by visitor and time."""
+        pass
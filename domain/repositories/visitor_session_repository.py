@@ -0,0 +1,32 @@
+"""Visitor session repository interface - domain layer defines the contract."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from domain.entities.visitor_session import VisitorSession
+
+
+class VisitorSessionRepository(ABC):
+    """Abstract repository for VisitorSession - infrastructure implements this."""
+
+    @abstractmethod
+    def save(self, session: VisitorSession) -> VisitorSession:
+        """Stage a new or extended session; it is committed with the next watermark."""
+        pass
+
+    @abstractmethod
+    def find_latest_for_visitor(
+        self, visitor_id: str, started_before: Optional[datetime] = None
+    ) -> Optional[VisitorSession]:
+        """Find a visitor's most recent session, optionally started before a given time."""
+        pass
+
+    @abstractmethod
+    def get_watermark(self, name: str) -> int:
+        """Get the last processed report ID for a job, 0 when it never ran."""
+        pass
+
+    @abstractmethod
+    def commit_watermark(self, name: str, last_id: int) -> None:
+        """Advance a job watermark and commit it together with the staged sessions."""
+        pass
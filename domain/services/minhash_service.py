@@ -0,0 +1,82 @@
+"""MinHash/LSH domain service - near-duplicate detection over fingerprint components."""
+
+import hashlib
+import json
+import random
+from typing import Any, Dict, List, Optional
+
+# Mersenne prime used as the modulus of the permutation hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def _hash64(value: str) -> int:
+    """Stable 64-bit hash (Python's hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class MinHashService:
+    """
+    Domain service computing MinHash signatures and LSH band keys - no dependencies.
+
+    A signature of ``num_perm`` minimums is split into ``bands`` bands; two
+    fingerprints sharing any band key are candidate near-duplicates. With the
+    defaults (16 bands of 4 rows) pairs above ~0.5 Jaccard similarity are
+    likely to collide in at least one band.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    @staticmethod
+    def shingles(components: Dict[str, Any]) -> List[str]:
+        """Flatten fingerprint components into ``key=value`` tokens."""
+        tokens = []
+        for key, value in (components or {}).items():
+            # FingerprintJS wraps every component as {"value": ..., "duration": ...}
+            if isinstance(value, dict) and "value" in value:
+                value = value["value"]
+            tokens.append(f"{key}={json.dumps(value, sort_keys=True, default=str)}")
+        return tokens
+
+    def signature(self, components: Dict[str, Any]) -> Optional[List[int]]:
+        """Compute the MinHash signature of a fingerprint, None when it has no components."""
+        hashes = [_hash64(token) for token in self.shingles(components)]
+        if not hashes:
+            return None
+
+        return [
+            min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+            for a, b in self._permutations
+        ]
+
+    def band_keys(self, signature: Optional[List[int]]) -> List[str]:
+        """Split a signature into LSH bucket keys, one per band."""
+        if not signature:
+            return []
+
+        keys = []
+        for band in range(self.bands):
+            rows = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                ",".join(str(r) for r in rows).encode("utf-8"), digest_size=8
+            ).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    @staticmethod
+    def similarity(signature_a: Optional[List[int]], signature_b: Optional[List[int]]) -> float:
+        """Estimate the Jaccard similarity of two fingerprints from their signatures."""
+        if not signature_a or not signature_b or len(signature_a) != len(signature_b):
+            return 0.0
+        matches = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+        return matches / len(signature_a)
@@ -5,10 +5,18 @@ set -e
 # This is a simple loop, a more robust solution might use wait-for-it.sh
 # However, the docker-compose healthcheck should handle this.
 
-# Run database migrations
-echo "Running API migrations..."
-python run_migrations.py
+# APP_MODULE selects the app served by this container: the full API (default)
+# or the lean beacon app, infrastructure.web.ingestion_app:app.
+APP_MODULE="${APP_MODULE:-infrastructure.web.asgi:app}"
+
+# Run database migrations (disable with RUN_MIGRATIONS=0 on ingestion containers)
+if [ "${RUN_MIGRATIONS:-1}" = "1" ]; then
+    echo "Running API migrations..."
+    python run_migrations.py
+fi
 
 # Start the Gunicorn server
 echo "Starting Gunicorn..."
-exec gunicorn --access-logfile - --error-logfile - --log-level debug -w 4 -k uvicorn.workers.UvicornWorker infrastructure.web.wsgi:app -b 0.0.0.0:8000
+# Worker count, keep-alive and backlog are read from the environment by
+# gunicorn.conf.py (WEB_CONCURRENCY, GUNICORN_KEEPALIVE, GUNICORN_BACKLOG).
+exec gunicorn -c gunicorn.conf.py "$APP_MODULE"
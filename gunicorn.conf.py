@@ -0,0 +1,68 @@
+"""Gunicorn settings for serving the ASGI apps.
+
+Usage: gunicorn -c gunicorn.conf.py infrastructure.web.asgi:app
+"""
+import glob
+import os
+import shutil
+import tempfile
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Seconds an idle keep-alive connection stays open. Keep it above the idle
+# timeout of the load balancer in front so it never reuses a closed socket.
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "75"))
+# Pending connections the kernel queues while every worker is busy.
+backlog = int(os.environ.get("GUNICORN_BACKLOG", "2048"))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+# Import the app once in the master and fork workers from it, so code,
+# mappers and schemas are shared copy-on-write instead of duplicated.
+preload_app = os.environ.get("GUNICORN_PRELOAD", "0").lower() in ("1", "true", "yes")
+
+
+# Workers write their Prometheus samples here so /metrics, whichever worker
+# answers it, reports the whole server. It must exist before the app is
+# imported (in the master with preload). Unless the operator provides one,
+# each server gets its own directory, keyed on the master pid, emptied of the
+# samples of an earlier master with that pid and removed on exit. A HUP
+# reloads this file in the same master, where the variable is already set.
+def _own_multiproc_dir():
+    return os.path.join(tempfile.gettempdir(), f"prometheus-multiproc-{os.getpid()}")
+
+
+if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = _own_multiproc_dir()
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+    for stale in glob.glob(os.path.join(os.environ["PROMETHEUS_MULTIPROC_DIR"], "*.db")):
+        os.remove(stale)
+
+
+def when_ready(server):
+    if preload_app:
+        from infrastructure.web.workers import prepare_master
+        prepare_master()
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from infrastructure.web.workers import init_worker
+        init_worker()
+
+
+def child_exit(server, worker):
+    # Drop the live gauges (in-flight requests, pool connections) of the dead worker.
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+
+def on_exit(server):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR") == _own_multiproc_dir():
+        shutil.rmtree(_own_multiproc_dir(), ignore_errors=True)
@@ -1,11 +1,97 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, make_url
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.sql.util import find_tables
 import os
+import threading
 
-DATABASE_URL = os.environ.get("DATABASE_URL")
-if DATABASE_URL and DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+from infrastructure.observability.metrics import instrument_pool
+from infrastructure.observability.queries import track_queries
+from infrastructure.observability.slow_queries import SlowQueryLog
+from infrastructure.pool import InstrumentedQueuePool
+from infrastructure.sqlite import WriteQueue, configure_sqlite
+
+
+def _normalize_url(url):
+    if url and url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+DATABASE_URL = _normalize_url(os.environ.get("DATABASE_URL"))
+DATABASE_REPLICA_URL = _normalize_url(os.environ.get("DATABASE_REPLICA_URL"))
+ANALYTICS_DATABASE_URL = _normalize_url(os.environ.get("ANALYTICS_DATABASE_URL"))
+
+# Tables fed by the public beacon endpoints and the visitor jobs. With
+# ANALYTICS_DATABASE_URL they live in their own database, with their own pool;
+# nothing outside this set may join them in SQL.
+ANALYTICS_TABLES = frozenset({
+    "fingerprints", "reports", "fingerprint_lsh_buckets", "visitor_links", "sessions", "job_watermarks",
+})
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Relationships that the code must load explicitly (joinedload/selectinload)
+# use GUARDED_LAZY. With DB_STRICT_LOADING (the test suite enables it) a lazy
+# load that would emit SQL raises instead of silently adding a query per row.
+GUARDED_LAZY = "raise_on_sql" if _env_bool("DB_STRICT_LOADING", False) else "select"
+
+
+def pool_options() -> dict:
+    """Pool settings from the environment (per worker process)."""
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", "5")),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.environ.get("DB_POOL_TIMEOUT", "30")),
+        # Reconnect before server-side idle timeouts (or a proxy) silently drop the socket.
+        "pool_recycle": int(os.environ.get("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+    }
+
+
+def driver_options(url: str) -> dict:
+    """Driver-specific create_engine arguments, picked from the URL's driver.
+
+    postgresql+psycopg (psycopg 3) prepares a statement server-side once it
+    has run DB_PREPARE_THRESHOLD times on a connection, so hot queries are no
+    longer re-parsed and re-planned. The default of 5 is psycopg's own; the
+    setting exists to tune it, or to set it to "none" behind a transaction-mode
+    pooler (PgBouncer < 1.21), which cannot track prepared statements.
+    """
+    if make_url(url).drivername != "postgresql+psycopg":
+        return {}
+    threshold = os.environ.get("DB_PREPARE_THRESHOLD", "5").strip().lower()
+    return {"connect_args": {"prepare_threshold": None if threshold in ("", "none") else int(threshold)}}
+
+
+# Statements slower than SLOW_QUERY_MS, kept per worker process (see /admin/slow-queries).
+slow_query_log = SlowQueryLog.from_env()
+
+
+def _instrument(engine, name: str):
+    track_queries(engine)
+    instrument_pool(engine, name)
+    if slow_query_log is not None:
+        slow_query_log.install(engine)
+    return engine
+
+
+def _sqlite_engine(url: str, name: str = "primary"):
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **pool_options())
+    return _instrument(configure_sqlite(engine), name)
+
+
+def _engine(url: str, name: str = "primary"):
+    if url.startswith("sqlite"):
+        return _sqlite_engine(url, name)
+    return _instrument(create_engine(url, **pool_options(), **driver_options(url)), name)
 
 
 # Determine the absolute path for the API directory.
@@ -15,22 +101,120 @@ api_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if "pytest" in os.environ.get("ENV", "development"):
     db_path = os.path.join(api_dir, 'test.db')
     SQLALCHEMY_DATABASE_URL = f"sqlite:///{db_path}"
-    engine = create_engine(
-        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-    )
+    engine = _sqlite_engine(SQLALCHEMY_DATABASE_URL)
 else:
     if DATABASE_URL:
         SQLALCHEMY_DATABASE_URL = DATABASE_URL
-        engine = create_engine(SQLALCHEMY_DATABASE_URL)
+        engine = _engine(SQLALCHEMY_DATABASE_URL)
     else:
         db_path = os.path.join(api_dir, 'dev.db')
         SQLALCHEMY_DATABASE_URL = f"sqlite:///{db_path}"
-        engine = create_engine(
-            SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-        )
+        engine = _sqlite_engine(SQLALCHEMY_DATABASE_URL)
+
+
+# Analytics tables share the primary engine unless ANALYTICS_DATABASE_URL is set.
+analytics_engine = _engine(ANALYTICS_DATABASE_URL, "analytics") if ANALYTICS_DATABASE_URL else engine
+
 
+class AnalyticsRoutingSession(Session):
+    """Session that runs statements on the analytics tables against their own engine."""
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    def __init__(self, *args, analytics_bind=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._analytics_bind = analytics_bind
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if mapper is not None:
+                tables = inspect(mapper).tables
+            elif clause is not None:
+                tables = find_tables(clause, include_crud=True)
+            else:
+                tables = ()
+            if any(table.name in ANALYTICS_TABLES for table in tables):
+                return self._analytics_bind
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
+
+def session_factory(bind, analytics_bind=None):
+    """sessionmaker for bind, sending the analytics tables to analytics_bind when it differs."""
+    if analytics_bind is None or analytics_bind is bind:
+        return sessionmaker(autocommit=False, autoflush=False, bind=bind)
+    return sessionmaker(
+        autocommit=False, autoflush=False, bind=bind,
+        class_=AnalyticsRoutingSession, analytics_bind=analytics_bind,
+    )
+
+
+SessionLocal = session_factory(engine, analytics_engine)
+TestingSessionLocal = session_factory(engine, analytics_engine)
+
+
+def replica_session_factory(replica):
+    """sessionmaker reading from replica; the analytics tables stay on it too unless they have their own database."""
+    return session_factory(replica, analytics_engine if analytics_engine is not engine else replica)
+
+
+# Optional read replica: safe (GET) requests read from it, see infrastructure.web.dependencies.
+replica_engine = _engine(DATABASE_REPLICA_URL, "replica") if DATABASE_REPLICA_URL else None
+ReplicaSessionLocal = replica_session_factory(replica_engine) if replica_engine is not None else None
+
+
+def named_engines():
+    """{name: engine} of every engine of this process, primary first; analytics is left out when shared."""
+    found = {}
+    for name, candidate in (("primary", engine), ("analytics", analytics_engine), ("replica", replica_engine)):
+        if candidate is not None and all(candidate is not other for other in found.values()):
+            found[name] = candidate
+    return found
+
+
+def engines():
+    """Every engine of this process (primary first)."""
+    return list(named_engines().values())
 
 Base = declarative_base()
+
+
+_write_queue = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """The process's SQLite write queue, or None unless SQLITE_WRITE_QUEUE is set.
+
+    Started on first use, so in preload mode each worker gets its own writer
+    thread after the fork.
+    """
+    global _write_queue
+    if analytics_engine.dialect.name != "sqlite" or not _env_bool("SQLITE_WRITE_QUEUE", False):
+        return None
+    with _write_queue_lock:
+        if _write_queue is None:
+            _write_queue = WriteQueue(analytics_engine)
+        return _write_queue
+
+
+def close_write_queue():
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is not None:
+            _write_queue.close()
+            _write_queue = None
+
+
+def run_write(db, work):
+    """Run beacon work(session) through the write queue when enabled, otherwise on db.
+
+    The work must only touch the analytics tables.
+
+    On SQLite the transaction then takes the write lock up front, so that a
+    unit of work that reads before it writes waits for concurrent writers
+    instead of failing with "database is locked".
+    """
+    write_queue = get_write_queue()
+    if write_queue is not None:
+        return write_queue.submit(work)
+    if analytics_engine.dialect.name == "sqlite" and not db.in_transaction():
+        db.connection(bind_arguments={"bind": analytics_engine}, execution_options={"sqlite_begin": "IMMEDIATE"})
+    return work(db)
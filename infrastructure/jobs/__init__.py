@@ -0,0 +1 @@
+"""Background jobs - run as ``python -m infrastructure.jobs.<job>`` from cron or a scheduler."""
@@ -0,0 +1,36 @@
+"""Cluster near-duplicate visitors from their fingerprint MinHash signatures.
+
+Usage: python -m infrastructure.jobs.link_visitors
+"""
+
+import logging
+import sys
+
+from dotenv import load_dotenv
+
+from application.visitor_linking_service import VisitorLinkingService
+from domain.services.minhash_service import MinHashService
+from infrastructure.database import SessionLocal
+from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
+
+logger = logging.getLogger(__name__)
+
+
+def run() -> int:
+    """Run one linking pass and return the number of linked visitors."""
+    db = SessionLocal()
+    try:
+        service = VisitorLinkingService(SqlAlchemyFingerprintRepository(db), MinHashService())
+        return service.link_visitors()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stdout,
+    )
+    run()
@@ -0,0 +1,39 @@
+"""Fold new page reports into visitor sessions, starting from the stored watermark.
+
+Usage: python -m infrastructure.jobs.reconstruct_sessions
+"""
+
+import logging
+import sys
+
+from dotenv import load_dotenv
+
+from application.visitor_session_service import VisitorSessionService
+from infrastructure.database import SessionLocal
+from infrastructure.persistence.repositories.sqlalchemy_report_repository import SqlAlchemyReportRepository
+from infrastructure.persistence.repositories.sqlalchemy_visitor_session_repository import SqlAlchemyVisitorSessionRepository
+
+logger = logging.getLogger(__name__)
+
+
+def run() -> int:
+    """Run one incremental pass and return the number of reports processed."""
+    db = SessionLocal()
+    try:
+        service = VisitorSessionService(
+            SqlAlchemyReportRepository(db),
+            SqlAlchemyVisitorSessionRepository(db)
+        )
+        return service.reconstruct_sessions()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stdout,
+    )
+    run()
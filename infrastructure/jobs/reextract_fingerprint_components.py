@@ -0,0 +1,39 @@
+"""Refill the indexed fingerprint columns after FINGERPRINT_INDEXED_COMPONENTS changed.
+
+New fingerprints are extracted with the configured paths as they are written;
+rows written under the previous paths keep their old values until this runs.
+
+Usage: python -m infrastructure.jobs.reextract_fingerprint_components
+"""
+
+import logging
+import sys
+
+from dotenv import load_dotenv
+
+from application.fingerprint_service import FingerprintService
+from domain.services.minhash_service import MinHashService
+from infrastructure.database import SessionLocal
+from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
+
+logger = logging.getLogger(__name__)
+
+
+def run() -> int:
+    """Re-extract every fingerprint and return the number of rows changed."""
+    db = SessionLocal()
+    try:
+        service = FingerprintService(SqlAlchemyFingerprintRepository(db), MinHashService())
+        return service.reextract_indexed_components()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        stream=sys.stdout,
+    )
+    run()
@@ -3,6 +3,9 @@ from email.mime.text import MIMEText
 import os
 import ssl
 
+from infrastructure.observability.metrics import SMTP_SEND_SECONDS
+from infrastructure.observability.timing import phase
+
 class EmailSender:
     def send_email(self, sender, recipient, form_data):
         if os.environ.get("ENV") != "pytest":
@@ -19,9 +22,10 @@ class EmailSender:
             msg["To"] = recipient
             print("Connecting to " + os.environ.get("SMTP_HOST"))
             
-            server = smtplib.SMTP_SSL(os.environ.get("SMTP_HOST"), int(os.environ.get("SMTP_PORT")), context=ssl._create_unverified_context())
-            server.login(os.environ.get("SMTP_USER"), os.environ.get("SMTP_PASS"))
-            server.send_message(msg)
+            with phase("smtp"), SMTP_SEND_SECONDS.time():
+                server = smtplib.SMTP_SSL(os.environ.get("SMTP_HOST"), int(os.environ.get("SMTP_PORT")), context=ssl._create_unverified_context())
+                server.login(os.environ.get("SMTP_USER"), os.environ.get("SMTP_PASS"))
+                server.send_message(msg)
 
     def send_generic_email(self, sender, recipient, subject, body):
         if os.environ.get("ENV") != "pytest":
@@ -30,6 +34,7 @@ class EmailSender:
             msg["From"] = sender
             msg["To"] = recipient
 
-            server = smtplib.SMTP_SSL(os.environ.get("SMTP_HOST"), int(os.environ.get("SMTP_PORT")), context=ssl._create_unverified_context())
-            server.login(os.environ.get("SMTP_USER"), os.environ.get("SMTP_PASS"))
-            server.send_message(msg)
+            with phase("smtp"), SMTP_SEND_SECONDS.time():
+                server = smtplib.SMTP_SSL(os.environ.get("SMTP_HOST"), int(os.environ.get("SMTP_PORT")), context=ssl._create_unverified_context())
+                server.login(os.environ.get("SMTP_USER"), os.environ.get("SMTP_PASS"))
+                server.send_message(msg)
@@ -0,0 +1,53 @@
+"""Request and database telemetry."""
+
+from .context import RequestContextMiddleware, current_route
+from .loop_lag import LoopLagMonitor
+from .logs import JsonFormatter, configure_logging
+from .metrics import MetricsMiddleware, instrument_pool, record_cache_lookup, render_metrics
+from .profiling import PROFILE_HEADER, PROFILE_ID_HEADER, ProfileStore, ProfilingMiddleware
+from .queries import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryCountMiddleware,
+    QueryStats,
+    assert_max_queries,
+    count_queries,
+    max_queries,
+    query_stats_enabled,
+    track_queries,
+)
+from .slow_queries import SlowQueryLog, redact
+from .timing import SERVER_TIMING_HEADER, ServerTimingMiddleware, TimedRoute, phase, server_timing_enabled, timed
+
+__all__ = [
+    'PROFILE_HEADER',
+    'PROFILE_ID_HEADER',
+    'QUERY_COUNT_HEADER',
+    'QUERY_TIME_HEADER',
+    'SERVER_TIMING_HEADER',
+    'JsonFormatter',
+    'LoopLagMonitor',
+    'MetricsMiddleware',
+    'ProfileStore',
+    'ProfilingMiddleware',
+    'QueryCountMiddleware',
+    'QueryStats',
+    'RequestContextMiddleware',
+    'ServerTimingMiddleware',
+    'SlowQueryLog',
+    'TimedRoute',
+    'assert_max_queries',
+    'configure_logging',
+    'count_queries',
+    'current_route',
+    'instrument_pool',
+    'max_queries',
+    'phase',
+    'query_stats_enabled',
+    'record_cache_lookup',
+    'redact',
+    'render_metrics',
+    'server_timing_enabled',
+    'timed',
+    'track_queries',
+]
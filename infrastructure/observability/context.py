@@ -0,0 +1,37 @@
+"""Request context available to code that does not receive the request.
+
+RequestContextMiddleware records the ASGI scope of the request being served
+in a context variable. Handlers running in the threadpool inherit it, and so
+do the engine event hooks they trigger. current_route() reads the scope when
+it is called, so once routing has run it names the route template
+("GET /leads/{lead_id}") rather than the raw path, keeping the values few.
+"""
+from contextvars import ContextVar
+from typing import Optional
+
+_scope: ContextVar[Optional[dict]] = ContextVar("request_scope", default=None)
+
+
+def current_route() -> Optional[str]:
+    """The request being served in this context, None outside requests."""
+    scope = _scope.get()
+    if scope is None:
+        return None
+    # The router sets scope["route"] on the scope dict the middleware saw.
+    path = getattr(scope.get("route"), "path", scope["path"])
+    return f"{scope['method']} {path}"
+
+
+class RequestContextMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _scope.reset(token)
@@ -0,0 +1,147 @@
+"""Logging setup shared by the API, the ingestion app and their workers.
+
+configure_logging() sends every record to an in-memory queue. A listener
+thread formats and writes the records, so a request only pays for creating
+its records, not for formatting them or writing them to stdout. A forked
+child (a gunicorn worker of a preloaded app) inherits the handler but not
+the thread, so it gets a queue and a listener of its own right after the
+fork.
+
+Settings, read from the environment:
+
+- LOG_LEVEL: root level, INFO by default.
+- LOG_LEVELS: per-logger levels, e.g. "sqlalchemy.engine=INFO,api app=DEBUG".
+- LOG_FORMAT: "text" (default) or "json", one object per line with the
+  record's extra fields (server_timing, ...).
+- LOG_DEBUG_SAMPLE: fraction of DEBUG records kept, 1 by default.
+- LOG_QUEUE: set to 0 to write synchronously from the logging thread, for
+  example to debug a crash whose last records would stay in the queue.
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Attributes every LogRecord has; anything else was passed with extra=.
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+_listener_pid: Optional[int] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record, with the fields passed in extra=."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class DebugSampler(logging.Filter):
+    """Keeps `rate` of the records below INFO and all the others."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.INFO or random.random() < self.rate
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener.
+
+    The stock prepare() formats the whole record so that it can be pickled
+    to another process. The queue is read in this process, so only the
+    message is merged with its arguments here, in case they change before
+    the listener gets to them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def parse_levels(value: str) -> dict:
+    """{"logger.name": "LEVEL"} from "logger.name=LEVEL,other=LEVEL"."""
+    levels = {}
+    for item in value.split(","):
+        name, sep, level = item.rpartition("=")
+        if sep and name.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def _start_listener(handler: QueueHandler, *outputs: logging.Handler) -> None:
+    global _listener, _listener_pid
+    _listener = QueueListener(handler.queue, *outputs, respect_handler_level=True)
+    _listener_pid = os.getpid()
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    if _listener is not None and _listener_pid == os.getpid():
+        _listener.stop()
+
+
+def _restart_listener_after_fork() -> None:
+    """Give the child a queue and a listener thread; the parent's thread was not copied."""
+    if _listener is None:
+        return
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, _InProcessQueueHandler):
+            # A fresh queue, so the records the parent had not written yet are not written twice.
+            handler.queue = queue.SimpleQueue()
+            _start_listener(handler, *_listener.handlers)
+
+
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
+def configure_logging(stream=None) -> logging.Logger:
+    """Set up the root logger from the environment, once per process, and return it."""
+    root = logging.getLogger()
+    if _listener is not None:
+        return root
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter() if os.environ.get("LOG_FORMAT", "text").lower() == "json"
+                        else logging.Formatter(TEXT_FORMAT))
+
+    if os.environ.get("LOG_QUEUE", "1").strip().lower() in ("0", "false", "no", "off"):
+        handler = output
+    else:
+        handler = _InProcessQueueHandler(queue.SimpleQueue())
+        _start_listener(handler, output)
+
+    sample = float(os.environ.get("LOG_DEBUG_SAMPLE", "1"))
+    if sample < 1:
+        handler.addFilter(DebugSampler(sample))
+
+    root.handlers = [handler]
+    root.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    for name, level in parse_levels(os.environ.get("LOG_LEVELS", "")).items():
+        logging.getLogger(name).setLevel(level)
+    return root
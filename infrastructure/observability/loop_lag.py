@@ -0,0 +1,88 @@
+"""Event loop lag monitor.
+
+Sync endpoints run in the threadpool, but middlewares, async dependencies
+(get_current_user) and async endpoints run on the event loop. A blocking
+call there (a synchronous HTTP request, a query, smtplib) stalls every
+request of the worker.
+
+LoopLagMonitor runs a task that wakes up every `interval` and exports how
+late it woke up as event_loop_lag_seconds. A watchdog thread watches the
+task's heartbeat: when the loop has not ticked for `threshold`, it logs the
+current stack of the loop thread, which is the code blocking it, and counts
+a stall. One stall is logged once, however long it lasts.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from infrastructure.observability.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Measures the scheduling lag of the running event loop and reports what blocks it."""
+
+    def __init__(self, threshold_ms: float = 100, interval_ms: float = 50):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval_ms / 1000
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._heartbeat = time.perf_counter()
+        self._reported = False
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopped = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["LoopLagMonitor"]:
+        """LOOP_LAG_MS; None when it is "off"."""
+        threshold = os.environ.get("LOOP_LAG_MS", "100").strip().lower()
+        if threshold in ("", "off", "none"):
+            return None
+        threshold_ms = float(threshold)
+        return cls(threshold_ms=threshold_ms, interval_ms=min(50.0, threshold_ms / 2))
+
+    def start(self):
+        """Start monitoring the running loop; call from a coroutine, such as the app lifespan."""
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._stopped.clear()
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _tick(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(0.0, now - expected)
+            self.max_lag = max(self.max_lag, lag)
+            EVENT_LOOP_LAG.set(lag)
+            self._heartbeat = now
+            self._reported = False
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            blocked = time.perf_counter() - self._heartbeat - self.interval
+            if blocked < self.threshold or self._reported:
+                continue
+            self._reported = True
+            self.stalls += 1
+            EVENT_LOOP_STALLS.inc()
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "(stack unavailable)\n"
+            logger.warning("Event loop blocked for more than %.0f ms, at:\n%s", blocked * 1000, stack)
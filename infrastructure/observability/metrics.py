@@ -0,0 +1,126 @@
+"""Prometheus metrics.
+
+MetricsMiddleware counts requests and times them per route template
+(/leads/{lead_id}, not /leads/42), so the number of series stays bounded.
+The other metrics are fed where the work happens: pool checkouts by
+instrument_pool(), the SQLite write queue, SMTP sends and cache lookups by
+record_cache_lookup(), and the event loop lag by LoopLagMonitor.
+
+Under gunicorn, each worker writes its samples to memory-mapped files in
+PROMETHEUS_MULTIPROC_DIR (gunicorn.conf.py sets it up). render_metrics()
+then merges the samples of every worker, so a scrape that any worker
+answers covers the whole server. Without that directory the metrics are the
+ones of this process.
+"""
+import os
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+from prometheus_client import REGISTRY, multiprocess
+from sqlalchemy import event
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status code.", ["method", "route", "status"]
+)
+REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests being served.", multiprocess_mode="livesum"
+)
+POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Database connections checked out of the pool.", ["engine"],
+    multiprocess_mode="livesum",
+)
+POOL_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.", ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that gave up after DB_POOL_TIMEOUT.", ["engine"]
+)
+WRITE_QUEUE_DEPTH = Gauge(
+    "sqlite_write_queue_depth", "Writes waiting for the SQLite writer thread.", multiprocess_mode="livesum"
+)
+SMTP_SEND_SECONDS = Histogram(
+    "smtp_send_duration_seconds", "Time to connect, log in and send one email.",
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds", "Delay of the last event loop tick behind its schedule.", multiprocess_mode="livemax"
+)
+EVENT_LOOP_STALLS = Counter(
+    "event_loop_stalls_total", "Times the event loop was blocked longer than LOOP_LAG_MS."
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Cache lookups by cache and result (hit or miss).", ["cache", "result"]
+)
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def instrument_pool(engine, name: str):
+    """Export the pool occupancy and checkout waits of engine under the label name."""
+    in_use = POOL_IN_USE.labels(name)
+    wait_seconds = POOL_WAIT_SECONDS.labels(name)
+    timeouts = POOL_TIMEOUTS.labels(name)
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        in_use.inc()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        in_use.dec()
+
+    stats = getattr(engine.pool, "stats", None)
+    if stats is not None:
+        stats.observers.append(
+            lambda waited, timed_out: timeouts.inc() if timed_out else wait_seconds.observe(waited)
+        )
+    return engine
+
+
+def render_metrics():
+    """(body, content type) of the metrics of the whole server."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """Request count, latency and concurrency per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [500]
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            IN_FLIGHT.dec()
+            # Set by the router once a route matched; the raw path would give a series per ID.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            REQUESTS.labels(method, route, str(status[0])).inc()
+            REQUEST_SECONDS.labels(method, route).observe(elapsed)
@@ -0,0 +1,193 @@
+"""On-demand profiling of single requests.
+
+A request sent with `X-Profile: 1` (or `?profile=1`) by an authorised user
+runs its endpoint under cProfile. The stats are written in pstats format to
+ProfileStore's directory, which keeps the `capacity` most recent dumps, and
+the response names the dump in its X-Profile-Id header. Open a dump with
+`python -m pstats <file>` or snakeviz.
+
+The endpoint is profiled in the thread that runs it, so with sync endpoints
+the dump only holds this request's handler, services and queries, not the
+requests served alongside it. FastAPI's response serialization happens after
+the endpoint returns and is not included; Server-Timing reports it.
+
+Requests without the flag cost a scan of their headers in the middleware and
+a context variable lookup around the endpoint.
+"""
+import cProfile
+import functools
+import inspect
+import logging
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+_active: ContextVar[Optional["RequestProfile"]] = ContextVar("request_profile", default=None)
+
+_NAME = re.compile(r"^[\w.-]+\.pstats$")
+
+
+class RequestProfile:
+    """cProfile runs of one request, merged when it is saved."""
+
+    def __init__(self):
+        self._profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+
+    def new(self) -> cProfile.Profile:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        return profile
+
+    def stats(self) -> Optional[pstats.Stats]:
+        with self._lock:
+            profiles = list(self._profiles)
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+
+def profiled(endpoint):
+    """Wrap endpoint so that it runs under cProfile when its request is flagged."""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            request_profile = _active.get()
+            if request_profile is None:
+                return await endpoint(*args, **kwargs)
+            profile = request_profile.new()
+            profile.enable()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                profile.disable()
+    else:
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            request_profile = _active.get()
+            if request_profile is None:
+                return endpoint(*args, **kwargs)
+            profile = request_profile.new()
+            profile.enable()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                profile.disable()
+    return wrapper
+
+
+class ProfileStore:
+    """Directory of pstats dumps keeping only the `capacity` most recent ones."""
+
+    def __init__(self, directory: str, capacity: int = 20):
+        self.directory = directory
+        self.capacity = capacity
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ProfileStore":
+        """PROFILE_DIR and PROFILE_KEEP."""
+        return cls(
+            directory=os.environ.get("PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "request-profiles"),
+            capacity=int(os.environ.get("PROFILE_KEEP", "20")),
+        )
+
+    def save(self, stats: pstats.Stats, method: str, path: str, seconds: float) -> str:
+        slug = re.sub(r"[^\w]+", "_", path).strip("_") or "root"
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        name = f"{stamp}-{method}-{slug}-{round(seconds * 1000)}ms.pstats"
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            stats.dump_stats(os.path.join(self.directory, name))
+            for old in self.entries()[self.capacity:]:
+                try:
+                    os.remove(os.path.join(self.directory, old["name"]))
+                except FileNotFoundError:
+                    pass
+        return name
+
+    def entries(self) -> List[dict]:
+        """Dumps, most recent first."""
+        try:
+            names = [name for name in os.listdir(self.directory) if _NAME.match(name)]
+        except FileNotFoundError:
+            return []
+        entries = []
+        for name in names:
+            try:
+                info = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append({
+                "name": name,
+                "size": info.st_size,
+                "created_at": datetime.fromtimestamp(info.st_mtime, timezone.utc).isoformat(),
+            })
+        return sorted(entries, key=lambda entry: entry["name"], reverse=True)
+
+    def path(self, name: str) -> Optional[str]:
+        """File of the dump called name, None for unknown or malformed names."""
+        if not _NAME.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+
+def _flagged(scope) -> bool:
+    for key, value in scope["headers"]:
+        if key == b"x-profile" and value not in (b"", b"0"):
+            return True
+    query = scope.get("query_string", b"")
+    return b"profile=" in query and any(
+        pair.startswith(b"profile=") and pair not in (b"profile=", b"profile=0") for pair in query.split(b"&")
+    )
+
+
+class ProfilingMiddleware:
+    """Profiles the requests flagged with X-Profile or ?profile=1 when authorize(scope) allows it."""
+
+    def __init__(self, app, store: ProfileStore, authorize: Callable[[dict], Awaitable[bool]]):
+        self.app = app
+        self.store = store
+        self.authorize = authorize
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _flagged(scope) or not await self.authorize(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request_profile = RequestProfile()
+        token = _active.set(request_profile)
+        started = time.perf_counter()
+
+        async def send_with_profile_id(message):
+            # The endpoint has returned by the time the response starts.
+            if message["type"] == "http.response.start":
+                stats = request_profile.stats()
+                if stats is not None:
+                    name = self.store.save(stats, scope["method"], scope["path"], time.perf_counter() - started)
+                    logger.info("Profiled %s %s: %s", scope["method"], scope["path"], name)
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (PROFILE_ID_HEADER.lower().encode("latin-1"), name.encode("latin-1")),
+                    ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            _active.reset(token)
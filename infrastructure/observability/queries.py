@@ -0,0 +1,131 @@
+"""Per-request SQL statement counting.
+
+track_queries(engine) times every statement the engine runs inside a
+count_queries() block and adds it to that block's QueryStats. The block is
+held in a context variable, so it follows a request into the threadpool
+where the sync handlers run. Outside a block the listeners only read the
+context variable.
+
+QueryCountMiddleware opens a block per request. It logs the count and the
+time spent in the database, and returns them in the X-DB-Query-Count and
+X-DB-Time-Ms headers. A statement repeated QUERY_REPEAT_WARN times in one
+request is logged as a warning: that is what an N+1 lazy load looks like.
+"""
+import logging
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time-Ms"
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """Statements run, and the time spent running them, in one count_queries() block."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: List[str] = []
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+        self.statements.append(statement)
+
+    def repeated(self, threshold: int) -> dict:
+        """Statements run at least threshold times, with their count."""
+        return {sql: n for sql, n in Counter(self.statements).items() if n >= threshold}
+
+
+@contextmanager
+def count_queries():
+    """Count the statements run in this context (and the threads it hands work to)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def max_queries(limit: int):
+    """Fail with the statements listed if the block runs more than limit of them."""
+    with count_queries() as stats:
+        yield stats
+    if stats.count > limit:
+        raise AssertionError(
+            f"{stats.count} statements, expected at most {limit}:\n" + "\n".join(stats.statements)
+        )
+
+
+def assert_max_queries(response, limit: int):
+    """Fail if the request behind an HTTP response ran more than limit statements."""
+    count = int(response.headers[QUERY_COUNT_HEADER])
+    request = response.request
+    assert count <= limit, (
+        f"{request.method} {request.url.path} ran {count} statements, expected at most {limit}"
+    )
+
+
+def track_queries(engine):
+    """Report the statements of engine to the active count_queries() block."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        started = conn.info.get("query_started")
+        if stats is not None and started:
+            stats.record(statement, time.perf_counter() - started.pop())
+
+    return engine
+
+
+def query_stats_enabled() -> bool:
+    """QUERY_STATS, on by default everywhere but ENV=production."""
+    default = "0" if os.environ.get("ENV") == "production" else "1"
+    return os.environ.get("QUERY_STATS", default).strip().lower() in ("1", "true", "yes", "on")
+
+
+class QueryCountMiddleware:
+    """Counts the statements and database time of each request."""
+
+    def __init__(self, app, repeat_warning: int = None):
+        self.app = app
+        self.repeat_warning = repeat_warning or int(os.environ.get("QUERY_REPEAT_WARN", "5"))
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as stats:
+            async def send_with_counts(message):
+                if message["type"] == "http.response.start":
+                    message["headers"] = list(message.get("headers", [])) + [
+                        (QUERY_COUNT_HEADER.lower().encode("latin-1"), str(stats.count).encode("latin-1")),
+                        (QUERY_TIME_HEADER.lower().encode("latin-1"), f"{stats.seconds * 1000:.1f}".encode("latin-1")),
+                    ]
+                await send(message)
+
+            await self.app(scope, receive, send_with_counts)
+
+        route = f"{scope['method']} {scope['path']}"
+        logger.debug("%s: %d statements in %.1f ms", route, stats.count, stats.seconds * 1000)
+        for statement, times in stats.repeated(self.repeat_warning).items():
+            logger.warning("%s ran the same statement %d times (N+1?): %s", route, times, statement)
@@ -0,0 +1,140 @@
+"""Slow query log.
+
+SlowQueryLog.install(engine) times every statement of the engine. Any
+statement slower than the threshold is recorded with its duration, the
+request that ran it and its parameters redacted to their types. The last
+`capacity` entries are kept in memory.
+
+With explain=True, the plan of a slow SELECT is captured in the background:
+EXPLAIN ANALYZE on PostgreSQL, inside a transaction that is rolled back, and
+EXPLAIN QUERY PLAN on SQLite. It runs on a connection of the same engine,
+so the request that ran the statement does not wait for it. A statement is
+explained again only after it has dropped out of the buffer.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import event
+
+from infrastructure.observability.context import current_route
+
+logger = logging.getLogger(__name__)
+
+# Execution option of the EXPLAIN statements themselves, which are not logged.
+_SKIP = "slow_query_log_skip"
+
+
+def redact(parameters):
+    """Replace parameter values by their type names."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: the shape of the first row and the number of rows
+            return {"rows": len(parameters), "first": redact(parameters[0])}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class SlowQueryLog:
+    """Bounded, thread-safe record of the statements slower than threshold_ms."""
+
+    def __init__(self, threshold_ms: float = 200, capacity: int = 100, explain: bool = False):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self._entries = deque(maxlen=capacity)
+        self._plans = {}
+        self._lock = threading.Lock()
+        self._explainer = None
+
+    @classmethod
+    def from_env(cls) -> Optional["SlowQueryLog"]:
+        """SLOW_QUERY_MS, SLOW_QUERY_LOG_SIZE and SLOW_QUERY_EXPLAIN; None when SLOW_QUERY_MS is "off"."""
+        threshold = os.environ.get("SLOW_QUERY_MS", "200").strip().lower()
+        if threshold in ("", "off", "none"):
+            return None
+        return cls(
+            threshold_ms=float(threshold),
+            capacity=int(os.environ.get("SLOW_QUERY_LOG_SIZE", "100")),
+            explain=os.environ.get("SLOW_QUERY_EXPLAIN", "0").strip().lower() in ("1", "true", "yes", "on"),
+        )
+
+    def install(self, engine):
+        @event.listens_for(engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info.get("slow_query_started")
+            if not started:
+                return
+            seconds = time.perf_counter() - started.pop()
+            if seconds >= self.threshold and not conn.get_execution_options().get(_SKIP):
+                self.record(engine, statement, parameters, seconds)
+
+        return engine
+
+    def record(self, engine, statement: str, parameters, seconds: float):
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(),
+            "route": current_route(),
+            "duration_ms": round(seconds * 1000, 2),
+            "statement": statement,
+            "parameters": redact(parameters),
+        }
+        with self._lock:
+            known = any(previous["statement"] == statement for previous in self._entries)
+            if len(self._entries) == self._entries.maxlen:
+                evicted = self._entries[0]["statement"]
+                if sum(previous["statement"] == evicted for previous in self._entries) == 1:
+                    self._plans.pop(evicted, None)
+            self._entries.append(entry)
+        logger.warning("Slow query (%.1f ms) in %s: %s", entry["duration_ms"], entry["route"], statement)
+        if self.explain and not known and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self._explain_later(engine, statement, parameters)
+
+    def entries(self) -> List[dict]:
+        """Recorded statements, most recent first, with their plan once captured."""
+        with self._lock:
+            return [
+                dict(entry, plan=self._plans.get(entry["statement"]))
+                for entry in reversed(self._entries)
+            ]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._plans.clear()
+
+    def _explain_later(self, engine, statement: str, parameters):
+        with self._lock:
+            if self._explainer is None:
+                self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        self._explainer.submit(self._explain, engine, statement, parameters)
+
+    def _explain(self, engine, statement: str, parameters):
+        if engine.dialect.name == "postgresql":
+            prefix = "EXPLAIN (ANALYZE, BUFFERS)"
+        elif engine.dialect.name == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN"
+        else:
+            prefix = "EXPLAIN"
+        try:
+            with engine.connect().execution_options(**{_SKIP: True}) as connection:
+                with connection.begin() as transaction:
+                    rows = connection.exec_driver_sql(f"{prefix} {statement}", parameters).fetchall()
+                    transaction.rollback()
+        except Exception:
+            logger.warning("Could not explain slow query: %s", statement, exc_info=True)
+            return
+        plan = "\n".join(" ".join(str(column) for column in row) for row in rows)
+        with self._lock:
+            if any(entry["statement"] == statement for entry in self._entries):
+                self._plans[statement] = plan
@@ -0,0 +1,177 @@
+"""Per-request phase timers, returned in a Server-Timing header.
+
+Code that does a distinct kind of work wraps it in `with phase("db"):`, or
+is decorated with `@timed("db")`.
+ServerTimingMiddleware gives each request a Timings in a context variable,
+so phases opened in the threadpool, where the sync handlers run, add to it.
+The response gets a header such as
+
+    Server-Timing: altcha;dur=0.4, db;dur=18.2, smtp;dur=412.0, serialization;dur=1.1, total;dur=433.9
+
+and the same durations are logged with the request, in the `server_timing`
+field of the log record.
+
+"serialization" is the time between the endpoint returning and the response
+starting: FastAPI validating the returned value against the response model
+and encoding it. TimedRoute marks the moment the endpoint returns.
+
+Outside a request, or when the middleware is not installed, phase() returns
+a shared no-op context manager after one context variable lookup.
+"""
+import functools
+import inspect
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from fastapi.routing import APIRoute
+
+from infrastructure.observability.profiling import profiled
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+_current: ContextVar[Optional["Timings"]] = ContextVar("server_timings", default=None)
+
+
+class Timings:
+    """Milliseconds spent in each phase of one request."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.returned: Optional[float] = None
+        self._open = set()
+
+    def add(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds * 1000
+
+    def header(self) -> str:
+        return ", ".join(f"{name};dur={ms:.1f}" for name, ms in self.phases.items())
+
+
+class _Phase:
+    __slots__ = ("timings", "name", "started")
+
+    def __init__(self, timings: Timings, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        self.timings._open.add(self.name)
+
+    def __exit__(self, *exc_info):
+        self.timings._open.discard(self.name)
+        self.timings.add(self.name, time.perf_counter() - self.started)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name: str):
+    """Time the block as phase name of the current request.
+
+    A phase opened inside the same phase (a service method calling another)
+    is counted once, by the outer block.
+    """
+    timings = _current.get()
+    if timings is None or name in timings._open:
+        return _NO_PHASE
+    return _Phase(timings, name)
+
+
+def timed(name: str):
+    """Decorator running the whole function as phase name."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def server_timing_enabled() -> bool:
+    """SERVER_TIMING, on by default everywhere but ENV=production."""
+    default = "0" if os.environ.get("ENV") == "production" else "1"
+    return os.environ.get("SERVER_TIMING", default).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _mark_return(endpoint):
+    """Wrap endpoint to record when it returns in the request's Timings."""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def marked(*args, **kwargs):
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                timings = _current.get()
+                if timings is not None:
+                    timings.returned = time.perf_counter()
+    else:
+        @functools.wraps(endpoint)
+        def marked(*args, **kwargs):
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                timings = _current.get()
+                if timings is not None:
+                    timings.returned = time.perf_counter()
+    return marked
+
+
+class TimedRoute(APIRoute):
+    """APIRoute whose responses report their serialization time, and whose endpoint can be profiled."""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, _mark_return(profiled(endpoint)), **kwargs)
+
+
+class ServerTimingMiddleware:
+    """Adds the Server-Timing header, with a total, and logs the phases of each request."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = Timings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+
+        async def send_with_timings(message):
+            if message["type"] == "http.response.start":
+                now = time.perf_counter()
+                if timings.returned is not None:
+                    timings.add("serialization", now - timings.returned)
+                timings.add("total", now - started)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (SERVER_TIMING_HEADER.lower().encode("latin-1"), timings.header().encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            _current.reset(token)
+
+        logger.info(
+            "%s %s: %s", scope["method"], scope["path"], timings.header(),
+            extra={"server_timing": {name: round(ms, 1) for name, ms in timings.phases.items()}},
+        )
@@ -2,6 +2,7 @@
 
 from .fingerprint_mapper import FingerprintMapper
 from .report_mapper import ReportMapper
+from .visitor_session_mapper import VisitorSessionMapper
 from .note_mapper import NoteMapper, NoteReasonMapper
 from .contact_mapper import ContactMapper
 from .company_mapper import CompanyMapper
@@ -13,6 +14,7 @@ from .email_mapper import EmailAccountMapper, ClassifiedEmailMapper, EmailClassi
 __all__ = [
     'FingerprintMapper',
     'ReportMapper',
+    'VisitorSessionMapper',
     'NoteMapper',
     'NoteReasonMapper',
     'ContactMapper',
@@ -1,9 +1,68 @@
 """Fingerprint mapper - converts between domain entity and ORM model."""
 
+import os
+from typing import Any, Dict, Optional
+
 from domain.entities.fingerprint import Fingerprint
 from infrastructure.persistence.models import FingerprintModel as FingerprintORM
 
 
+# Component fields promoted to indexed columns on the fingerprints table.
+# Keys are column names, values are dotted paths into the ``components`` payload.
+DEFAULT_INDEXED_COMPONENT_PATHS = {
+    "timezone": "timezone",
+    "platform": "platform",
+    "screen_resolution": "screenResolution",
+}
+
+
+def _load_indexed_component_paths() -> Dict[str, str]:
+    """
+    Read the component paths, optionally overridden with
+    FINGERPRINT_INDEXED_COMPONENTS="timezone=timezone,platform=platform.value".
+    """
+    paths = dict(DEFAULT_INDEXED_COMPONENT_PATHS)
+    override = os.environ.get("FINGERPRINT_INDEXED_COMPONENTS", "")
+    for item in filter(None, (part.strip() for part in override.split(","))):
+        column, _, path = item.partition("=")
+        column, path = column.strip(), path.strip()
+        if column not in DEFAULT_INDEXED_COMPONENT_PATHS or not path:
+            raise ValueError(f"Invalid FINGERPRINT_INDEXED_COMPONENTS entry: '{item}'")
+        paths[column] = path
+    return paths
+
+
+INDEXED_COMPONENT_PATHS = _load_indexed_component_paths()
+
+
+def _normalize_component_value(value: Any) -> Optional[str]:
+    """Flatten a component value into the string stored in its column."""
+    # FingerprintJS wraps every component as {"value": ..., "duration": ...}
+    if isinstance(value, dict):
+        if "value" not in value:
+            return None
+        value = value["value"]
+    if value is None or isinstance(value, dict):
+        return None
+    if isinstance(value, (list, tuple)):
+        return "x".join(str(v) for v in value)
+    return str(value)
+
+
+def extract_indexed_components(components: Optional[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+    """Extract the configured component paths from a fingerprint payload."""
+    extracted = {}
+    for column, path in INDEXED_COMPONENT_PATHS.items():
+        value = components or {}
+        for key in path.split("."):
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+        extracted[column] = _normalize_component_value(value)
+    return extracted
+
+
 class FingerprintMapper:
     """Maps between Fingerprint domain entity and Fingerprint ORM."""
 
@@ -16,7 +75,11 @@ class FingerprintMapper:
         return Fingerprint(
             visitor_id=model.visitorId,
             components=model.components,
-            created_at=model.created_at
+            created_at=model.created_at,
+            timezone=model.timezone,
+            platform=model.platform,
+            screen_resolution=model.screen_resolution,
+            minhash_signature=model.minhash_signature
         )
 
     @staticmethod
@@ -28,5 +91,14 @@ class FingerprintMapper:
         return FingerprintORM(
             visitorId=entity.visitor_id,
             components=entity.components,
-            created_at=entity.created_at
+            created_at=entity.created_at,
+            minhash_signature=entity.minhash_signature,
+            **extract_indexed_components(entity.components)
         )
+
+    @staticmethod
+    def apply_components(model: FingerprintORM, components: Dict[str, Any]) -> None:
+        """Update an ORM model's components along with its indexed columns."""
+        model.components = components
+        for column, value in extract_indexed_components(components).items():
+            setattr(model, column, value)
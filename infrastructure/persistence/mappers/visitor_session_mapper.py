@@ -0,0 +1,40 @@
+"""Visitor session mapper - converts between domain entity and ORM model."""
+
+from domain.entities.visitor_session import VisitorSession
+from infrastructure.persistence.models import VisitorSessionModel as VisitorSessionORM
+
+
+class VisitorSessionMapper:
+    """Maps between VisitorSession domain entity and VisitorSession ORM."""
+
+    @staticmethod
+    def to_domain(model: VisitorSessionORM) -> VisitorSession:
+        """Convert ORM model to domain entity."""
+        if not model:
+            return None
+
+        return VisitorSession(
+            id=model.id,
+            visitor_id=model.visitorId,
+            started_at=model.started_at,
+            ended_at=model.ended_at,
+            pages=list(model.pages or []),
+            report_count=model.report_count,
+            last_report_id=model.last_report_id
+        )
+
+    @staticmethod
+    def to_model(entity: VisitorSession) -> VisitorSessionORM:
+        """Convert domain entity to ORM model."""
+        if not entity:
+            return None
+
+        return VisitorSessionORM(
+            id=entity.id,
+            visitorId=entity.visitor_id,
+            started_at=entity.started_at,
+            ended_at=entity.ended_at,
+            pages=list(entity.pages),
+            report_count=entity.report_count,
+            last_report_id=entity.last_report_id
+        )
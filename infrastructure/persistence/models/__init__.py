@@ -16,6 +16,8 @@ from .lead_modification_log_model import LeadModificationLogModel
 from .note_model import NoteModel, NoteReasonModel
 from .fingerprint_model import FingerprintModel
 from .report_model import ReportModel
+from .visitor_link_models import FingerprintLshBucketModel, VisitorLinkModel
+from .visitor_session_model import VisitorSessionModel, JobWatermarkModel
 from .email_model import EmailAccountModel, ClassifiedEmailModel, EmailClassificationHistoryModel
 
 __all__ = [
@@ -37,6 +39,10 @@ __all__ = [
     'NoteReasonModel',
     'FingerprintModel',
     'ReportModel',
+    'FingerprintLshBucketModel',
+    'VisitorLinkModel',
+    'VisitorSessionModel',
+    'JobWatermarkModel',
     'EmailAccountModel',
     'ClassifiedEmailModel',
     'EmailClassificationHistoryModel',
@@ -2,7 +2,7 @@
 
 from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, func
 from sqlalchemy.orm import relationship
-from infrastructure.database import Base
+from infrastructure.database import Base, GUARDED_LAZY
 
 
 class EmailAccountModel(Base):
@@ -50,9 +50,9 @@ class ClassifiedEmailModel(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    email_account = relationship("EmailAccountModel", back_populates="classified_emails")
-    lead = relationship("LeadModel")
-    classification_history = relationship("EmailClassificationHistoryModel", back_populates="classified_email")
+    email_account = relationship("EmailAccountModel", back_populates="classified_emails", lazy=GUARDED_LAZY)
+    lead = relationship("LeadModel", lazy=GUARDED_LAZY)
+    classification_history = relationship("EmailClassificationHistoryModel", back_populates="classified_email", lazy=GUARDED_LAZY)
 
 
 class EmailClassificationHistoryModel(Base):
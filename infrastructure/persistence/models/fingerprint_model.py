@@ -12,3 +12,11 @@ class FingerprintModel(Base):
     visitorId = Column(String, primary_key=True, index=True)
     components = Column(JSON, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Component fields promoted to indexed columns (see FingerprintMapper)
+    timezone = Column(String, nullable=True, index=True)
+    platform = Column(String, nullable=True, index=True)
+    screen_resolution = Column(String, nullable=True, index=True)
+
+    # MinHash signature used for near-duplicate visitor linking
+    minhash_signature = Column(JSON, nullable=True)
@@ -3,7 +3,7 @@
 from sqlalchemy import Column, Integer, String, DateTime, func, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
-from infrastructure.database import Base
+from infrastructure.database import Base, GUARDED_LAZY
 
 
 class LeadModel(Base):
@@ -22,24 +22,25 @@ class LeadModel(Base):
     maturity_score = Column(Integer, nullable=True)
     urgency_id = Column(Integer, ForeignKey("lead_urgencies.id"), nullable=True)
     status_id = Column(Integer, ForeignKey("lead_statuses.id"), nullable=False)
-    fingerprint_visitor_id = Column(String, ForeignKey("fingerprints.visitorId"), nullable=True)
+    # Visitor in the analytics tables, which may live in another database:
+    # no foreign key, resolve it through the fingerprint repository.
+    fingerprint_visitor_id = Column(String, nullable=True)
     altcha_solution = Column(String, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    fingerprint = relationship("FingerprintModel")
-    contact = relationship("ContactModel", back_populates="leads")
-    company = relationship("CompanyModel", back_populates="leads")
-    status = relationship("LeadStatusModel")
-    urgency = relationship("LeadUrgencyModel")
-    recommended_pack = relationship("RecommendedPackModel")
-    positions = relationship("PositionModel", secondary="lead_positions")
-    concerns = relationship("ConcernModel", secondary="lead_concerns")
-    attachments = relationship("LeadAttachmentModel", back_populates="lead")
-    history = relationship("LeadHistoryModel", back_populates="lead")
-    notes = relationship("NoteModel", back_populates="lead")
-    modification_logs = relationship("LeadModificationLogModel", back_populates="lead")
+    contact = relationship("ContactModel", back_populates="leads", lazy=GUARDED_LAZY)
+    company = relationship("CompanyModel", back_populates="leads", lazy=GUARDED_LAZY)
+    status = relationship("LeadStatusModel", lazy=GUARDED_LAZY)
+    urgency = relationship("LeadUrgencyModel", lazy=GUARDED_LAZY)
+    recommended_pack = relationship("RecommendedPackModel", lazy=GUARDED_LAZY)
+    positions = relationship("PositionModel", secondary="lead_positions", lazy=GUARDED_LAZY)
+    concerns = relationship("ConcernModel", secondary="lead_concerns", lazy=GUARDED_LAZY)
+    attachments = relationship("LeadAttachmentModel", back_populates="lead", lazy=GUARDED_LAZY)
+    history = relationship("LeadHistoryModel", back_populates="lead", lazy=GUARDED_LAZY)
+    notes = relationship("NoteModel", back_populates="lead", lazy=GUARDED_LAZY)
+    modification_logs = relationship("LeadModificationLogModel", back_populates="lead", lazy=GUARDED_LAZY)
 
     @hybrid_property
     def potential_score(self):
@@ -1,6 +1,6 @@
 """Report ORM model - infrastructure layer."""
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from infrastructure.database import Base
 
@@ -9,6 +9,9 @@ class ReportModel(Base):
     """SQLAlchemy ORM model for reports - infrastructure concern."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        Index('ix_reports_visitorId_created_at', 'visitorId', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     visitorId = Column(String, ForeignKey("fingerprints.visitorId"), nullable=False)
@@ -0,0 +1,21 @@
+"""Visitor linking ORM models - infrastructure layer."""
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, func
+from infrastructure.database import Base
+
+
+class FingerprintLshBucketModel(Base):
+    """ORM Model for the LSH buckets a fingerprint's MinHash bands fall into."""
+    __tablename__ = 'fingerprint_lsh_buckets'
+
+    bucket = Column(String, primary_key=True)
+    visitorId = Column(String, ForeignKey('fingerprints.visitorId'), primary_key=True, index=True)
+
+
+class VisitorLinkModel(Base):
+    """ORM Model for the cluster of near-duplicate visitors a visitor belongs to."""
+    __tablename__ = 'visitor_links'
+
+    visitorId = Column(String, ForeignKey('fingerprints.visitorId'), primary_key=True)
+    cluster_id = Column(String, nullable=False, index=True)
+    linked_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,29 @@
+"""Visitor session ORM models - infrastructure layer."""
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index, func
+from infrastructure.database import Base
+
+
+class VisitorSessionModel(Base):
+    """ORM Model for a reconstructed visitor session - infrastructure concern."""
+    __tablename__ = 'sessions'
+    __table_args__ = (
+        Index('ix_sessions_visitorId_started_at', 'visitorId', 'started_at'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    visitorId = Column(String, ForeignKey('fingerprints.visitorId'), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=False)
+    ended_at = Column(DateTime(timezone=True), nullable=False)
+    pages = Column(JSON, nullable=False)
+    report_count = Column(Integer, nullable=False, default=0)
+    last_report_id = Column(Integer, nullable=True)
+
+
+class JobWatermarkModel(Base):
+    """ORM Model for the last row a batch job has processed."""
+    __tablename__ = 'job_watermarks'
+
+    name = Column(String, primary_key=True)
+    last_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
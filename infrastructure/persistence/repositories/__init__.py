@@ -1,7 +1,14 @@
-"""Repository implementations - infrastructure layer implements domain interfaces."""
+"""Repository implementations - infrastructure layer implements domain interfaces.
+
+Keyed lookups on hot paths are module-level select() statements with bound
+parameters. Each call only binds values: SQLAlchemy derives the cache key
+from a statement it has seen before and reuses the compiled SQL, instead of
+building a Query chain and its ORM compile state on every call.
+"""
 
 from .sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
 from .sqlalchemy_report_repository import SqlAlchemyReportRepository
+from .sqlalchemy_visitor_session_repository import SqlAlchemyVisitorSessionRepository
 from .sqlalchemy_note_repository import SqlAlchemyNoteRepository
 from .sqlalchemy_contact_repository import SqlAlchemyContactRepository
 from .sqlalchemy_company_repository import SqlAlchemyCompanyRepository
@@ -13,6 +20,7 @@ from .sqlalchemy_email_repository import SqlAlchemyEmailAccountRepository, SqlAl
 __all__ = [
     'SqlAlchemyFingerprintRepository',
     'SqlAlchemyReportRepository',
+    'SqlAlchemyVisitorSessionRepository',
     'SqlAlchemyNoteRepository',
     'SqlAlchemyContactRepository',
     'SqlAlchemyCompanyRepository',
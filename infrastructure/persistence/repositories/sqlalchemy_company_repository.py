@@ -1,6 +1,7 @@
 """SQLAlchemy implementation of CompanyRepository."""
 
 from typing import Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from domain.repositories.company_repository import CompanyRepository
@@ -8,6 +9,9 @@ from domain.entities.company import Company
 from infrastructure.persistence.models import CompanyModel as CompanyORM
 from infrastructure.persistence.mappers.company_mapper import CompanyMapper
 
+_BY_ID = select(CompanyORM).where(CompanyORM.id == bindparam("company_id"))
+_BY_NAME = select(CompanyORM).where(CompanyORM.name == bindparam("name"))
+
 
 class SqlAlchemyCompanyRepository(CompanyRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -17,8 +21,8 @@ class SqlAlchemyCompanyRepository(CompanyRepository):
 
     def save(self, company: Company) -> Company:
         """Persist a new or updated company."""
-        existing_model = self._session.query(CompanyORM).filter(
-            CompanyORM.id == company.id
+        existing_model = self._session.scalars(
+            _BY_ID, {"company_id": company.id}
         ).one_or_none() if company.id else None
 
         if existing_model:
@@ -36,17 +40,13 @@ class SqlAlchemyCompanyRepository(CompanyRepository):
 
     def find_by_name(self, name: str) -> Optional[Company]:
         """Find company by name."""
-        model = self._session.query(CompanyORM).filter(
-            CompanyORM.name == name
-        ).one_or_none()
+        model = self._session.scalars(_BY_NAME, {"name": name}).one_or_none()
 
         return CompanyMapper.to_domain(model) if model else None
 
     def find_by_id(self, company_id: int) -> Optional[Company]:
         """Find company by ID."""
-        model = self._session.query(CompanyORM).filter(
-            CompanyORM.id == company_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"company_id": company_id}).one_or_none()
 
         return CompanyMapper.to_domain(model) if model else None
 
@@ -1,6 +1,7 @@
 """SQLAlchemy implementation of ConcernRepository."""
 
 from typing import Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from domain.repositories.concern_repository import ConcernRepository
@@ -8,6 +9,9 @@ from domain.entities.concern import Concern
 from infrastructure.persistence.models import ConcernModel as ConcernORM
 from infrastructure.persistence.mappers.concern_mapper import ConcernMapper
 
+_BY_ID = select(ConcernORM).where(ConcernORM.id == bindparam("concern_id"))
+_BY_LABEL = select(ConcernORM).where(ConcernORM.label == bindparam("label"))
+
 
 class SqlAlchemyConcernRepository(ConcernRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -25,16 +29,12 @@ class SqlAlchemyConcernRepository(ConcernRepository):
 
     def find_by_label(self, label: str) -> Optional[Concern]:
         """Find concern by label."""
-        model = self._session.query(ConcernORM).filter(
-            ConcernORM.label == label
-        ).one_or_none()
+        model = self._session.scalars(_BY_LABEL, {"label": label}).one_or_none()
 
         return ConcernMapper.to_domain(model) if model else None
 
     def find_by_id(self, concern_id: int) -> Optional[Concern]:
         """Find concern by ID."""
-        model = self._session.query(ConcernORM).filter(
-            ConcernORM.id == concern_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"concern_id": concern_id}).one_or_none()
 
         return ConcernMapper.to_domain(model) if model else None
@@ -1,6 +1,7 @@
 """SQLAlchemy implementation of ContactRepository."""
 
 from typing import Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from domain.repositories.contact_repository import ContactRepository
@@ -8,6 +9,9 @@ from domain.entities.contact import Contact
 from infrastructure.persistence.models import ContactModel as ContactORM
 from infrastructure.persistence.mappers.contact_mapper import ContactMapper
 
+_BY_ID = select(ContactORM).where(ContactORM.id == bindparam("contact_id"))
+_BY_EMAIL = select(ContactORM).where(ContactORM.email == bindparam("email"))
+
 
 class SqlAlchemyContactRepository(ContactRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -17,8 +21,8 @@ class SqlAlchemyContactRepository(ContactRepository):
 
     def save(self, contact: Contact) -> Contact:
         """Persist a new or updated contact."""
-        existing_model = self._session.query(ContactORM).filter(
-            ContactORM.id == contact.id
+        existing_model = self._session.scalars(
+            _BY_ID, {"contact_id": contact.id}
         ).one_or_none() if contact.id else None
 
         if existing_model:
@@ -40,17 +44,13 @@ class SqlAlchemyContactRepository(ContactRepository):
 
     def find_by_email(self, email: str) -> Optional[Contact]:
         """Find contact by email address."""
-        model = self._session.query(ContactORM).filter(
-            ContactORM.email == email
-        ).one_or_none()
+        model = self._session.scalars(_BY_EMAIL, {"email": email}).one_or_none()
 
         return ContactMapper.to_domain(model) if model else None
 
     def find_by_id(self, contact_id: int) -> Optional[Contact]:
         """Find contact by ID."""
-        model = self._session.query(ContactORM).filter(
-            ContactORM.id == contact_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"contact_id": contact_id}).one_or_none()
 
         return ContactMapper.to_domain(model) if model else None
 
@@ -1,6 +1,7 @@
 """SQLAlchemy implementation of Email repositories."""
 
 from typing import List, Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 
 from domain.repositories.email_repository import EmailAccountRepository, ClassifiedEmailRepository
@@ -16,6 +17,14 @@ from infrastructure.persistence.mappers.email_mapper import (
     EmailClassificationHistoryMapper
 )
 
+_ACCOUNT_BY_ID = select(EmailAccountORM).where(EmailAccountORM.id == bindparam("account_id"))
+_EMAIL_BY_ID = select(ClassifiedEmailORM).where(ClassifiedEmailORM.id == bindparam("email_id"))
+_EMAIL_BY_ID_WITH_HISTORY = _EMAIL_BY_ID.options(joinedload(ClassifiedEmailORM.classification_history))
+_EMAIL_BY_ACCOUNT_AND_IMAP_ID = select(ClassifiedEmailORM).where(
+    ClassifiedEmailORM.email_account_id == bindparam("account_id"),
+    ClassifiedEmailORM.imap_id == bindparam("imap_id")
+)
+
 
 class SqlAlchemyEmailAccountRepository(EmailAccountRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -33,9 +42,7 @@ class SqlAlchemyEmailAccountRepository(EmailAccountRepository):
 
     def find_by_id(self, account_id: int) -> Optional[EmailAccount]:
         """Find email account by ID."""
-        model = self._session.query(EmailAccountORM).filter(
-            EmailAccountORM.id == account_id
-        ).one_or_none()
+        model = self._session.scalars(_ACCOUNT_BY_ID, {"account_id": account_id}).one_or_none()
 
         return EmailAccountMapper.to_domain(model) if model else None
 
@@ -46,9 +53,7 @@ class SqlAlchemyEmailAccountRepository(EmailAccountRepository):
 
     def update(self, account: EmailAccount) -> EmailAccount:
         """Update existing email account."""
-        model = self._session.query(EmailAccountORM).filter(
-            EmailAccountORM.id == account.id
-        ).one_or_none()
+        model = self._session.scalars(_ACCOUNT_BY_ID, {"account_id": account.id}).one_or_none()
 
         if not model:
             raise ValueError(f"EmailAccount {account.id} not found")
@@ -68,9 +73,7 @@ class SqlAlchemyEmailAccountRepository(EmailAccountRepository):
 
     def delete(self, account_id: int) -> bool:
         """Delete an email account."""
-        model = self._session.query(EmailAccountORM).filter(
-            EmailAccountORM.id == account_id
-        ).one_or_none()
+        model = self._session.scalars(_ACCOUNT_BY_ID, {"account_id": account_id}).one_or_none()
 
         if not model:
             return False
@@ -96,11 +99,9 @@ class SqlAlchemyClassifiedEmailRepository(ClassifiedEmailRepository):
 
     def find_by_id(self, email_id: int) -> Optional[ClassifiedEmail]:
         """Find classified email by ID."""
-        model = self._session.query(ClassifiedEmailORM).options(
-            joinedload(ClassifiedEmailORM.classification_history)
-        ).filter(
-            ClassifiedEmailORM.id == email_id
-        ).one_or_none()
+        model = self._session.scalars(
+            _EMAIL_BY_ID_WITH_HISTORY, {"email_id": email_id}
+        ).unique().one_or_none()
 
         return ClassifiedEmailMapper.to_domain(model) if model else None
 
@@ -108,9 +109,8 @@ class SqlAlchemyClassifiedEmailRepository(ClassifiedEmailRepository):
         self, account_id: int, imap_id: str
     ) -> Optional[ClassifiedEmail]:
         """Find email by account and IMAP ID."""
-        model = self._session.query(ClassifiedEmailORM).filter(
-            ClassifiedEmailORM.email_account_id == account_id,
-            ClassifiedEmailORM.imap_id == imap_id
+        model = self._session.scalars(
+            _EMAIL_BY_ACCOUNT_AND_IMAP_ID, {"account_id": account_id, "imap_id": imap_id}
         ).one_or_none()
 
         return ClassifiedEmailMapper.to_domain(model) if model else None
@@ -139,9 +139,7 @@ class SqlAlchemyClassifiedEmailRepository(ClassifiedEmailRepository):
 
     def update(self, email: ClassifiedEmail) -> ClassifiedEmail:
         """Update existing classified email."""
-        model = self._session.query(ClassifiedEmailORM).filter(
-            ClassifiedEmailORM.id == email.id
-        ).one_or_none()
+        model = self._session.scalars(_EMAIL_BY_ID, {"email_id": email.id}).one_or_none()
 
         if not model:
             raise ValueError(f"ClassifiedEmail {email.id} not found")
@@ -159,9 +157,7 @@ class SqlAlchemyClassifiedEmailRepository(ClassifiedEmailRepository):
 
     def delete(self, email_id: int) -> bool:
         """Delete a classified email."""
-        model = self._session.query(ClassifiedEmailORM).filter(
-            ClassifiedEmailORM.id == email_id
-        ).one_or_none()
+        model = self._session.scalars(_EMAIL_BY_ID, {"email_id": email_id}).one_or_none()
 
         if not model:
             return False
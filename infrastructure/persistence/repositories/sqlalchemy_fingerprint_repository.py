@@ -1,12 +1,22 @@
 """SQLAlchemy implementation of FingerprintRepository."""
 
-from typing import Optional
+from typing import Dict, List, Optional
+from sqlalchemy import bindparam, delete, insert, select, union_all, update
 from sqlalchemy.orm import Session
 
 from domain.repositories.fingerprint_repository import FingerprintRepository
 from domain.entities.fingerprint import Fingerprint
-from infrastructure.persistence.models import FingerprintModel as FingerprintORM
-from infrastructure.persistence.mappers.fingerprint_mapper import FingerprintMapper
+from infrastructure.persistence.models import (
+    FingerprintModel as FingerprintORM,
+    FingerprintLshBucketModel as FingerprintLshBucketORM,
+    VisitorLinkModel as VisitorLinkORM
+)
+from infrastructure.persistence.mappers.fingerprint_mapper import (
+    INDEXED_COMPONENT_PATHS, FingerprintMapper, extract_indexed_components
+)
+
+_BY_VISITOR_ID = select(FingerprintORM).where(FingerprintORM.visitorId == bindparam("visitor_id"))
+_EXISTS = select(FingerprintORM.visitorId).where(FingerprintORM.visitorId == bindparam("visitor_id")).limit(1)
 
 
 class SqlAlchemyFingerprintRepository(FingerprintRepository):
@@ -16,37 +26,150 @@ class SqlAlchemyFingerprintRepository(FingerprintRepository):
         self._session = session
 
     def save(self, fingerprint: Fingerprint) -> Fingerprint:
-        """Persist a new or updated fingerprint."""
+        """Persist a new or updated fingerprint along with its LSH buckets."""
         # Check if fingerprint already exists in the database
-        existing_model = self._session.query(FingerprintORM).filter(
-            FingerprintORM.visitorId == fingerprint.visitor_id
+        existing_model = self._session.scalars(
+            _BY_VISITOR_ID, {"visitor_id": fingerprint.visitor_id}
         ).one_or_none()
 
         if existing_model:
             # Update existing record
-            existing_model.components = fingerprint.components
+            FingerprintMapper.apply_components(existing_model, fingerprint.components)
             existing_model.created_at = fingerprint.created_at
+            existing_model.minhash_signature = fingerprint.minhash_signature
             model = existing_model
+            self._session.execute(
+                delete(FingerprintLshBucketORM).where(
+                    FingerprintLshBucketORM.visitorId == fingerprint.visitor_id
+                ),
+                execution_options={"synchronize_session": False}
+            )
         else:
             # Create new record
             model = FingerprintMapper.to_model(fingerprint)
             self._session.add(model)
+            # Buckets reference the fingerprint row, make sure it is inserted first
+            self._session.flush()
+
+        if fingerprint.lsh_buckets:
+            self._session.execute(insert(FingerprintLshBucketORM), [
+                {"bucket": bucket, "visitorId": fingerprint.visitor_id}
+                for bucket in fingerprint.lsh_buckets
+            ])
 
         self._session.commit()
         self._session.refresh(model)
-        return FingerprintMapper.to_domain(model)
+        saved = FingerprintMapper.to_domain(model)
+        saved.lsh_buckets = list(fingerprint.lsh_buckets)
+        return saved
 
     def find_by_visitor_id(self, visitor_id: str) -> Optional[Fingerprint]:
         """Find fingerprint by visitor ID."""
-        model = self._session.query(FingerprintORM).filter(
-            FingerprintORM.visitorId == visitor_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_VISITOR_ID, {"visitor_id": visitor_id}).one_or_none()
 
         return FingerprintMapper.to_domain(model) if model else None
 
     def exists(self, visitor_id: str) -> bool:
         """Check if fingerprint exists."""
-        count = self._session.query(FingerprintORM).filter(
-            FingerprintORM.visitorId == visitor_id
-        ).count()
-        return count > 0
+        return self._session.scalar(_EXISTS, {"visitor_id": visitor_id}) is not None
+
+    def find_by_components(
+        self, filters: Dict[str, str], limit: int = 100, offset: int = 0
+    ) -> List[Fingerprint]:
+        """Find fingerprints matching indexed component values."""
+        query = self._session.query(FingerprintORM)
+        for column, value in filters.items():
+            query = query.filter(getattr(FingerprintORM, column) == value)
+
+        models = query.order_by(FingerprintORM.created_at.desc()).offset(offset).limit(limit).all()
+        return [FingerprintMapper.to_domain(m) for m in models]
+
+    def find_page(
+        self, after_visitor_id: Optional[str] = None, limit: int = 500, unsigned_only: bool = False
+    ) -> List[Fingerprint]:
+        """Find the next page of fingerprints ordered by visitor ID."""
+        query = self._session.query(FingerprintORM)
+        if after_visitor_id is not None:
+            query = query.filter(FingerprintORM.visitorId > after_visitor_id)
+        if unsigned_only:
+            query = query.filter(FingerprintORM.minhash_signature.is_(None))
+
+        models = query.order_by(FingerprintORM.visitorId).limit(limit).all()
+        return [FingerprintMapper.to_domain(m) for m in models]
+
+    def reextract_indexed_components(self, batch_size: int = 1000) -> int:
+        """Refill the indexed component columns from the stored components; returns the rows changed."""
+        table = FingerprintORM.__table__
+        columns = list(INDEXED_COMPONENT_PATHS)
+        # One executemany per page, for the rows whose columns differ only
+        refill = update(table).where(table.c.visitorId == bindparam("b_visitor_id")).values(
+            {column: bindparam(f"b_{column}") for column in columns}
+        )
+        changed = 0
+        after: Optional[str] = None
+        while True:
+            query = select(table.c.visitorId, table.c.components, *(table.c[column] for column in columns))
+            if after is not None:
+                query = query.where(table.c.visitorId > after)
+            rows = self._session.execute(query.order_by(table.c.visitorId).limit(batch_size)).all()
+            if not rows:
+                return changed
+            updates = []
+            for row in rows:
+                values = extract_indexed_components(row.components)
+                if any(row._mapping[column] != values[column] for column in columns):
+                    updates.append({"b_visitor_id": row.visitorId, **{f"b_{c}": values[c] for c in columns}})
+            if updates:
+                self._session.execute(refill, updates)
+                self._session.commit()
+                changed += len(updates)
+            after = rows[-1].visitorId
+
+    def find_lsh_candidates(
+        self, buckets: List[str], exclude_visitor_id: str, per_bucket: int = 50
+    ) -> List[Fingerprint]:
+        """Find fingerprints sharing at least one LSH bucket, at most per_bucket per bucket."""
+        if not buckets:
+            return []
+
+        # One primary key range scan per bucket: the members with the lowest
+        # visitor IDs, so a bucket holding thousands of identical devices costs
+        # per_bucket rows, and every member of it meets the same few.
+        per_bucket_members = [
+            select(FingerprintLshBucketORM.visitorId).where(
+                FingerprintLshBucketORM.bucket == bucket,
+                FingerprintLshBucketORM.visitorId != exclude_visitor_id
+            ).order_by(FingerprintLshBucketORM.visitorId).limit(per_bucket).subquery()
+            for bucket in buckets
+        ]
+        members = union_all(*(select(sub.c.visitorId) for sub in per_bucket_members)).subquery()
+
+        models = self._session.scalars(
+            select(FingerprintORM).where(FingerprintORM.visitorId.in_(select(members.c.visitorId)))
+        ).all()
+        return [FingerprintMapper.to_domain(m) for m in models]
+
+    def find_cluster_members(self, visitor_id: str) -> List[str]:
+        """Find the other visitor IDs linked into the same cluster."""
+        cluster_id = self._session.query(VisitorLinkORM.cluster_id).filter(
+            VisitorLinkORM.visitorId == visitor_id
+        ).scalar_subquery()
+
+        rows = self._session.query(VisitorLinkORM.visitorId).filter(
+            VisitorLinkORM.cluster_id == cluster_id,
+            VisitorLinkORM.visitorId != visitor_id
+        ).all()
+        return [row.visitorId for row in rows]
+
+    def replace_visitor_links(self, clusters: Dict[str, str], batch_size: int = 1000) -> None:
+        """Replace all visitor links with the given visitor ID -> cluster ID mapping."""
+        self._session.query(VisitorLinkORM).delete(synchronize_session=False)
+
+        rows = [
+            {"visitorId": visitor_id, "cluster_id": cluster_id}
+            for visitor_id, cluster_id in clusters.items()
+        ]
+        for start in range(0, len(rows), batch_size):
+            self._session.execute(insert(VisitorLinkORM), rows[start:start + batch_size])
+
+        self._session.commit()
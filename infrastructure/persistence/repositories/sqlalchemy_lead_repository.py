@@ -1,13 +1,37 @@
 """SQLAlchemy implementation of LeadRepository."""
 
 from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from domain.repositories.lead_repository import LeadRepository
 from domain.entities.lead import Lead
 from infrastructure.persistence.models import LeadModel as LeadORM
 from infrastructure.persistence.mappers.lead_mapper import LeadMapper
 
+_BY_ID = select(LeadORM).where(LeadORM.id == bindparam("lead_id"))
+_BY_ID_WITH_RELATIONSHIPS = _BY_ID.options(
+    joinedload(LeadORM.contact),
+    joinedload(LeadORM.company),
+    joinedload(LeadORM.status),
+    joinedload(LeadORM.urgency),
+    joinedload(LeadORM.recommended_pack),
+    joinedload(LeadORM.positions),
+    joinedload(LeadORM.concerns)
+)
+
+# Everything LeadResponse serialises (potential_score reads company, urgency
+# and contact), loaded with the lead instead of lazily per row.
+_RESPONSE_LOADERS = (
+    joinedload(LeadORM.contact),
+    joinedload(LeadORM.company),
+    joinedload(LeadORM.status),
+    joinedload(LeadORM.urgency),
+    joinedload(LeadORM.recommended_pack),
+    selectinload(LeadORM.positions),
+    selectinload(LeadORM.concerns),
+)
+
 
 class SqlAlchemyLeadRepository(LeadRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -32,17 +56,10 @@ class SqlAlchemyLeadRepository(LeadRepository):
 
     def find_by_id(self, lead_id: int) -> Optional[Lead]:
         """Find lead by ID with all relationships loaded."""
-        model = self._session.query(LeadORM).options(
-            joinedload(LeadORM.contact),
-            joinedload(LeadORM.company),
-            joinedload(LeadORM.status),
-            joinedload(LeadORM.urgency),
-            joinedload(LeadORM.recommended_pack),
-            joinedload(LeadORM.positions),
-            joinedload(LeadORM.concerns)
-        ).filter(
-            LeadORM.id == lead_id
-        ).one_or_none()
+        # Joined collections repeat the lead row, unique() collapses them
+        model = self._session.scalars(
+            _BY_ID_WITH_RELATIONSHIPS, {"lead_id": lead_id}
+        ).unique().one_or_none()
 
         return LeadMapper.to_domain(model) if model else None
 
@@ -60,11 +77,25 @@ class SqlAlchemyLeadRepository(LeadRepository):
 
         return [LeadMapper.to_domain(m) for m in models]
 
+    def find_for_response(self, lead_id: int) -> Optional[LeadORM]:
+        """Load a lead for LeadResponse, refreshing any stale copy in the session."""
+        return self._session.query(LeadORM).options(*_RESPONSE_LOADERS).populate_existing().filter(
+            LeadORM.id == lead_id
+        ).one_or_none()
+
+    def find_all_for_response(self) -> List[LeadORM]:
+        """Load all leads for LeadResponse."""
+        return self._session.query(LeadORM).options(*_RESPONSE_LOADERS).all()
+
+    def find_by_visitor_ids_for_response(self, visitor_ids: List[str]) -> List[LeadORM]:
+        """Load the leads of any of the visitors for LeadResponse, newest first."""
+        return self._session.query(LeadORM).options(*_RESPONSE_LOADERS).filter(
+            LeadORM.fingerprint_visitor_id.in_(visitor_ids)
+        ).order_by(LeadORM.submission_date.desc()).all()
+
     def update(self, lead: Lead) -> Lead:
         """Update existing lead."""
-        model = self._session.query(LeadORM).filter(
-            LeadORM.id == lead.id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"lead_id": lead.id}).one_or_none()
 
         if not model:
             raise ValueError(f"Lead {lead.id} not found")
@@ -95,9 +126,7 @@ class SqlAlchemyLeadRepository(LeadRepository):
 
     def delete(self, lead_id: int) -> bool:
         """Delete a lead."""
-        model = self._session.query(LeadORM).filter(
-            LeadORM.id == lead_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"lead_id": lead_id}).one_or_none()
 
         if not model:
             return False
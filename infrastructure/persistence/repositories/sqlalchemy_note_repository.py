@@ -1,6 +1,7 @@
 """SQLAlchemy implementation of NoteRepository."""
 
 from typing import List, Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 
 from domain.repositories.note_repository import NoteRepository
@@ -8,6 +9,9 @@ from domain.entities.note import Note, NoteReason
 from infrastructure.persistence.models import NoteModel as NoteORM, NoteReasonModel as NoteReasonORM
 from infrastructure.persistence.mappers.note_mapper import NoteMapper, NoteReasonMapper
 
+_BY_ID = select(NoteORM).options(joinedload(NoteORM.reason)).where(NoteORM.id == bindparam("note_id"))
+_REASON_BY_NAME = select(NoteReasonORM).where(NoteReasonORM.name == bindparam("name"))
+
 
 class SqlAlchemyNoteRepository(NoteRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -29,11 +33,7 @@ class SqlAlchemyNoteRepository(NoteRepository):
 
     def find_by_id(self, note_id: int) -> Optional[Note]:
         """Find note by ID."""
-        model = self._session.query(NoteORM).options(
-            joinedload(NoteORM.reason)
-        ).filter(
-            NoteORM.id == note_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"note_id": note_id}).one_or_none()
 
         return NoteMapper.to_domain(model) if model else None
 
@@ -49,9 +49,7 @@ class SqlAlchemyNoteRepository(NoteRepository):
 
     def find_reason_by_name(self, name: str) -> Optional[NoteReason]:
         """Find note reason by name."""
-        model = self._session.query(NoteReasonORM).filter(
-            NoteReasonORM.name == name
-        ).one_or_none()
+        model = self._session.scalars(_REASON_BY_NAME, {"name": name}).one_or_none()
 
         return NoteReasonMapper.to_domain(model) if model else None
 
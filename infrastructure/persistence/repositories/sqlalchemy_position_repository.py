@@ -1,6 +1,7 @@
 """SQLAlchemy implementation of PositionRepository."""
 
 from typing import Optional
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from domain.repositories.position_repository import PositionRepository
@@ -8,6 +9,9 @@ from domain.entities.position import Position
 from infrastructure.persistence.models import PositionModel as PositionORM
 from infrastructure.persistence.mappers.position_mapper import PositionMapper
 
+_BY_ID = select(PositionORM).where(PositionORM.id == bindparam("position_id"))
+_BY_TITLE = select(PositionORM).where(PositionORM.title == bindparam("title"))
+
 
 class SqlAlchemyPositionRepository(PositionRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -25,16 +29,12 @@ class SqlAlchemyPositionRepository(PositionRepository):
 
     def find_by_title(self, title: str) -> Optional[Position]:
         """Find position by title."""
-        model = self._session.query(PositionORM).filter(
-            PositionORM.title == title
-        ).one_or_none()
+        model = self._session.scalars(_BY_TITLE, {"title": title}).one_or_none()
 
         return PositionMapper.to_domain(model) if model else None
 
     def find_by_id(self, position_id: int) -> Optional[Position]:
         """Find position by ID."""
-        model = self._session.query(PositionORM).filter(
-            PositionORM.id == position_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"position_id": position_id}).one_or_none()
 
         return PositionMapper.to_domain(model) if model else None
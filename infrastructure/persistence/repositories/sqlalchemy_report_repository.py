@@ -1,6 +1,8 @@
 """SQLAlchemy implementation of ReportRepository."""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterator, List, Optional
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
 from domain.repositories.report_repository import ReportRepository
@@ -8,6 +10,9 @@ from domain.entities.report import Report
 from infrastructure.persistence.models import ReportModel as ReportORM
 from infrastructure.persistence.mappers.report_mapper import ReportMapper
 
+_BY_ID = select(ReportORM).where(ReportORM.id == bindparam("report_id"))
+_BY_VISITOR_ID = select(ReportORM).where(ReportORM.visitorId == bindparam("visitor_id"))
+
 
 class SqlAlchemyReportRepository(ReportRepository):
     """Concrete repository implementation using SQLAlchemy."""
@@ -25,16 +30,33 @@ class SqlAlchemyReportRepository(ReportRepository):
 
     def find_by_id(self, report_id: int) -> Optional[Report]:
         """Find report by ID."""
-        model = self._session.query(ReportORM).filter(
-            ReportORM.id == report_id
-        ).one_or_none()
+        model = self._session.scalars(_BY_ID, {"report_id": report_id}).one_or_none()
 
         return ReportMapper.to_domain(model) if model else None
 
     def find_by_visitor_id(self, visitor_id: str) -> List[Report]:
         """Find all reports for a visitor."""
-        models = self._session.query(ReportORM).filter(
-            ReportORM.visitorId == visitor_id
-        ).all()
+        models = self._session.scalars(_BY_VISITOR_ID, {"visitor_id": visitor_id}).all()
 
         return [ReportMapper.to_domain(m) for m in models]
+
+    def max_id(self, created_before: Optional[datetime] = None) -> int:
+        """Get the highest report ID, optionally among reports created before a moment; 0 when there are none."""
+        query = self._session.query(func.max(ReportORM.id))
+        if created_before is not None:
+            query = query.filter(ReportORM.created_at < created_before)
+        return query.scalar() or 0
+
+    def stream_between(self, after_id: int, up_to_id: int, batch_size: int = 1000) -> Iterator[Report]:
+        """Stream reports with after_id < id <= up_to_id ordered by visitor and time."""
+        # yield_per uses a server-side cursor where the driver supports it, so memory
+        # stays bounded by batch_size whatever the number of reports
+        query = self._session.query(ReportORM).filter(
+            ReportORM.id > after_id,
+            ReportORM.id <= up_to_id
+        ).order_by(
+            ReportORM.visitorId, ReportORM.created_at, ReportORM.id
+        ).yield_per(batch_size)
+
+        for model in query:
+            yield ReportMapper.to_domain(model)
@@ -0,0 +1,77 @@
+"""SQLAlchemy implementation of VisitorSessionRepository."""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from domain.repositories.visitor_session_repository import VisitorSessionRepository
+from domain.entities.visitor_session import VisitorSession
+from infrastructure.persistence.models import (
+    VisitorSessionModel as VisitorSessionORM,
+    JobWatermarkModel as JobWatermarkORM
+)
+from infrastructure.persistence.mappers.visitor_session_mapper import VisitorSessionMapper
+
+
+class SqlAlchemyVisitorSessionRepository(VisitorSessionRepository):
+    """Concrete repository implementation using SQLAlchemy."""
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def save(self, visitor_session: VisitorSession) -> VisitorSession:
+        """Stage a new or extended session; it is committed with the next watermark."""
+        # Core statements keep the identity map empty, so long batch runs stay in constant memory
+        values = {
+            "visitorId": visitor_session.visitor_id,
+            "started_at": visitor_session.started_at,
+            "ended_at": visitor_session.ended_at,
+            "pages": list(visitor_session.pages),
+            "report_count": visitor_session.report_count,
+            "last_report_id": visitor_session.last_report_id,
+        }
+        if visitor_session.id is None:
+            visitor_session.id = self._session.execute(
+                insert(VisitorSessionORM).returning(VisitorSessionORM.id), values
+            ).scalar_one()
+        else:
+            self._session.execute(
+                update(VisitorSessionORM).where(VisitorSessionORM.id == visitor_session.id).values(**values),
+                execution_options={"synchronize_session": False}
+            )
+        return visitor_session
+
+    def find_latest_for_visitor(
+        self, visitor_id: str, started_before: Optional[datetime] = None
+    ) -> Optional[VisitorSession]:
+        """Find a visitor's most recent session, optionally started before a given time."""
+        query = self._session.query(VisitorSessionORM).filter(
+            VisitorSessionORM.visitorId == visitor_id
+        )
+        if started_before is not None:
+            query = query.filter(VisitorSessionORM.started_at <= started_before)
+
+        model = query.order_by(VisitorSessionORM.started_at.desc()).first()
+        if not model:
+            return None
+
+        entity = VisitorSessionMapper.to_domain(model)
+        self._session.expunge(model)
+        return entity
+
+    def get_watermark(self, name: str) -> int:
+        """Get the last processed report ID for a job, 0 when it never ran."""
+        last_id = self._session.query(JobWatermarkORM.last_id).filter(
+            JobWatermarkORM.name == name
+        ).scalar()
+        return last_id or 0
+
+    def commit_watermark(self, name: str, last_id: int) -> None:
+        """Advance a job watermark and commit it together with the staged sessions."""
+        watermark = self._session.get(JobWatermarkORM, name)
+        if watermark:
+            watermark.last_id = last_id
+        else:
+            self._session.add(JobWatermarkORM(name=name, last_id=last_id))
+        self._session.commit()
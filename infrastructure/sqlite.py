@@ -0,0 +1,163 @@
+"""SQLite profile for deployments without DATABASE_URL.
+
+configure_sqlite() tunes every connection of an engine through connect
+events: WAL so readers never block the writer, synchronous=NORMAL (durable
+at checkpoints, safe against corruption under WAL), a busy_timeout so
+concurrent writers wait for the lock instead of failing with "database is
+locked", and larger mmap/page caches.
+
+Connections with the ``sqlite_begin="IMMEDIATE"`` execution option take
+the write lock when their transaction starts. Use it for units of work that
+read and then write. In a deferred transaction, such a unit cannot wait for
+the lock: it fails at once if another connection has written since its
+read. For these connections SQLAlchemy also takes transaction control away
+from the pysqlite driver, which otherwise breaks SAVEPOINT. Other
+connections keep the driver's default behaviour.
+
+WriteQueue funnels the writes of a process through one thread. It runs them
+back to back in a single transaction and commits them as a group.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from infrastructure.observability.metrics import WRITE_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def sqlite_pragmas() -> dict:
+    """Per-connection pragmas from the environment."""
+    return {
+        "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        # Negative values are KiB rather than pages.
+        "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", "-65536")),
+    }
+
+
+def configure_sqlite(engine, pragmas: dict = None):
+    """Apply the SQLite profile to every connection the engine opens."""
+    pragmas = sqlite_pragmas() if pragmas is None else pragmas
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(connection):
+        mode = connection.get_execution_options().get("sqlite_begin")
+        dbapi_connection = connection.connection.dbapi_connection
+        if mode:
+            # Autocommit at the driver level: the BEGIN below is the only one.
+            dbapi_connection.isolation_level = None
+            connection.exec_driver_sql(f"BEGIN {mode}")
+        elif dbapi_connection.isolation_level is None:
+            dbapi_connection.isolation_level = ""
+
+    return engine
+
+
+class WriteQueue:
+    """Serialises the writes of this process and group-commits them.
+
+    submit(work) hands work(session) to the writer thread and blocks until
+    the group it ran in has committed. Each unit runs in its own SAVEPOINT,
+    released when it returns. Repositories can keep calling session.commit(),
+    which only releases the savepoint. A failing unit is rolled back without
+    affecting the others in the group.
+
+    submit() gives up after `timeout` seconds, or as soon as the writer
+    thread is found dead, rather than blocking its caller forever. A unit
+    that timed out may still be committed later.
+    """
+
+    def __init__(self, engine, max_batch: int = 128, timeout: float = 30.0):
+        self._engine = engine
+        self._max_batch = max_batch
+        self._timeout = timeout
+        self._jobs = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, work: Callable[[Session], T]) -> T:
+        if not self._thread.is_alive():
+            raise RuntimeError("SQLite writer thread is not running")
+        future = Future()
+        WRITE_QUEUE_DEPTH.inc()
+        self._jobs.put((work, future))
+        deadline = time.monotonic() + self._timeout
+        while True:
+            try:
+                return future.result(timeout=max(0.0, min(1.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                if not self._thread.is_alive():
+                    raise RuntimeError("SQLite writer thread stopped before committing the write")
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"SQLite write not committed within {self._timeout:g}s")
+
+    def close(self):
+        """Commit what is queued, then stop the writer thread."""
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._jobs.get()]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            batch = [job for job in batch if job is not None]
+            WRITE_QUEUE_DEPTH.dec(len(batch))
+            if batch:
+                self._commit(batch)
+            if stopping:
+                return
+
+    def _commit(self, batch):
+        outcomes = []
+        try:
+            with self._engine.connect().execution_options(sqlite_begin="IMMEDIATE") as connection:
+                with connection.begin():
+                    for work, future in batch:
+                        session = Session(
+                            bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+                        )
+                        try:
+                            result = work(session)
+                            session.commit()
+                            outcomes.append((future, result, None))
+                        except Exception as e:
+                            outcomes.append((future, None, e))
+                        finally:
+                            session.close()
+        except Exception as e:
+            logger.exception("Group commit of %d writes failed", len(batch))
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        # Only acknowledge once the group is durable.
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
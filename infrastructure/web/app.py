@@ -1,59 +1,64 @@
 import logging
-import sys
-from typing import List
+from typing import Dict, List
 from pydantic import BaseModel
-from fastapi import FastAPI, Depends, HTTPException
+from fastapi import FastAPI, Depends, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse
 from application.notification_service import EmailNotificationService
 from application.lead_service import LeadService
 from application.note_service import NoteService
 from application.fingerprint_service import FingerprintService
-from application.report_service import ReportService
+from application.visitor_linking_service import VisitorLinkingService
+from application.visitor_session_service import VisitorSessionService
 from application.email_service import EmailAccountService, ClassifiedEmailService
 from infrastructure.mail.sender import EmailSender
 from domain.contact import (
-    LeadRequest, ReportRequest, FingerprintRequest, LeadResponse,
+    LeadRequest, FingerprintResponse, LeadResponse, LinkedVisitorsResponse,
+    VisitorSessionResponse,
     NoteCreateRequest, NoteResponse, NoteReasonResponse, LeadUpdateRequest,
     EmailAccountCreate, EmailAccountUpdate, EmailAccountResponse,
     ClassifiedEmailCreate, ClassifiedEmailUpdate, ClassifiedEmailResponse, ClassifiedEmailDetailResponse
 )
-from infrastructure.web.auth import get_current_user, oauth2_scheme
+from infrastructure.web.dtos import PoolStatusResponse, ProfileResponse, SlowQueryResponse
+from infrastructure.web.auth import get_admin_user, get_current_user, is_admin_request, oauth2_scheme, oidc_cache_state
 from dotenv import load_dotenv
 import os
-from altcha import create_challenge, verify_solution
 from sqlalchemy.orm import Session
-from infrastructure.database import SessionLocal
+from infrastructure.web.container import container, LazyRepository
+from infrastructure.web.dependencies import ReadYourWritesMiddleware, get_db
+from infrastructure.web.health import HealthProbeMiddleware, database_checks
+from infrastructure.web.lifespan import api_lifespan
+from infrastructure.web.telemetry import router as telemetry_router
+from infrastructure.web.ingestion import (
+    router as ingestion_router, get_fingerprint_service, verify_altcha_solution
+)
+from infrastructure.persistence.repositories import (
+    SqlAlchemyLeadRepository, SqlAlchemyContactRepository, SqlAlchemyCompanyRepository,
+    SqlAlchemyPositionRepository, SqlAlchemyConcernRepository, SqlAlchemyNoteRepository,
+    SqlAlchemyFingerprintRepository, SqlAlchemyReportRepository, SqlAlchemyVisitorSessionRepository,
+    SqlAlchemyEmailAccountRepository, SqlAlchemyClassifiedEmailRepository
+)
+from infrastructure import database
+from infrastructure.observability import (
+    MetricsMiddleware, ProfileStore, ProfilingMiddleware, QueryCountMiddleware, RequestContextMiddleware,
+    ServerTimingMiddleware, TimedRoute, configure_logging, query_stats_enabled, server_timing_enabled
+)
+from infrastructure.pool import pool_status
 from infrastructure.persistence.models import ReportModel as Report, FingerprintModel as Fingerprint, NoteReasonModel as NoteReason
 
-from run_migrations import run_migrations
-
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stdout,
-)
+configure_logging()
 logger = logging.getLogger("api app")
-logger.setLevel(logging.INFO)
-
-handler = logging.StreamHandler(sys.stdout)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-
-logger.handlers = []  # Nettoie les handlers existants
-logger.addHandler(handler)
-
-logger.propagate = False
 
 app = FastAPI(
     title="Octobre API",
     version="v1",
     openapi_url="/api/docs/openapi.json",
-    docs_url="/api/docs"
+    docs_url="/api/docs",
+    lifespan=api_lifespan
 )
+app.router.route_class = TimedRoute
 
 origins = os.environ.get('AUTHORIZED_ORIGINS', '').split(',')
 app.add_middleware(
@@ -63,105 +68,64 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ReadYourWritesMiddleware, public_paths={route.path for route in ingestion_router.routes})
+if query_stats_enabled():
+    app.add_middleware(QueryCountMiddleware)
+if server_timing_enabled():
+    app.add_middleware(ServerTimingMiddleware)
+profile_store = ProfileStore.from_env()
+app.add_middleware(ProfilingMiddleware, store=profile_store, authorize=is_admin_request)
+app.add_middleware(RequestContextMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(HealthProbeMiddleware, checks={**database_checks(), "oidc": oidc_cache_state})
+
+app.include_router(ingestion_router)
+app.include_router(telemetry_router)
 
 MAIL_RECIPIENT = os.environ.get('MAIL_FROM')
 MAIL_SENDER = os.environ.get('MAIL_TO')
-ALTCHA_HMAC_KEY = os.environ.get('ALTCHA_HMAC_KEY')
-
-# Run migrations on startup, but not in the test environment
-# because they are handled by the playwright global setup.
-if os.environ.get("ENV") != "pytest":
-    run_migrations()
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 def get_email_sender() -> EmailSender:
-    return EmailSender()
+    return container.email_sender
 
-def get_email_notification_service(email_sender: EmailSender = Depends(get_email_sender)) -> EmailNotificationService:
-    return EmailNotificationService(email_sender)
+def get_email_notification_service() -> EmailNotificationService:
+    return container.email_notification_service
 
 def get_lead_service(db: Session = Depends(get_db)) -> LeadService:
-    from infrastructure.persistence.repositories.sqlalchemy_lead_repository import SqlAlchemyLeadRepository
-    from infrastructure.persistence.repositories.sqlalchemy_contact_repository import SqlAlchemyContactRepository
-    from infrastructure.persistence.repositories.sqlalchemy_company_repository import SqlAlchemyCompanyRepository
-    from infrastructure.persistence.repositories.sqlalchemy_position_repository import SqlAlchemyPositionRepository
-    from infrastructure.persistence.repositories.sqlalchemy_concern_repository import SqlAlchemyConcernRepository
-    from infrastructure.persistence.repositories.sqlalchemy_note_repository import SqlAlchemyNoteRepository
-    from domain.services.lead_scoring_service import LeadScoringService
-
-    lead_repo = SqlAlchemyLeadRepository(db)
-    contact_repo = SqlAlchemyContactRepository(db)
-    company_repo = SqlAlchemyCompanyRepository(db)
-    position_repo = SqlAlchemyPositionRepository(db)
-    concern_repo = SqlAlchemyConcernRepository(db)
-    note_repo = SqlAlchemyNoteRepository(db)
-    scoring_service = LeadScoringService()
-
     return LeadService(
         session=db,
-        lead_repository=lead_repo,
-        contact_repository=contact_repo,
-        company_repository=company_repo,
-        position_repository=position_repo,
-        concern_repository=concern_repo,
-        note_repository=note_repo,
-        scoring_service=scoring_service
+        lead_repository=LazyRepository(SqlAlchemyLeadRepository, db),
+        contact_repository=LazyRepository(SqlAlchemyContactRepository, db),
+        company_repository=LazyRepository(SqlAlchemyCompanyRepository, db),
+        position_repository=LazyRepository(SqlAlchemyPositionRepository, db),
+        concern_repository=LazyRepository(SqlAlchemyConcernRepository, db),
+        note_repository=LazyRepository(SqlAlchemyNoteRepository, db),
+        scoring_service=container.scoring_service
     )
 
 def get_note_service(
     db: Session = Depends(get_db),
     email_notification_service: EmailNotificationService = Depends(get_email_notification_service)
 ) -> NoteService:
-    from infrastructure.persistence.repositories.sqlalchemy_note_repository import SqlAlchemyNoteRepository
-    note_repo = SqlAlchemyNoteRepository(db)
-    return NoteService(note_repo, email_notification_service)
-
-def get_fingerprint_service(db: Session = Depends(get_db)) -> FingerprintService:
-    from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
-    fingerprint_repo = SqlAlchemyFingerprintRepository(db)
-    return FingerprintService(fingerprint_repo)
-
-def get_report_service(db: Session = Depends(get_db)) -> ReportService:
-    from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
-    from infrastructure.persistence.repositories.sqlalchemy_report_repository import SqlAlchemyReportRepository
-    fingerprint_repo = SqlAlchemyFingerprintRepository(db)
-    report_repo = SqlAlchemyReportRepository(db)
-    return ReportService(report_repo, fingerprint_repo)
+    return NoteService(LazyRepository(SqlAlchemyNoteRepository, db), email_notification_service)
+
+def get_visitor_linking_service(db: Session = Depends(get_db)) -> VisitorLinkingService:
+    return VisitorLinkingService(LazyRepository(SqlAlchemyFingerprintRepository, db), container.minhash_service)
+
+def get_visitor_session_service(db: Session = Depends(get_db)) -> VisitorSessionService:
+    return VisitorSessionService(
+        LazyRepository(SqlAlchemyReportRepository, db),
+        LazyRepository(SqlAlchemyVisitorSessionRepository, db)
+    )
 
 def get_email_account_service(db: Session = Depends(get_db)) -> EmailAccountService:
-    from infrastructure.persistence.repositories.sqlalchemy_email_repository import SqlAlchemyEmailAccountRepository
-    email_account_repo = SqlAlchemyEmailAccountRepository(db)
-    return EmailAccountService(email_account_repo)
+    return EmailAccountService(LazyRepository(SqlAlchemyEmailAccountRepository, db))
 
 def get_classified_email_service(db: Session = Depends(get_db)) -> ClassifiedEmailService:
-    from infrastructure.persistence.repositories.sqlalchemy_email_repository import SqlAlchemyClassifiedEmailRepository
-    classified_email_repo = SqlAlchemyClassifiedEmailRepository(db)
-    return ClassifiedEmailService(db, classified_email_repo)
-
-def verify_altcha_solution(altcha_solution: str):
-    if os.environ.get("ENV") != "pytest":
-        if not ALTCHA_HMAC_KEY:
-            raise HTTPException(status_code=500, detail="ALTCHA_HMAC_KEY not configured")
-
-        is_valid, reason = verify_solution(altcha_solution, ALTCHA_HMAC_KEY)
-        if not is_valid:
-            raise HTTPException(status_code=400, detail=f"Invalid ALTCHA solution: {reason}")
-
-@app.get("/altcha-challenge/")
-async def altcha_challenge():
-    if not ALTCHA_HMAC_KEY:
-        raise HTTPException(status_code=500, detail="ALTCHA_HMAC_KEY not configured")
-    challenge = create_challenge(hmac_key=ALTCHA_HMAC_KEY)
-    return JSONResponse(content=challenge.to_dict())
+    return ClassifiedEmailService(db, LazyRepository(SqlAlchemyClassifiedEmailRepository, db))
 
 @app.post("/lead/")
-async def create_lead(
+def create_lead(
     lead_request: LeadRequest,
     lead_service: LeadService = Depends(get_lead_service),
     email_notification_service: EmailNotificationService = Depends(get_email_notification_service)
@@ -184,44 +148,53 @@ async def create_lead(
         logger.exception("Error creating lead")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/fingerprint/")
-async def create_fingerprint(
-    fingerprint_request: FingerprintRequest,
-    fingerprint_service: FingerprintService = Depends(get_fingerprint_service)
+@app.get("/fingerprints/", response_model=List[FingerprintResponse], dependencies=[Depends(oauth2_scheme)])
+def search_fingerprints(
+    timezone: str = None,
+    platform: str = None,
+    screen_resolution: str = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    fingerprint_service: FingerprintService = Depends(get_fingerprint_service),
+    current_user: dict = Depends(get_current_user)
 ):
-    verify_altcha_solution(fingerprint_request.altcha)
-
     try:
-        fingerprint_service.create_fingerprint(
-            visitor_id=fingerprint_request.visitorId,
-            components=fingerprint_request.components
+        return fingerprint_service.search_fingerprints(
+            timezone=timezone,
+            platform=platform,
+            screen_resolution=screen_resolution,
+            limit=limit,
+            offset=offset
         )
-        return JSONResponse(status_code=200, content={'message': 'Fingerprint saved successfully'})
     except Exception as e:
-        logger.exception("Error creating fingerprint")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("Error searching fingerprints")
+        raise HTTPException(status_code=500, detail="Internal server error")
 
-@app.post("/report/")
-async def report_data(
-    report_request: ReportRequest,
-    report_service: ReportService = Depends(get_report_service)
+@app.get("/visitors/{visitor_id}/linked", response_model=LinkedVisitorsResponse, dependencies=[Depends(oauth2_scheme)])
+def get_linked_visitors(
+    visitor_id: str,
+    visitor_linking_service: VisitorLinkingService = Depends(get_visitor_linking_service),
+    lead_service: LeadService = Depends(get_lead_service),
+    current_user: dict = Depends(get_current_user)
 ):
-    verify_altcha_solution(report_request.altcha)
-
     try:
-        report = report_service.create_report(
-            visitor_id=report_request.visitorId,
-            page=report_request.page
+        linked_visitor_ids = visitor_linking_service.get_linked_visitor_ids(visitor_id)
+        if linked_visitor_ids is None:
+            raise HTTPException(status_code=404, detail="Fingerprint not found")
+        leads = lead_service.get_leads_by_visitor_ids([visitor_id] + linked_visitor_ids)
+        return LinkedVisitorsResponse(
+            visitor_id=visitor_id,
+            linked_visitor_ids=linked_visitor_ids,
+            leads=[LeadResponse.model_validate(lead) for lead in leads]
         )
-        if not report:
-            return JSONResponse(status_code=200, content={'warning': 'Fingerprint not found'})
-        return JSONResponse(status_code=200, content={'message': 'Report saved successfully'})
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.exception("Error reporting data")
-        raise HTTPException(status_code=500, detail=str(e))
+        logger.exception("Error getting linked visitors for %s", visitor_id)
+        raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/note-reasons/", response_model=List[NoteReasonResponse], dependencies=[Depends(oauth2_scheme)])
-async def list_note_reasons(
+def list_note_reasons(
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
@@ -233,7 +206,7 @@ async def list_note_reasons(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/leads/", response_model=List[LeadResponse], dependencies=[Depends(oauth2_scheme)])
-async def list_leads(
+def list_leads(
     lead_service: LeadService = Depends(get_lead_service),
     current_user: dict = Depends(get_current_user)
 ):
@@ -246,7 +219,7 @@ async def list_leads(
         raise e
 
 @app.get("/leads/{lead_id}", response_model=LeadResponse, dependencies=[Depends(oauth2_scheme)])
-async def get_lead(
+def get_lead(
     lead_id: int,
     lead_service: LeadService = Depends(get_lead_service),
     current_user: dict = Depends(get_current_user)
@@ -257,14 +230,40 @@ async def get_lead(
             raise HTTPException(status_code=404, detail="Lead not found")
         return lead
     except Exception as e:
-        logger.exception(f"Error while getting lead {lead_id}")
+        logger.exception("Error while getting lead %s", lead_id)
         # Reraise the HTTPException to ensure FastAPI handles it
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.get("/leads/{lead_id}/session-path", response_model=VisitorSessionResponse, dependencies=[Depends(oauth2_scheme)])
+def get_lead_session_path(
+    lead_id: int,
+    lead_service: LeadService = Depends(get_lead_service),
+    visitor_session_service: VisitorSessionService = Depends(get_visitor_session_service),
+    current_user: dict = Depends(get_current_user)
+):
+    try:
+        lead = lead_service.get_lead_by_id(lead_id)
+        if not lead:
+            raise HTTPException(status_code=404, detail="Lead not found")
+        if not lead.fingerprint_visitor_id:
+            raise HTTPException(status_code=404, detail="Lead has no visitor fingerprint")
+
+        visitor_session = visitor_session_service.get_session_before(
+            lead.fingerprint_visitor_id, lead.submission_date
+        )
+        if not visitor_session:
+            raise HTTPException(status_code=404, detail="Session not found")
+        return visitor_session
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error getting session path for lead %s", lead_id)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
 @app.post("/leads/{lead_id}/notes", response_model=NoteResponse, dependencies=[Depends(oauth2_scheme)])
-async def create_note_for_lead(
+def create_note_for_lead(
     lead_id: int,
     note_request: NoteCreateRequest,
     lead_service: LeadService = Depends(get_lead_service),
@@ -298,13 +297,13 @@ async def create_note_for_lead(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"Error while creating note for lead {lead_id}")
+        logger.exception("Error while creating note for lead %s", lead_id)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.get("/leads/{lead_id}/notes", response_model=List[NoteResponse], dependencies=[Depends(oauth2_scheme)])
-async def get_notes_for_lead(
+def get_notes_for_lead(
     lead_id: int,
     note_service: NoteService = Depends(get_note_service),
     current_user: dict = Depends(get_current_user)
@@ -313,14 +312,14 @@ async def get_notes_for_lead(
         notes = note_service.get_notes_by_lead_id(lead_id)
         return notes
     except Exception as e:
-        logger.exception(f"Error while getting notes for lead {lead_id}")
+        logger.exception("Error while getting notes for lead %s", lead_id)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 class NoteUpdate(BaseModel):
     notes: str
 
 @app.put("/leads/{lead_id}/notes", response_model=LeadResponse, dependencies=[Depends(oauth2_scheme)])
-async def update_lead_notes_endpoint(
+def update_lead_notes_endpoint(
     lead_id: int,
     note_update: NoteUpdate,
     lead_service: LeadService = Depends(get_lead_service),
@@ -332,13 +331,13 @@ async def update_lead_notes_endpoint(
             raise HTTPException(status_code=404, detail="Lead not found")
         return lead
     except Exception as e:
-        logger.exception(f"Error while updating notes for lead {lead_id}")
+        logger.exception("Error while updating notes for lead %s", lead_id)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail="Internal server error")
 
 @app.put("/lead/{lead_id}", response_model=LeadResponse)
-async def update_lead(
+def update_lead(
     lead_id: int,
     lead_update: LeadUpdateRequest,
     lead_service: LeadService = Depends(get_lead_service)
@@ -352,14 +351,14 @@ async def update_lead(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.exception(f"Error while updating lead {lead_id}")
+        logger.exception("Error while updating lead %s", lead_id)
         if isinstance(e, HTTPException):
             raise e
         raise HTTPException(status_code=500, detail="Internal server error")
 
 # Email Account Endpoints
 @app.post("/email-accounts/", response_model=EmailAccountResponse, dependencies=[Depends(oauth2_scheme)])
-async def create_email_account(
+def create_email_account(
     account_data: EmailAccountCreate,
     email_account_service: EmailAccountService = Depends(get_email_account_service),
     current_user: dict = Depends(get_current_user)
@@ -372,7 +371,7 @@ async def create_email_account(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/email-accounts/", response_model=List[EmailAccountResponse], dependencies=[Depends(oauth2_scheme)])
-async def list_email_accounts(
+def list_email_accounts(
     email_account_service: EmailAccountService = Depends(get_email_account_service),
     current_user: dict = Depends(get_current_user)
 ):
@@ -384,7 +383,7 @@ async def list_email_accounts(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/email-accounts/{account_id}", response_model=EmailAccountResponse, dependencies=[Depends(oauth2_scheme)])
-async def get_email_account(
+def get_email_account(
     account_id: int,
     email_account_service: EmailAccountService = Depends(get_email_account_service),
     current_user: dict = Depends(get_current_user)
@@ -397,11 +396,11 @@ async def get_email_account(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error getting email account {account_id}")
+        logger.exception("Error getting email account %s", account_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/email-accounts/{account_id}", response_model=EmailAccountResponse, dependencies=[Depends(oauth2_scheme)])
-async def update_email_account(
+def update_email_account(
     account_id: int,
     update_data: EmailAccountUpdate,
     email_account_service: EmailAccountService = Depends(get_email_account_service),
@@ -415,11 +414,11 @@ async def update_email_account(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error updating email account {account_id}")
+        logger.exception("Error updating email account %s", account_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/email-accounts/{account_id}", dependencies=[Depends(oauth2_scheme)])
-async def delete_email_account(
+def delete_email_account(
     account_id: int,
     email_account_service: EmailAccountService = Depends(get_email_account_service),
     current_user: dict = Depends(get_current_user)
@@ -432,12 +431,12 @@ async def delete_email_account(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error deleting email account {account_id}")
+        logger.exception("Error deleting email account %s", account_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 # Classified Email Endpoints
 @app.post("/classified-emails/", response_model=ClassifiedEmailResponse, dependencies=[Depends(oauth2_scheme)])
-async def create_classified_email(
+def create_classified_email(
     email_data: ClassifiedEmailCreate,
     classified_email_service: ClassifiedEmailService = Depends(get_classified_email_service),
     current_user: dict = Depends(get_current_user)
@@ -452,7 +451,7 @@ async def create_classified_email(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/classified-emails/", response_model=List[ClassifiedEmailResponse], dependencies=[Depends(oauth2_scheme)])
-async def list_classified_emails(
+def list_classified_emails(
     email_account_id: int = None,
     emergency_level: int = None,
     classification: str = None,
@@ -473,7 +472,7 @@ async def list_classified_emails(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/classified-emails/{email_id}", response_model=ClassifiedEmailDetailResponse, dependencies=[Depends(oauth2_scheme)])
-async def get_classified_email(
+def get_classified_email(
     email_id: int,
     classified_email_service: ClassifiedEmailService = Depends(get_classified_email_service),
     current_user: dict = Depends(get_current_user)
@@ -486,11 +485,11 @@ async def get_classified_email(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error getting classified email {email_id}")
+        logger.exception("Error getting classified email %s", email_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/classified-emails/{email_id}", response_model=ClassifiedEmailResponse, dependencies=[Depends(oauth2_scheme)])
-async def update_classified_email(
+def update_classified_email(
     email_id: int,
     update_data: ClassifiedEmailUpdate,
     classified_email_service: ClassifiedEmailService = Depends(get_classified_email_service),
@@ -506,11 +505,11 @@ async def update_classified_email(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error updating classified email {email_id}")
+        logger.exception("Error updating classified email %s", email_id)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/classified-emails/{email_id}", dependencies=[Depends(oauth2_scheme)])
-async def delete_classified_email(
+def delete_classified_email(
     email_id: int,
     classified_email_service: ClassifiedEmailService = Depends(get_classified_email_service),
     current_user: dict = Depends(get_current_user)
@@ -523,9 +522,34 @@ async def delete_classified_email(
     except HTTPException:
         raise
     except Exception as e:
-        logger.exception(f"Error deleting classified email {email_id}")
+        logger.exception("Error deleting classified email %s", email_id)
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/metrics/pool", response_model=Dict[str, PoolStatusResponse], dependencies=[Depends(oauth2_scheme)])
+def get_pool_metrics(current_user: dict = Depends(get_current_user)):
+    """Connection pool status of each engine (primary, analytics, replica) of the worker that serves the request."""
+    return {name: pool_status(pool_engine) for name, pool_engine in database.named_engines().items()}
+
+@app.get("/admin/slow-queries", response_model=List[SlowQueryResponse], dependencies=[Depends(oauth2_scheme)])
+def get_slow_queries(current_user: dict = Depends(get_admin_user)):
+    """Statements slower than SLOW_QUERY_MS recorded by the worker that serves the request, most recent first."""
+    if database.slow_query_log is None:
+        return []
+    return database.slow_query_log.entries()
+
+@app.get("/admin/profiles", response_model=List[ProfileResponse], dependencies=[Depends(oauth2_scheme)])
+def list_profiles(current_user: dict = Depends(get_admin_user)):
+    """Profiles of the requests sent with X-Profile: 1 by an admin, most recent first."""
+    return profile_store.entries()
+
+@app.get("/admin/profiles/{name}", dependencies=[Depends(oauth2_scheme)])
+def download_profile(name: str, current_user: dict = Depends(get_admin_user)):
+    """One profile, in pstats format."""
+    path = profile_store.path(name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(path, media_type="application/octet-stream", filename=name)
+
 if __name__ == '__main__':
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,10 @@
+"""Production ASGI entry point.
+
+Served natively by gunicorn's uvicorn worker, without the ASGI->WSGI->ASGI
+bridge of infrastructure.web.wsgi:
+
+    gunicorn -c gunicorn.conf.py infrastructure.web.asgi:app
+"""
+from infrastructure.web.app import app
+
+__all__ = ["app"]
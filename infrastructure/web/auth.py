@@ -1,3 +1,4 @@
+import asyncio
 import httpx
 import logging
 from fastapi import Depends, HTTPException, status
@@ -5,9 +6,20 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from pydantic import BaseModel
 import os
+import time
+
+from infrastructure.observability.metrics import record_cache_lookup
+from infrastructure.observability.timing import phase
+
 # The OIDC provider's URL within the Docker network
 OIDC_PROVIDER_URL = os.environ.get('OCTOBRE_ISSUER_URL', "http://localhost:3080")
 WELL_KNOWN_ENDPOINT = "/.well-known/openid-configuration"
+# The provider configuration and signing keys are fetched once per
+# OIDC_CACHE_SECONDS, not on every request. A token the cached keys cannot
+# verify triggers an early refresh, at most every OIDC_REFRESH_SECONDS, in
+# case the provider rotated its keys.
+OIDC_CACHE_SECONDS = float(os.environ.get("OIDC_CACHE_SECONDS", "300"))
+OIDC_REFRESH_SECONDS = 30
 
 # This is used by FastAPI to extract the token from the Authorization header.
 # The tokenUrl is not actually used in this OIDC flow, but it's a required parameter.
@@ -53,6 +65,48 @@ async def get_jwks(oidc_config: dict):
             )
 
 
+_oidc_cache = {"config": None, "jwks": None, "fetched_at": None}
+# One fetch at a time per worker: the requests that miss the cache together
+# wait for it instead of each calling the provider.
+_oidc_lock = asyncio.Lock()
+
+
+def _cached_signing_keys(refresh: bool):
+    fetched_at = _oidc_cache["fetched_at"]
+    age = None if fetched_at is None else time.monotonic() - fetched_at
+    if age is not None and age < OIDC_CACHE_SECONDS and (not refresh or age < OIDC_REFRESH_SECONDS):
+        return _oidc_cache["config"], _oidc_cache["jwks"]
+    return None
+
+
+async def get_signing_keys(refresh: bool = False):
+    """OIDC configuration and JWKS, from the cache while it is fresh."""
+    cached = _cached_signing_keys(refresh)
+    if cached is None:
+        async with _oidc_lock:
+            # Fetched by another request while this one waited?
+            cached = _cached_signing_keys(refresh)
+            if cached is None:
+                record_cache_lookup("oidc_keys", hit=False)
+                oidc_config = await get_oidc_config()
+                jwks = await get_jwks(oidc_config)
+                _oidc_cache.update(config=oidc_config, jwks=jwks, fetched_at=time.monotonic())
+                return oidc_config, jwks
+    record_cache_lookup("oidc_keys", hit=True)
+    return cached
+
+
+def oidc_cache_state() -> dict:
+    """Whether the signing keys are cached and how old they are; no I/O."""
+    fetched_at = _oidc_cache["fetched_at"]
+    age = None if fetched_at is None else time.monotonic() - fetched_at
+    return {
+        "ok": True,
+        "cached": age is not None and age < OIDC_CACHE_SECONDS,
+        "age_seconds": None if age is None else round(age, 1),
+    }
+
+
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     FastAPI dependency to verify the OIDC token and return the user's claims.
@@ -62,27 +116,65 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        oidc_config = await get_oidc_config()
-        jwks = await get_jwks(oidc_config)
+    with phase("auth"):
+        try:
+            oidc_config, jwks = await get_signing_keys()
 
-        issuer = oidc_config.get("issuer")
-        if not issuer:
-            raise credentials_exception
+            issuer = oidc_config.get("issuer")
+            if not issuer:
+                raise credentials_exception
 
-        payload = jwt.decode(
-            token,
-            jwks,
-            algorithms=["RS256"],
-            # In a real-world app, we should validate the audience.
-            options={"verify_aud": False},
-            issuer=issuer,
-        )
-        username: str = payload.get("sub")
-        if username is None:
+            def decode(keys):
+                return jwt.decode(
+                    token,
+                    keys,
+                    algorithms=["RS256"],
+                    # In a real-world app, we should validate the audience.
+                    options={"verify_aud": False},
+                    issuer=issuer,
+                )
+
+            try:
+                payload = decode(jwks)
+            except JWTError:
+                _, refreshed_jwks = await get_signing_keys(refresh=True)
+                if refreshed_jwks is jwks:
+                    raise
+                payload = decode(refreshed_jwks)
+
+            username: str = payload.get("sub")
+            if username is None:
+                raise credentials_exception
+            token_data = TokenData(username=username)
+        except JWTError:
+            logger.exception("Could not validate credentials")
             raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
-        logger.exception("Could not validate credentials")
-        raise credentials_exception
     return token_data
+
+
+def admin_users() -> frozenset:
+    """Usernames (token subjects) listed in ADMIN_USERS, comma-separated."""
+    return frozenset(name.strip() for name in os.environ.get("ADMIN_USERS", "").split(",") if name.strip())
+
+
+async def get_admin_user(current_user: TokenData = Depends(get_current_user)):
+    """FastAPI dependency that only lets users listed in ADMIN_USERS through."""
+    if current_user.username not in admin_users():
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+    return current_user
+
+
+async def is_admin_request(scope) -> bool:
+    """Whether an ASGI request carries the bearer token of a user listed in ADMIN_USERS.
+
+    For middlewares, which run before the dependencies are resolved.
+    """
+    authorization = dict(scope["headers"]).get(b"authorization", b"").decode("latin-1")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        user = await get_current_user(token)
+    except HTTPException:
+        return False
+    return user.username in admin_users()
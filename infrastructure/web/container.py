@@ -0,0 +1,52 @@
+"""Dependency container for the web layer.
+
+Stateless services are process-wide singletons, built once per worker on
+first use (so after the fork in preload mode). Repositories are bound to the
+request's session and only built when a service actually calls them.
+"""
+from functools import cached_property
+
+
+class LazyRepository:
+    """Stands in for a session-bound repository until its first attribute access."""
+
+    __slots__ = ("_factory", "_session", "_instance")
+
+    def __init__(self, factory, session):
+        self._factory = factory
+        self._session = session
+        self._instance = None
+
+    def __getattr__(self, name):
+        instance = self._instance
+        if instance is None:
+            instance = self._instance = self._factory(self._session)
+        return getattr(instance, name)
+
+
+class Container:
+    """Process-wide singletons. Imports stay inside the properties so the lean
+    ingestion app never loads the CRM side."""
+
+    @cached_property
+    def minhash_service(self):
+        from domain.services.minhash_service import MinHashService
+        return MinHashService()
+
+    @cached_property
+    def scoring_service(self):
+        from domain.services.lead_scoring_service import LeadScoringService
+        return LeadScoringService()
+
+    @cached_property
+    def email_sender(self):
+        from infrastructure.mail.sender import EmailSender
+        return EmailSender()
+
+    @cached_property
+    def email_notification_service(self):
+        from application.notification_service import EmailNotificationService
+        return EmailNotificationService(self.email_sender)
+
+
+container = Container()
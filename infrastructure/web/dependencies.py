@@ -0,0 +1,67 @@
+import os
+
+from fastapi import Request
+
+from infrastructure import database
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Read-your-writes: a request carrying this header, or sent within
+# REPLICA_STICKY_SECONDS of a mutation by the same client (cookie), reads
+# from the primary even though it is safe.
+READ_PRIMARY_HEADER = "X-Read-Primary"
+READ_PRIMARY_COOKIE = "read_primary"
+REPLICA_STICKY_SECONDS = int(os.environ.get("REPLICA_STICKY_SECONDS", "5"))
+
+
+def reads_from_replica(request: Request) -> bool:
+    return (
+        database.ReplicaSessionLocal is not None
+        and request.method in SAFE_METHODS
+        and READ_PRIMARY_HEADER not in request.headers
+        and READ_PRIMARY_COOKIE not in request.cookies
+    )
+
+
+def get_db(request: Request):
+    session_factory = database.ReplicaSessionLocal if reads_from_replica(request) else database.SessionLocal
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ReadYourWritesMiddleware:
+    """Pins a client to the primary for a short window after each successful mutation.
+
+    Sets a short-lived cookie on successful unsafe requests. The browser
+    drops it when the window is over, so no server state is shared between
+    workers. Requests to public_paths, such as the anonymous beacons, whose
+    clients never read from the CRM, get no cookie.
+    """
+
+    def __init__(self, app, public_paths=frozenset()):
+        self.app = app
+        self.public_paths = frozenset(public_paths)
+        self._cookie = (
+            f"{READ_PRIMARY_COOKIE}=1; Max-Age={REPLICA_STICKY_SECONDS}; Path=/; HttpOnly; SameSite=Lax"
+        ).encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or scope["path"] in self.public_paths
+            or database.ReplicaSessionLocal is None
+            or REPLICA_STICKY_SECONDS <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message["headers"] = list(message.get("headers", [])) + [(b"set-cookie", self._cookie)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
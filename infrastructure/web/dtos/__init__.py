@@ -14,8 +14,9 @@ from .company_dto import CompanyResponse
 from .position_dto import PositionResponse
 from .concern_dto import ConcernResponse
 from .note_dto import NoteResponse, NoteReasonResponse, NoteCreateRequest
-from .fingerprint_dto import FingerprintRequest
+from .fingerprint_dto import FingerprintRequest, FingerprintResponse
 from .report_dto import ReportRequest
+from .visitor_dto import LinkedVisitorsResponse, VisitorSessionResponse
 from .email_dto import (
     EmailAccountCreate,
     EmailAccountUpdate,
@@ -26,6 +27,7 @@ from .email_dto import (
     ClassifiedEmailDetailResponse,
     EmailClassificationHistoryResponse,
 )
+from .metrics_dto import PoolStatusResponse, ProfileResponse, SlowQueryResponse
 
 __all__ = [
     'LeadPayload',
@@ -43,7 +45,10 @@ __all__ = [
     'NoteReasonResponse',
     'NoteCreateRequest',
     'FingerprintRequest',
+    'FingerprintResponse',
     'ReportRequest',
+    'LinkedVisitorsResponse',
+    'VisitorSessionResponse',
     'EmailAccountCreate',
     'EmailAccountUpdate',
     'EmailAccountResponse',
@@ -52,4 +57,7 @@ __all__ = [
     'ClassifiedEmailResponse',
     'ClassifiedEmailDetailResponse',
     'EmailClassificationHistoryResponse',
+    'PoolStatusResponse',
+    'ProfileResponse',
+    'SlowQueryResponse',
 ]
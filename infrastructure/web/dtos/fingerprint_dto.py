@@ -1,6 +1,8 @@
-"""Fingerprint DTOs - HTTP request models."""
+"""Fingerprint DTOs - HTTP request/response models."""
 
 from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
 
 
 class FingerprintRequest(BaseModel):
@@ -8,3 +10,15 @@ class FingerprintRequest(BaseModel):
     altcha: str
     visitorId: str
     components: dict
+
+
+class FingerprintResponse(BaseModel):
+    """Fingerprint summary with its indexed component fields."""
+    visitor_id: str
+    created_at: Optional[datetime]
+    timezone: Optional[str]
+    platform: Optional[str]
+    screen_resolution: Optional[str]
+
+    class Config:
+        from_attributes = True
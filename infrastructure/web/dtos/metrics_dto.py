@@ -0,0 +1,36 @@
+"""Metrics DTOs - HTTP response models."""
+
+from pydantic import BaseModel
+from typing import Any, Optional
+
+
+class PoolStatusResponse(BaseModel):
+    """Occupancy and checkout statistics of this worker's connection pool."""
+    pool_class: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    in_use: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout_seconds: Optional[float] = None
+    checkouts: Optional[int] = None
+    timeouts: Optional[int] = None
+    wait_seconds_total: Optional[float] = None
+    wait_seconds_max: Optional[float] = None
+
+
+class SlowQueryResponse(BaseModel):
+    """A statement slower than SLOW_QUERY_MS, with its parameters redacted to their types."""
+    at: str
+    route: Optional[str] = None
+    duration_ms: float
+    statement: str
+    parameters: Any = None
+    plan: Optional[str] = None
+
+
+class ProfileResponse(BaseModel):
+    """A pstats dump of a profiled request."""
+    name: str
+    size: int
+    created_at: str
@@ -0,0 +1,26 @@
+"""Visitor DTOs - HTTP response models."""
+
+from pydantic import BaseModel
+from typing import List
+from datetime import datetime
+
+from .lead_dto import LeadResponse
+
+
+class LinkedVisitorsResponse(BaseModel):
+    """Near-duplicate visitors linked to a visitor, with their leads."""
+    visitor_id: str
+    linked_visitor_ids: List[str]
+    leads: List[LeadResponse]
+
+
+class VisitorSessionResponse(BaseModel):
+    """Reconstructed visitor session with its page path."""
+    visitor_id: str
+    started_at: datetime
+    ended_at: datetime
+    pages: List[str]
+    report_count: int
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,145 @@
+"""
+Liveness and readiness probes.
+
+HealthProbeMiddleware is the outermost layer of both apps and answers
+/healthz and /readyz itself, so probes go through no other middleware, no
+routing and no authentication.
+
+- /healthz does no I/O: if the worker answers, it is alive.
+- /readyz runs the readiness checks (a pooled connection per database, the
+  schema at the migration head, and any check the app adds, such as the
+  OIDC key cache) and answers 503 if one fails. The result is cached for
+  READYZ_CACHE_SECONDS, so a probe storm reaches the database at most once
+  per interval and worker. While one probe refreshes it, the others get the
+  previous result instead of waiting. A database check gives up after
+  READYZ_CHECK_TIMEOUT seconds.
+
+A check is a function returning a dict with an "ok" key and any details.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Callable, Dict
+
+from starlette.concurrency import run_in_threadpool
+
+PROBE_PATHS = ("/healthz", "/readyz")
+CHECK_TIMEOUT = float(os.environ.get("READYZ_CHECK_TIMEOUT", "2"))
+
+# Connection attempts run here so that a check can stop waiting for one that
+# hangs (an unreachable host, an exhausted pool); the attempt itself finishes
+# or fails in the background.
+_connect_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="readyz")
+
+
+def _connect(engine):
+    with engine.connect():
+        pass
+
+
+def database_check(engine, timeout: float = None) -> Callable[[], dict]:
+    """Check out (and, with pre-ping, test) a pooled connection of engine, within timeout seconds."""
+    timeout = CHECK_TIMEOUT if timeout is None else timeout
+
+    def check():
+        started = time.perf_counter()
+        try:
+            _connect_pool.submit(_connect, engine).result(timeout=timeout)
+        except TimeoutError:
+            return {"ok": False, "error": f"no connection after {timeout:g}s"}
+        except Exception as exc:
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        return {"ok": True, "ms": round((time.perf_counter() - started) * 1000, 1)}
+    return check
+
+
+def migrations_check(engine, versions_dir: str) -> Callable[[], dict]:
+    """Compare the revision of the database behind engine with the migration scripts' head."""
+    def check():
+        from run_migrations import current_revisions, script_heads
+
+        try:
+            current = current_revisions(engine)
+        except Exception as exc:
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        head = script_heads(versions_dir)
+        return {"ok": current == head, "current": sorted(current), "head": sorted(head)}
+    return check
+
+
+def database_checks() -> Dict[str, Callable[[], dict]]:
+    """Connection and schema checks of every database of this process."""
+    from infrastructure.database import analytics_engine, engine, replica_engine
+    from run_migrations import ANALYTICS_VERSIONS_DIR, VERSIONS_DIR
+
+    checks = {"database": database_check(engine), "migrations": migrations_check(engine, VERSIONS_DIR)}
+    if analytics_engine is not engine:
+        checks["analytics_database"] = database_check(analytics_engine)
+        checks["analytics_migrations"] = migrations_check(analytics_engine, ANALYTICS_VERSIONS_DIR)
+    if replica_engine is not None:
+        checks["replica_database"] = database_check(replica_engine)
+    return checks
+
+
+class HealthProbeMiddleware:
+    """Answers /healthz and /readyz before any other middleware runs."""
+
+    def __init__(self, app, checks: Dict[str, Callable[[], dict]], cache_seconds: float = None):
+        self.app = app
+        self.checks = checks
+        self.cache_seconds = cache_seconds if cache_seconds is not None else float(
+            os.environ.get("READYZ_CACHE_SECONDS", "5")
+        )
+        # (report, monotonic time of the checks), replaced as a whole.
+        self._report = None
+        self._lock = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] == "/healthz":
+            status, body = 200, {"status": "ok"}
+        else:
+            body = await run_in_threadpool(self.readiness)
+            status = 200 if body["status"] == "ready" else 503
+        payload = b"" if scope["method"] == "HEAD" else json.dumps(body).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode()),
+                (b"cache-control", b"no-store"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    def readiness(self) -> dict:
+        """The cached readiness report, recomputed by one thread once it is stale.
+
+        The other threads do not wait for it: they get the stale report, or
+        "not ready" while the first one is being computed.
+        """
+        if self._stale() and self._lock.acquire(blocking=False):
+            try:
+                if self._stale():
+                    results = {name: check() for name, check in self.checks.items()}
+                    self._report = ({
+                        "status": "ready" if all(result["ok"] for result in results.values()) else "not ready",
+                        "checks": results,
+                    }, time.monotonic())
+            finally:
+                self._lock.release()
+        report = self._report
+        if report is None:
+            return {"status": "not ready", "checks": {}, "age_seconds": None}
+        ready, checked_at = report
+        return dict(ready, age_seconds=round(time.monotonic() - checked_at, 1))
+
+    def _stale(self) -> bool:
+        report = self._report
+        return report is None or time.monotonic() - report[1] >= self.cache_seconds
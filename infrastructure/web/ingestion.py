@@ -0,0 +1,105 @@
+"""
+Public beacon endpoints (ALTCHA challenge, fingerprint and page report ingestion).
+
+These routes are served both by the full API (infrastructure.web.app) and by the
+lean ingestion app (infrastructure.web.ingestion_app). Keep this module free of
+CRM, mail, auth and migration imports so the ingestion workers stay small.
+"""
+import logging
+import os
+
+from dotenv import load_dotenv
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from application.fingerprint_service import FingerprintService
+from application.report_service import ReportService
+from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
+from infrastructure.persistence.repositories.sqlalchemy_report_repository import SqlAlchemyReportRepository
+from infrastructure.database import run_write
+from infrastructure.observability import TimedRoute, phase
+from infrastructure.web.container import container, LazyRepository
+from infrastructure.web.dependencies import get_db
+from infrastructure.web.dtos.fingerprint_dto import FingerprintRequest
+from infrastructure.web.dtos.report_dto import ReportRequest
+
+load_dotenv()
+
+logger = logging.getLogger("api app")
+
+ALTCHA_HMAC_KEY = os.environ.get('ALTCHA_HMAC_KEY')
+
+router = APIRouter(route_class=TimedRoute)
+
+
+def get_fingerprint_service(db: Session = Depends(get_db)) -> FingerprintService:
+    return FingerprintService(LazyRepository(SqlAlchemyFingerprintRepository, db), container.minhash_service)
+
+
+def get_report_service(db: Session = Depends(get_db)) -> ReportService:
+    return ReportService(
+        LazyRepository(SqlAlchemyReportRepository, db),
+        LazyRepository(SqlAlchemyFingerprintRepository, db)
+    )
+
+
+def verify_altcha_solution(altcha_solution: str):
+    if os.environ.get("ENV") != "pytest":
+        from altcha import verify_solution
+
+        if not ALTCHA_HMAC_KEY:
+            raise HTTPException(status_code=500, detail="ALTCHA_HMAC_KEY not configured")
+
+        with phase("altcha"):
+            is_valid, reason = verify_solution(altcha_solution, ALTCHA_HMAC_KEY)
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=f"Invalid ALTCHA solution: {reason}")
+
+
+@router.get("/altcha-challenge/")
+async def altcha_challenge():
+    if not ALTCHA_HMAC_KEY:
+        raise HTTPException(status_code=500, detail="ALTCHA_HMAC_KEY not configured")
+    from altcha import create_challenge
+
+    challenge = create_challenge(hmac_key=ALTCHA_HMAC_KEY)
+    return JSONResponse(content=challenge.to_dict())
+
+
+@router.post("/fingerprint/")
+def create_fingerprint(
+    fingerprint_request: FingerprintRequest,
+    db: Session = Depends(get_db)
+):
+    verify_altcha_solution(fingerprint_request.altcha)
+
+    try:
+        run_write(db, lambda session: get_fingerprint_service(session).create_fingerprint(
+            visitor_id=fingerprint_request.visitorId,
+            components=fingerprint_request.components
+        ))
+        return JSONResponse(status_code=200, content={'message': 'Fingerprint saved successfully'})
+    except Exception as e:
+        logger.exception("Error creating fingerprint")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/report/")
+def report_data(
+    report_request: ReportRequest,
+    db: Session = Depends(get_db)
+):
+    verify_altcha_solution(report_request.altcha)
+
+    try:
+        report = run_write(db, lambda session: get_report_service(session).create_report(
+            visitor_id=report_request.visitorId,
+            page=report_request.page
+        ))
+        if not report:
+            return JSONResponse(status_code=200, content={'warning': 'Fingerprint not found'})
+        return JSONResponse(status_code=200, content={'message': 'Report saved successfully'})
+    except Exception as e:
+        logger.exception("Error reporting data")
+        raise HTTPException(status_code=500, detail=str(e))
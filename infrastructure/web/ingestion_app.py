@@ -0,0 +1,51 @@
+"""
+Lean ASGI app serving only the public beacon endpoints.
+
+Deploy it as a separate process group in front of the high-volume tracking
+traffic (/fingerprint/, /report/, /altcha-challenge/) so the CRM API's
+authentication, mail, services and OpenAPI schema are never loaded there:
+
+    uvicorn infrastructure.web.ingestion_app:app
+
+Migrations are not run from here; the full API (or run_migrations.py) owns them.
+"""
+import os
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from infrastructure.observability import (
+    MetricsMiddleware, RequestContextMiddleware, ServerTimingMiddleware, configure_logging, server_timing_enabled
+)
+from infrastructure.web.health import HealthProbeMiddleware, database_checks
+from infrastructure.web.ingestion import router
+from infrastructure.web.telemetry import router as telemetry_router
+from infrastructure.web.lifespan import lifespan
+
+configure_logging()
+
+app = FastAPI(
+    title="Octobre ingestion API",
+    version="v1",
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+    lifespan=lifespan,
+)
+
+origins = os.environ.get('AUTHORIZED_ORIGINS', '').split(',')
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=origins,
+    allow_credentials=True,
+    allow_methods=["GET", "POST"],
+    allow_headers=["*"],
+)
+if server_timing_enabled():
+    app.add_middleware(ServerTimingMiddleware)
+app.add_middleware(RequestContextMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(HealthProbeMiddleware, checks=database_checks())
+
+app.include_router(router)
+app.include_router(telemetry_router)
@@ -0,0 +1,65 @@
+import logging
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import configure_mappers
+
+from infrastructure.database import close_write_queue, engines
+from infrastructure.observability import LoopLagMonitor
+
+logger = logging.getLogger("api app")
+
+
+def warm_up():
+    """Pay the one-off costs of the first request at worker startup.
+
+    Configures every ORM mapper (relationships, loader strategies) and opens
+    the first pooled connection so the dialect is initialised.
+    """
+    import infrastructure.persistence.models  # noqa: F401 - register every mapper first
+
+    configure_mappers()
+    for warm_engine in engines():
+        try:
+            with warm_engine.connect():
+                pass
+        except SQLAlchemyError:
+            # The database may come up after the workers; the pool will retry per request.
+            logger.warning("Database %s not reachable during warm-up", warm_engine.url, exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Worker startup/shutdown hooks shared by the full API and the ingestion app."""
+    logger.info("Starting %s worker", app.title)
+    warm_up()
+    loop_lag = app.state.loop_lag = LoopLagMonitor.from_env()
+    if loop_lag is not None:
+        loop_lag.start()
+    yield
+    if loop_lag is not None:
+        loop_lag.stop()
+    close_write_queue()
+    # Close pooled connections so the database sees a clean disconnect on
+    # graceful worker restarts instead of waiting for TCP timeouts.
+    for stopped_engine in engines():
+        stopped_engine.dispose()
+    logger.info("Stopped %s worker", app.title)
+
+
+@asynccontextmanager
+async def api_lifespan(app: FastAPI):
+    """Full API lifespan: make sure the schema is at head before serving.
+
+    entrypoint.sh normally migrated already, so workers only pay for a revision
+    lookup; if an upgrade is still needed, exactly one worker runs it.
+    """
+    # Not in the test environment: migrations are handled by the test setup.
+    if os.environ.get("ENV") != "pytest":
+        from run_migrations import migrate_all_if_needed
+        for name in migrate_all_if_needed():
+            logger.info("Database %s upgraded to the latest revision", name)
+    async with lifespan(app):
+        yield
@@ -0,0 +1,27 @@
+"""
+Operational endpoints shared by the full API and the ingestion app.
+
+/metrics is scraped by Prometheus, which does not speak OIDC. When
+METRICS_TOKEN is set, the scraper must send it as a bearer token. With
+ENV=production the token is required: without one, /metrics is refused.
+"""
+import os
+import secrets
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
+
+from infrastructure.observability.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(authorization: str = Header(default="")):
+    token = os.environ.get("METRICS_TOKEN")
+    if not token and os.environ.get("ENV") == "production":
+        raise HTTPException(status_code=403, detail="Set METRICS_TOKEN to expose metrics in production")
+    if token and not secrets.compare_digest(authorization, f"Bearer {token}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,31 @@
+"""Process hooks for gunicorn's preload mode (see gunicorn.conf.py).
+
+With GUNICORN_PRELOAD=1 the app is imported once in the master and the
+workers are forked from it, sharing its memory copy-on-write. These hooks
+keep that sharing effective and make the forked workers safe.
+"""
+import gc
+
+from sqlalchemy.orm import configure_mappers
+
+
+def prepare_master():
+    """Run in the master once the app is imported, before any worker is forked."""
+    # Building the mappers here means every worker inherits them instead of
+    # building (and writing to) its own copy in the lifespan.
+    configure_mappers()
+    # Move every object allocated so far out of the collector's reach: a GC
+    # pass in a worker would otherwise touch their headers and un-share pages.
+    gc.collect()
+    gc.freeze()
+
+
+def init_worker():
+    """Run in each worker right after the fork."""
+    from infrastructure.database import engines
+
+    # Pooled connections must never cross a fork. close=False drops the
+    # master's pool without closing sockets the master may still own;
+    # the worker opens its own connections on first use.
+    for engine in engines():
+        engine.dispose(close=False)
@@ -1,3 +1,8 @@
+"""WSGI adapter for hosts that can only run WSGI applications.
+
+Every request crosses an extra thread hand-off here; production deployments
+should serve infrastructure.web.asgi:app instead.
+"""
 from infrastructure.web.app import app as asgi_app
 from a2wsgi import ASGIMiddleware
 
@@ -0,0 +1,93 @@
+"""promote hot fingerprint components to indexed columns
+
+Revision ID: 3c9d5e7f2a41
+Revises: 4ed6f478ea75
+Create Date: 2026-10-19 09:12:40.118302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d5e7f2a41'
+down_revision: Union[str, Sequence[str], None] = '4ed6f478ea75'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROMOTED_COLUMNS = ('timezone', 'platform', 'screen_resolution')
+# Frozen copy of the component paths at the time of this revision: the
+# backfill must not change with FINGERPRINT_INDEXED_COMPONENTS or later mapper edits.
+COMPONENT_PATHS = {
+    'timezone': ('timezone',),
+    'platform': ('platform',),
+    'screen_resolution': ('screenResolution',),
+}
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _extract(components):
+    """Promoted column values of a fingerprint payload."""
+    extracted = {}
+    for column, path in COMPONENT_PATHS.items():
+        value = components or {}
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        # FingerprintJS wraps every component as {"value": ..., "duration": ...}
+        if isinstance(value, dict):
+            value = value.get('value')
+        if value is None or isinstance(value, dict):
+            extracted[column] = None
+        elif isinstance(value, (list, tuple)):
+            extracted[column] = 'x'.join(str(v) for v in value)
+        else:
+            extracted[column] = str(value)
+    return extracted
+
+
+def upgrade() -> None:
+    """Add the promoted component columns and backfill them from the JSON payload."""
+    with op.batch_alter_table('fingerprints', schema=None) as batch_op:
+        for column in PROMOTED_COLUMNS:
+            batch_op.add_column(sa.Column(column, sa.String(), nullable=True))
+            batch_op.create_index(f'ix_fingerprints_{column}', [column], unique=False)
+
+    fingerprints = sa.table(
+        'fingerprints',
+        sa.column('visitorId', sa.String()),
+        sa.column('components', sa.JSON()),
+        *(sa.column(column, sa.String()) for column in PROMOTED_COLUMNS)
+    )
+    # Python-side extraction keeps the backfill dialect independent; each
+    # batch is written with one executemany UPDATE.
+    update = (
+        fingerprints.update()
+        .where(fingerprints.c.visitorId == sa.bindparam('b_visitor_id'))
+        .values({column: sa.bindparam(f'b_{column}') for column in PROMOTED_COLUMNS})
+    )
+    bind = op.get_bind()
+    last_visitor_id = ''
+    while True:
+        rows = bind.execute(
+            sa.select(fingerprints.c.visitorId, fingerprints.c.components)
+            .where(fingerprints.c.visitorId > last_visitor_id)
+            .order_by(fingerprints.c.visitorId)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(update, [
+            {'b_visitor_id': visitor_id, **{f'b_{column}': value for column, value in _extract(components).items()}}
+            for visitor_id, components in rows
+        ])
+        last_visitor_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Drop the promoted component columns."""
+    with op.batch_alter_table('fingerprints', schema=None) as batch_op:
+        for column in PROMOTED_COLUMNS:
+            batch_op.drop_index(f'ix_fingerprints_{column}')
+            batch_op.drop_column(column)
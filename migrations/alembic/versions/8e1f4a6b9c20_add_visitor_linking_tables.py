@@ -0,0 +1,56 @@
+"""add minhash signature and visitor linking tables
+
+Revision ID: 8e1f4a6b9c20
+Revises: 3c9d5e7f2a41
+Create Date: 2026-10-19 10:05:12.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e1f4a6b9c20'
+down_revision: Union[str, Sequence[str], None] = '3c9d5e7f2a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are signed by the link_visitors job on its next run
+    with op.batch_alter_table('fingerprints', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('minhash_signature', sa.JSON(), nullable=True))
+
+    op.create_table(
+        'fingerprint_lsh_buckets',
+        sa.Column('bucket', sa.String(), nullable=False),
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['visitorId'], ['fingerprints.visitorId']),
+        sa.PrimaryKeyConstraint('bucket', 'visitorId')
+    )
+    op.create_index(
+        op.f('ix_fingerprint_lsh_buckets_visitorId'), 'fingerprint_lsh_buckets', ['visitorId'], unique=False
+    )
+
+    op.create_table(
+        'visitor_links',
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.Column('cluster_id', sa.String(), nullable=False),
+        sa.Column('linked_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['visitorId'], ['fingerprints.visitorId']),
+        sa.PrimaryKeyConstraint('visitorId')
+    )
+    op.create_index(op.f('ix_visitor_links_cluster_id'), 'visitor_links', ['cluster_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_visitor_links_cluster_id'), table_name='visitor_links')
+    op.drop_table('visitor_links')
+    op.drop_index(op.f('ix_fingerprint_lsh_buckets_visitorId'), table_name='fingerprint_lsh_buckets')
+    op.drop_table('fingerprint_lsh_buckets')
+    with op.batch_alter_table('fingerprints', schema=None) as batch_op:
+        batch_op.drop_column('minhash_signature')
@@ -0,0 +1,37 @@
+"""drop the leads -> fingerprints foreign key
+
+Revision ID: a6c3f9e2d810
+Revises: d47b2c81e5f3
+Create Date: 2026-10-19 14:05:12.418220
+
+The analytics tables (fingerprints, reports, ...) can live in their own
+database (ANALYTICS_DATABASE_URL), where no constraint can reach them.
+leads.fingerprint_visitor_id stays as a plain column.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3f9e2d810'
+down_revision: Union[str, Sequence[str], None] = 'd47b2c81e5f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_leads_fingerprint_visitor_id', type_='foreignkey')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('leads', schema=None) as batch_op:
+        batch_op.create_foreign_key(
+            'fk_leads_fingerprint_visitor_id',
+            'fingerprints',
+            ['fingerprint_visitor_id'], ['visitorId']
+        )
@@ -0,0 +1,56 @@
+"""add sessions and job watermarks tables
+
+Revision ID: d47b2c81e5f3
+Revises: 8e1f4a6b9c20
+Create Date: 2026-10-19 11:20:03.551870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd47b2c81e5f3'
+down_revision: Union[str, Sequence[str], None] = '8e1f4a6b9c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('ended_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('pages', sa.JSON(), nullable=False),
+        sa.Column('report_count', sa.Integer(), nullable=False),
+        sa.Column('last_report_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['visitorId'], ['fingerprints.visitorId']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sessions_id'), 'sessions', ['id'], unique=False)
+    op.create_index('ix_sessions_visitorId_started_at', 'sessions', ['visitorId', 'started_at'], unique=False)
+
+    op.create_table(
+        'job_watermarks',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('last_id', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+    # Streaming reports per visitor in time order is an index range scan
+    op.create_index('ix_reports_visitorId_created_at', 'reports', ['visitorId', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reports_visitorId_created_at', table_name='reports')
+    op.drop_table('job_watermarks')
+    op.drop_index('ix_sessions_visitorId_started_at', table_name='sessions')
+    op.drop_index(op.f('ix_sessions_id'), table_name='sessions')
+    op.drop_table('sessions')
@@ -0,0 +1,92 @@
+"""Alembic environment of the analytics database (ANALYTICS_DATABASE_URL).
+
+Only used when the analytics tables are split out of the main database; the
+main migrations (migrations/alembic) keep creating them there for
+single-database deployments.
+"""
+import os
+import sys
+from logging.config import fileConfig
+
+from sqlalchemy import engine_from_config
+from sqlalchemy import pool
+
+from alembic import context
+
+config = context.config
+
+if config.config_file_name is not None and not config.attributes.get("connection"):
+    fileConfig(config.config_file_name)
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from infrastructure.database import ANALYTICS_DATABASE_URL, ANALYTICS_TABLES, Base
+
+import infrastructure.persistence.models  # noqa: F401
+
+target_metadata = Base.metadata
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table":
+        return name in ANALYTICS_TABLES
+    table = getattr(object, "table", None)
+    return table is None or table.name in ANALYTICS_TABLES
+
+
+def _url() -> str:
+    if not ANALYTICS_DATABASE_URL:
+        raise RuntimeError(
+            "ANALYTICS_DATABASE_URL is not set: the analytics tables live in the main database "
+            "and are migrated by migrations/alembic"
+        )
+    return ANALYTICS_DATABASE_URL
+
+
+def run_migrations_offline() -> None:
+    """Run migrations in 'offline' mode."""
+    context.configure(
+        url=_url(),
+        target_metadata=target_metadata,
+        include_object=include_object,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode, on a connection handed over by the caller if any."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+
+    config.set_main_option('sqlalchemy.url', _url())
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with connectable.connect() as connection:
+        _run(connection)
+
+
+def _run(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+        render_as_batch=True
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
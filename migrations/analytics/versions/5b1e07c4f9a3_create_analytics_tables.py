@@ -0,0 +1,112 @@
+"""create analytics tables
+
+Revision ID: 5b1e07c4f9a3
+Revises:
+Create Date: 2026-10-19 14:29:11.101781
+
+Baseline of the analytics database, matching the main schema at a6c3f9e2d810.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e07c4f9a3'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'fingerprints',
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.Column('components', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('timezone', sa.String(), nullable=True),
+        sa.Column('platform', sa.String(), nullable=True),
+        sa.Column('screen_resolution', sa.String(), nullable=True),
+        sa.Column('minhash_signature', sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint('visitorId')
+    )
+    op.create_index(op.f('ix_fingerprints_visitorId'), 'fingerprints', ['visitorId'], unique=False)
+    op.create_index(op.f('ix_fingerprints_timezone'), 'fingerprints', ['timezone'], unique=False)
+    op.create_index(op.f('ix_fingerprints_platform'), 'fingerprints', ['platform'], unique=False)
+    op.create_index(op.f('ix_fingerprints_screen_resolution'), 'fingerprints', ['screen_resolution'], unique=False)
+
+    op.create_table(
+        'reports',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.Column('page', sa.String(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['visitorId'], ['fingerprints.visitorId']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_reports_id'), 'reports', ['id'], unique=False)
+    op.create_index('ix_reports_visitorId_created_at', 'reports', ['visitorId', 'created_at'], unique=False)
+
+    op.create_table(
+        'fingerprint_lsh_buckets',
+        sa.Column('bucket', sa.String(), nullable=False),
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['visitorId'], ['fingerprints.visitorId']),
+        sa.PrimaryKeyConstraint('bucket', 'visitorId')
+    )
+    op.create_index(op.f('ix_fingerprint_lsh_buckets_visitorId'), 'fingerprint_lsh_buckets', ['visitorId'], unique=False)
+
+    op.create_table(
+        'visitor_links',
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.Column('cluster_id', sa.String(), nullable=False),
+        sa.Column('linked_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.ForeignKeyConstraint(['visitorId'], ['fingerprints.visitorId']),
+        sa.PrimaryKeyConstraint('visitorId')
+    )
+    op.create_index(op.f('ix_visitor_links_cluster_id'), 'visitor_links', ['cluster_id'], unique=False)
+
+    op.create_table(
+        'sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('visitorId', sa.String(), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('ended_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('pages', sa.JSON(), nullable=False),
+        sa.Column('report_count', sa.Integer(), nullable=False),
+        sa.Column('last_report_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['visitorId'], ['fingerprints.visitorId']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sessions_id'), 'sessions', ['id'], unique=False)
+    op.create_index('ix_sessions_visitorId_started_at', 'sessions', ['visitorId', 'started_at'], unique=False)
+
+    op.create_table(
+        'job_watermarks',
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('last_id', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('job_watermarks')
+    op.drop_index('ix_sessions_visitorId_started_at', table_name='sessions')
+    op.drop_index(op.f('ix_sessions_id'), table_name='sessions')
+    op.drop_table('sessions')
+    op.drop_index(op.f('ix_visitor_links_cluster_id'), table_name='visitor_links')
+    op.drop_table('visitor_links')
+    op.drop_index(op.f('ix_fingerprint_lsh_buckets_visitorId'), table_name='fingerprint_lsh_buckets')
+    op.drop_table('fingerprint_lsh_buckets')
+    op.drop_index('ix_reports_visitorId_created_at', table_name='reports')
+    op.drop_index(op.f('ix_reports_id'), table_name='reports')
+    op.drop_table('reports')
+    op.drop_index(op.f('ix_fingerprints_screen_resolution'), table_name='fingerprints')
+    op.drop_index(op.f('ix_fingerprints_platform'), table_name='fingerprints')
+    op.drop_index(op.f('ix_fingerprints_timezone'), table_name='fingerprints')
+    op.drop_index(op.f('ix_fingerprints_visitorId'), table_name='fingerprints')
+    op.drop_table('fingerprints')
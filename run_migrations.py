@@ -1,20 +1,166 @@
+import ast
+import fcntl
+import functools
+import glob
+import hashlib
 import os
-from alembic.config import Config
-from alembic import command
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from sqlalchemy import inspect, text
+
+# Arbitrary application-wide key for pg_advisory_lock; every process that
+# migrates this database must use the same value.
+MIGRATION_LOCK_KEY = 7_236_541_983_001
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+VERSIONS_DIR = os.path.join(SCRIPT_DIR, "migrations", "alembic", "versions")
+# Separate history for the analytics database, only used with ANALYTICS_DATABASE_URL.
+ANALYTICS_SCRIPT_LOCATION = os.path.join(SCRIPT_DIR, "migrations", "analytics")
+ANALYTICS_VERSIONS_DIR = os.path.join(ANALYTICS_SCRIPT_LOCATION, "versions")
+
+_parse_lock = threading.Lock()
+
+
+def _alembic_config(section: str = "alembic", script_location: str = None):
+    # Alembic is only imported when an upgrade actually runs.
+    from alembic.config import Config
 
-def run_migrations():
     # Get the absolute path to the directory containing this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
+    script_dir = SCRIPT_DIR
     # Construct the absolute path to alembic.ini
     alembic_ini_path = os.path.join(script_dir, 'alembic.ini')
 
     # Create an Alembic configuration object
-    alembic_cfg = Config(alembic_ini_path)
-    alembic_cfg.set_main_option("script_location", os.path.join(script_dir, "migrations/alembic"))
+    alembic_cfg = Config(alembic_ini_path, ini_section=section)
+    alembic_cfg.set_main_option("script_location", script_location or os.path.join(script_dir, "migrations/alembic"))
+    return alembic_cfg
 
 
+def run_migrations():
+    from alembic import command
+
     # Run the 'upgrade head' command
-    command.upgrade(alembic_cfg, "head")
+    command.upgrade(_alembic_config(), "head")
+
+
+def run_analytics_migrations(engine):
+    """Upgrade the analytics database behind engine to its head."""
+    from alembic import command
+
+    alembic_cfg = _alembic_config("analytics", ANALYTICS_SCRIPT_LOCATION)
+    with engine.begin() as connection:
+        alembic_cfg.attributes["connection"] = connection
+        command.upgrade(alembic_cfg, "head")
+
+
+@functools.lru_cache(maxsize=None)
+def script_heads(versions_dir: str = VERSIONS_DIR) -> frozenset:
+    """Head revisions of the migration scripts, read statically.
+
+    Only the `revision` / `down_revision` assignments are parsed, so no
+    migration module (nor env.py) is imported.
+    """
+    revisions, parents = set(), set()
+    for path in glob.glob(os.path.join(versions_dir, "*.py")):
+        with open(path, encoding="utf-8") as script:
+            source = script.read()
+        # ast.parse is not safe to run from several threads at once on CPython 3.11.
+        with _parse_lock:
+            tree = ast.parse(source, filename=path)
+        for node in tree.body:
+            if isinstance(node, ast.AnnAssign):
+                target, value = node.target, node.value
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target, value = node.targets[0], node.value
+            else:
+                continue
+            if not isinstance(target, ast.Name) or value is None:
+                continue
+            if target.id == "revision":
+                revisions.add(ast.literal_eval(value))
+            elif target.id == "down_revision":
+                down_revision = ast.literal_eval(value)
+                if isinstance(down_revision, str):
+                    parents.add(down_revision)
+                elif down_revision:
+                    parents.update(down_revision)
+    return frozenset(revisions - parents)
+
+
+def current_revisions(engine) -> set:
+    """Revisions recorded in the alembic_version table (empty for a new database)."""
+    with engine.connect() as connection:
+        if not inspect(connection).has_table("alembic_version"):
+            return set()
+        return set(connection.execute(text("SELECT version_num FROM alembic_version")).scalars())
+
+
+def is_at_head(engine, versions_dir: str = VERSIONS_DIR) -> bool:
+    """Compare the stored revision with the script head without loading env.py."""
+    return current_revisions(engine) == script_heads(versions_dir)
+
+
+@contextmanager
+def migration_lock(engine):
+    """Serialize migrations: a Postgres advisory lock, or a file lock for other databases."""
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as connection:
+            connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            # The lock belongs to the session, not the transaction: don't sit idle in one.
+            connection.commit()
+            try:
+                yield
+            finally:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+                connection.commit()
+    else:
+        # SQLite (and anything else) can only be shared by processes on this host.
+        digest = hashlib.sha1(engine.url.render_as_string(hide_password=True).encode()).hexdigest()[:16]
+        lock_path = os.path.join(tempfile.gettempdir(), f"alembic-{digest}.lock")
+        with open(lock_path, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def migrate_if_needed(engine=None, versions_dir: str = VERSIONS_DIR, upgrade=None) -> bool:
+    """Upgrade to head unless the database is already there.
+
+    Only one process runs the upgrade; the others wait for the lock and then
+    find the database at head. Returns True when this process upgraded.
+    """
+    if engine is None:
+        from infrastructure.database import engine
+    if is_at_head(engine, versions_dir):
+        return False
+    with migration_lock(engine):
+        if is_at_head(engine, versions_dir):
+            return False
+        (upgrade or run_migrations)()
+    return True
+
+
+def migrate_all_if_needed() -> list:
+    """Gate the main database and, when split out, the analytics database.
+
+    Returns the names of the databases this process upgraded.
+    """
+    from infrastructure.database import analytics_engine, engine
+
+    upgraded = []
+    if migrate_if_needed(engine):
+        upgraded.append("main")
+    if analytics_engine is not engine and migrate_if_needed(
+        analytics_engine, ANALYTICS_VERSIONS_DIR, upgrade=lambda: run_analytics_migrations(analytics_engine)
+    ):
+        upgraded.append("analytics")
+    return upgraded
+
 
 if __name__ == "__main__":
-    run_migrations()
+    migrate_all_if_needed()
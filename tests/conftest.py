@@ -5,12 +5,14 @@ import os
 
 # Set ALTCHA_HMAC_KEY before importing the app
 os.environ.setdefault('ALTCHA_HMAC_KEY', 'test-hmac-key-for-altcha')
+# Relationships of LeadModel and ClassifiedEmailModel raise instead of lazy loading
+os.environ.setdefault('DB_STRICT_LOADING', '1')
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from infrastructure.web.app import app, get_current_user
 from infrastructure.web.auth import oauth2_scheme, TokenData
-from domain.orm import Lead, Contact, Company, Position, Concern, LeadPosition, LeadConcern, LeadUrgency, LeadStatus, NoteReason, Fingerprint, Report, LeadModificationLog
+from domain.orm import Lead, Contact, Company, Position, Concern, LeadPosition, LeadConcern, LeadUrgency, LeadStatus, NoteReason, Fingerprint, Report, LeadModificationLog, FingerprintLshBucket, VisitorLink, VisitorSession, JobWatermark
 
 # Override the OIDC dependency for testing
 async def override_get_current_user():
@@ -81,6 +83,10 @@ def clean_db_before_each_test():
     db.query(LeadConcern).delete()
     db.query(Lead).delete()
     db.query(Report).delete()
+    db.query(VisitorSession).delete()
+    db.query(JobWatermark).delete()
+    db.query(FingerprintLshBucket).delete()
+    db.query(VisitorLink).delete()
     db.query(Fingerprint).delete()
     db.query(Contact).delete()
     db.query(Company).delete()
@@ -88,3 +94,18 @@ def clean_db_before_each_test():
     db.query(Concern).delete()
     db.commit()
     db.close()
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: micro-benchmark compared with a stored baseline; run with -m benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Timings depend on the machine and on what runs alongside: benchmarks only
+    # run when selected explicitly, on their own.
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip = pytest.mark.skip(reason="micro-benchmark; run with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -0,0 +1,79 @@
+"""Tests for the fast "already at head" check and the locked upgrade in run_migrations."""
+
+import threading
+import time
+
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+
+import run_migrations
+from run_migrations import is_at_head, migrate_if_needed
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'gate.db'}", connect_args={"check_same_thread": False})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def script():
+    return ScriptDirectory.from_config(run_migrations._alembic_config())
+
+
+def stamp(engine, revision):
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        connection.execute(text("DELETE FROM alembic_version"))
+        connection.execute(text("INSERT INTO alembic_version (version_num) VALUES (:rev)"), {"rev": revision})
+
+
+def test_script_heads_match_alembic(script):
+    assert run_migrations.script_heads() == set(script.get_heads())
+
+
+def test_is_at_head_on_empty_database(engine):
+    assert is_at_head(engine) is False
+
+
+def test_is_at_head_when_stamped_at_head(engine, script):
+    stamp(engine, script.get_current_head())
+    assert is_at_head(engine) is True
+
+
+def test_is_at_head_when_behind(engine, script):
+    head = script.get_revision(script.get_current_head())
+    stamp(engine, head.down_revision)
+    assert is_at_head(engine) is False
+
+
+def test_migrate_if_needed_skips_upgrade_at_head(engine, script, monkeypatch):
+    stamp(engine, script.get_current_head())
+    monkeypatch.setattr(run_migrations, "run_migrations", lambda: pytest.fail("upgrade should not run"))
+
+    assert migrate_if_needed(engine) is False
+
+
+def test_concurrent_workers_upgrade_once(engine, script, monkeypatch):
+    head = script.get_current_head()
+    stamp(engine, script.get_revision(head).down_revision)
+    upgrades = []
+
+    def fake_upgrade():
+        upgrades.append(threading.get_ident())
+        time.sleep(0.2)
+        stamp(engine, head)
+
+    monkeypatch.setattr(run_migrations, "run_migrations", fake_upgrade)
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(migrate_if_needed(engine))) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(upgrades) == 1
+    assert sorted(results) == [False, False, False, True]
+    assert is_at_head(engine) is True
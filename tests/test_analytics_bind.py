@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from infrastructure import database
+from infrastructure.database import ANALYTICS_TABLES, AnalyticsRoutingSession, Base, session_factory
+from infrastructure.persistence.models import (
+    CompanyModel, ContactModel, FingerprintModel, LeadModel, LeadStatusModel, LeadUrgencyModel, NoteReasonModel,
+    ReportModel,
+)
+from infrastructure.persistence.repositories import SqlAlchemyReportRepository
+from run_migrations import ANALYTICS_VERSIONS_DIR, is_at_head, run_analytics_migrations
+
+
+def analytics_tables():
+    return [table for table in Base.metadata.sorted_tables if table.name in ANALYTICS_TABLES]
+
+
+def crm_tables():
+    return [table for table in Base.metadata.sorted_tables if table.name not in ANALYTICS_TABLES]
+
+
+@pytest.fixture
+def split_engines(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'crm.db'}")
+    analytics = create_engine(f"sqlite:///{tmp_path / 'analytics.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(primary, tables=crm_tables())
+    Base.metadata.create_all(analytics, tables=analytics_tables())
+    yield primary, analytics
+    primary.dispose()
+    analytics.dispose()
+
+
+def test_session_routes_analytics_models_to_their_engine(split_engines):
+    primary, analytics = split_engines
+    Session = session_factory(primary, analytics)
+    with Session() as session:
+        session.add(FingerprintModel(visitorId="split-visitor", components={}))
+        session.add(NoteReasonModel(name="split reason"))
+        session.commit()
+        session.add(ReportModel(visitorId="split-visitor", page="/"))
+        session.commit()
+        assert SqlAlchemyReportRepository(session).max_id() == 1
+        assert session.query(NoteReasonModel).count() == 1
+
+    assert "fingerprints" not in inspect(primary).get_table_names()
+    assert "note_reasons" not in inspect(analytics).get_table_names()
+
+
+def test_single_database_keeps_a_plain_session():
+    assert not issubclass(session_factory(database.engine, database.engine).class_, AnalyticsRoutingSession)
+
+
+def test_linked_visitors_join_leads_across_databases(client, tmp_path, monkeypatch):
+    analytics = create_engine(f"sqlite:///{tmp_path / 'analytics.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(analytics, tables=analytics_tables())
+    monkeypatch.setattr(database, "analytics_engine", analytics)
+    monkeypatch.setattr(database, "SessionLocal", session_factory(database.engine, analytics))
+
+    response = client.post("/fingerprint/", json={"visitorId": "cross-db", "components": {"a": 1}, "altcha": "x"})
+    assert response.status_code == 200
+    with analytics.connect() as connection:
+        assert connection.exec_driver_sql('SELECT "visitorId" FROM fingerprints').scalars().all() == ["cross-db"]
+
+    with database.SessionLocal() as session:
+        contact = ContactModel(name="Cross", email="cross@example.com")
+        company = CompanyModel(name="Cross Company", size=3)
+        session.add_all([contact, company])
+        session.flush()
+        session.add(LeadModel(
+            contact_id=contact.id,
+            company_id=company.id,
+            status_id=session.query(LeadStatusModel).filter_by(name="nouveau").one().id,
+            urgency_id=session.query(LeadUrgencyModel).filter_by(name="ce mois").one().id,
+            fingerprint_visitor_id="cross-db",
+            submission_date=datetime.now(),
+        ))
+        session.commit()
+
+    response = client.get("/visitors/cross-db/linked")
+    assert response.status_code == 200
+    assert [lead["contact"]["email"] for lead in response.json()["leads"]] == ["cross@example.com"]
+    analytics.dispose()
+
+
+def test_analytics_migrations_create_only_analytics_tables(tmp_path):
+    analytics = create_engine(f"sqlite:///{tmp_path / 'analytics.db'}")
+    assert is_at_head(analytics, ANALYTICS_VERSIONS_DIR) is False
+
+    run_analytics_migrations(analytics)
+
+    assert set(inspect(analytics).get_table_names()) == ANALYTICS_TABLES | {"alembic_version"}
+    assert is_at_head(analytics, ANALYTICS_VERSIONS_DIR) is True
+    analytics.dispose()
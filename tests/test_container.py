@@ -0,0 +1,35 @@
+from infrastructure.web.container import Container, LazyRepository
+from infrastructure.web.app import get_lead_service
+
+
+class RecordingRepository:
+    built = 0
+
+    def __init__(self, session):
+        RecordingRepository.built += 1
+        self.session = session
+
+    def find(self):
+        return self.session
+
+
+def test_lazy_repository_is_built_on_first_use_only():
+    RecordingRepository.built = 0
+    repository = LazyRepository(RecordingRepository, "session")
+    assert RecordingRepository.built == 0
+
+    assert repository.find() == "session"
+    assert repository.find() == "session"
+    assert RecordingRepository.built == 1
+
+
+def test_container_services_are_process_singletons():
+    container = Container()
+    assert container.minhash_service is container.minhash_service
+    assert container.email_notification_service.email_sender is container.email_sender
+
+
+def test_lead_service_shares_scoring_service_across_requests():
+    first = get_lead_service(db=None)
+    second = get_lead_service(db=None)
+    assert first._scoring_service is second._scoring_service
@@ -0,0 +1,18 @@
+from infrastructure.database import driver_options
+
+
+def test_psycopg_urls_prepare_statements(monkeypatch):
+    monkeypatch.delenv("DB_PREPARE_THRESHOLD", raising=False)
+    assert driver_options("postgresql+psycopg://user:pw@db/crm") == {"connect_args": {"prepare_threshold": 5}}
+
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "1")
+    assert driver_options("postgresql+psycopg://user:pw@db/crm") == {"connect_args": {"prepare_threshold": 1}}
+
+    monkeypatch.setenv("DB_PREPARE_THRESHOLD", "none")
+    assert driver_options("postgresql+psycopg://user:pw@db/crm") == {"connect_args": {"prepare_threshold": None}}
+
+
+def test_other_drivers_get_no_options():
+    assert driver_options("postgresql://user:pw@db/crm") == {}
+    assert driver_options("postgresql+psycopg2://user:pw@db/crm") == {}
+    assert driver_options("sqlite:///dev.db") == {}
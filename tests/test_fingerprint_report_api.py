@@ -10,7 +10,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from infrastructure.web.app import app, get_current_user
 from infrastructure.web.auth import oauth2_scheme, TokenData
-from domain.orm import Fingerprint, Report
+from domain.orm import Fingerprint, Report, FingerprintLshBucket, VisitorLink, VisitorSession, JobWatermark
 
 # Override the OIDC dependency for testing
 async def override_get_current_user():
@@ -81,6 +81,10 @@ def clean_fingerprint_report_tables():
     from infrastructure.database import SessionLocal
     db = SessionLocal()
     db.query(Report).delete()
+    db.query(VisitorSession).delete()
+    db.query(JobWatermark).delete()
+    db.query(FingerprintLshBucket).delete()
+    db.query(VisitorLink).delete()
     db.query(Fingerprint).delete()
     db.commit()
     db.close()
@@ -320,3 +324,90 @@ def test_create_multiple_reports_for_same_fingerprint(client):
     db.close()
 
 
+
+
+# Indexed component field tests
+def test_fingerprint_components_promoted_to_columns(client):
+    altcha_payload = get_altcha_payload(client)
+    data = {
+        "altcha": altcha_payload,
+        "visitorId": "indexed-visitor",
+        "components": {
+            "timezone": {"value": "Europe/Paris", "duration": 1},
+            "platform": {"value": "MacIntel", "duration": 0},
+            "screenResolution": {"value": [2560, 1440], "duration": 0}
+        }
+    }
+    response = client.post('/fingerprint/', json=data)
+    assert response.status_code == 200
+
+    from infrastructure.database import SessionLocal
+    db = SessionLocal()
+    fingerprint = db.query(Fingerprint).filter_by(visitorId="indexed-visitor").one()
+    assert fingerprint.timezone == "Europe/Paris"
+    assert fingerprint.platform == "MacIntel"
+    assert fingerprint.screen_resolution == "2560x1440"
+    db.close()
+
+    # Updating the components keeps the promoted columns in sync
+    data["altcha"] = get_altcha_payload(client)
+    data["components"]["platform"] = {"value": "Win32", "duration": 0}
+    response = client.post('/fingerprint/', json=data)
+    assert response.status_code == 200
+
+    db = SessionLocal()
+    fingerprint = db.query(Fingerprint).filter_by(visitorId="indexed-visitor").one()
+    assert fingerprint.platform == "Win32"
+    db.close()
+
+
+def test_search_fingerprints_by_components(client):
+    from infrastructure.database import SessionLocal
+    from infrastructure.persistence.mappers.fingerprint_mapper import extract_indexed_components
+    db = SessionLocal()
+    for visitor_id, timezone, platform in [
+        ("search-visitor-1", "Europe/Paris", "Linux"),
+        ("search-visitor-2", "Europe/Paris", "Win32"),
+        ("search-visitor-3", "America/New_York", "Linux"),
+    ]:
+        components = {"timezone": timezone, "platform": platform}
+        db.add(Fingerprint(visitorId=visitor_id, components=components, **extract_indexed_components(components)))
+    db.commit()
+    db.close()
+
+    response = client.get('/fingerprints/', params={"timezone": "Europe/Paris"})
+    assert response.status_code == 200
+    assert {f["visitor_id"] for f in response.json()} == {"search-visitor-1", "search-visitor-2"}
+
+    response = client.get('/fingerprints/', params={"timezone": "Europe/Paris", "platform": "Linux"})
+    assert response.status_code == 200
+    results = response.json()
+    assert [f["visitor_id"] for f in results] == ["search-visitor-1"]
+    assert results[0]["platform"] == "Linux"
+
+    response = client.get('/fingerprints/', params={"limit": 0})
+    assert response.status_code == 422
+
+
+def test_reextract_indexed_components_after_a_path_change(monkeypatch):
+    from infrastructure.database import SessionLocal
+    from infrastructure.persistence.mappers import fingerprint_mapper
+    from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import (
+        SqlAlchemyFingerprintRepository
+    )
+    db = SessionLocal()
+    components = {"platform": "Win32", "navigator": {"platform": "MacIntel"}}
+    db.add(Fingerprint(
+        visitorId="reextract-visitor", components=components,
+        **fingerprint_mapper.extract_indexed_components(components)
+    ))
+    db.commit()
+
+    monkeypatch.setitem(fingerprint_mapper.INDEXED_COMPONENT_PATHS, "platform", "navigator.platform")
+    repository = SqlAlchemyFingerprintRepository(db)
+    assert repository.reextract_indexed_components(batch_size=1) == 1
+    assert repository.reextract_indexed_components() == 0
+
+    db.expire_all()
+    assert db.query(Fingerprint).filter_by(visitorId="reextract-visitor").one().platform == "MacIntel"
+    db.close()
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from infrastructure.database import engine
+from infrastructure.observability import SERVER_TIMING_HEADER
+from infrastructure.web import auth
+from infrastructure.web.app import app
+from infrastructure.web.health import HealthProbeMiddleware, database_check
+from infrastructure.web.ingestion_app import app as ingestion_app
+
+
+def test_healthz_skips_every_other_layer():
+    # No dependency override applies here: the probe never reaches the router.
+    response = TestClient(app).get("/healthz")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert SERVER_TIMING_HEADER not in response.headers
+
+
+def test_readyz_reports_each_check(client):
+    body = client.get("/readyz").json()
+    assert body["checks"]["database"]["ok"] is True
+    assert {"migrations", "oidc"} <= set(body["checks"])
+    assert body["checks"]["oidc"]["ok"] is True
+
+
+def test_ingestion_app_has_the_probes():
+    client = TestClient(ingestion_app)
+    assert client.get("/healthz").status_code == 200
+    assert "database" in client.get("/readyz").json()["checks"]
+
+
+def test_readiness_is_cached_and_fails_with_a_check():
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        return {"ok": len(calls) > 1}
+
+    probe = HealthProbeMiddleware(app=None, checks={"db": database_check(engine), "flaky": flaky}, cache_seconds=60)
+    first = probe.readiness()
+    second = probe.readiness()
+
+    assert first["status"] == second["status"] == "not ready"
+    assert len(calls) == 1
+
+    probe.cache_seconds = 0
+    assert probe.readiness()["status"] == "ready"
+
+
+def test_readiness_does_not_wait_for_a_refresh_in_progress():
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        if len(calls) > 1:
+            started.set()
+            release.wait(5)
+        return {"ok": True}
+
+    probe = HealthProbeMiddleware(app=None, checks={"slow": slow}, cache_seconds=0)
+    assert probe.readiness()["status"] == "ready"
+    refresh = threading.Thread(target=probe.readiness)
+    refresh.start()
+    try:
+        assert started.wait(5)
+        # Served the previous report while the other thread runs the checks.
+        assert probe.readiness()["checks"] == {"slow": {"ok": True}}
+        assert len(calls) == 2
+    finally:
+        release.set()
+        refresh.join()
+
+
+def test_database_check_times_out():
+    class HangingEngine:
+        def connect(self):
+            time.sleep(1)
+            raise AssertionError("should have been abandoned")
+
+    started = time.perf_counter()
+    result = database_check(HangingEngine(), timeout=0.1)()
+    assert result == {"ok": False, "error": "no connection after 0.1s"}
+    assert time.perf_counter() - started < 0.5
+
+
+def test_oidc_keys_are_cached(monkeypatch):
+    fetches = []
+
+    async def fake_config():
+        fetches.append("config")
+        return {"issuer": "https://issuer", "jwks_uri": "https://issuer/jwks"}
+
+    async def fake_jwks(config):
+        return {"keys": [len(fetches)]}
+
+    monkeypatch.setattr(auth, "get_oidc_config", fake_config)
+    monkeypatch.setattr(auth, "get_jwks", fake_jwks)
+    monkeypatch.setattr(auth, "_oidc_cache", {"config": None, "jwks": None, "fetched_at": None})
+    assert auth.oidc_cache_state()["cached"] is False
+
+    first = asyncio.run(auth.get_signing_keys())
+    second = asyncio.run(auth.get_signing_keys())
+    # A refresh request right after a fetch is served from the cache too.
+    third = asyncio.run(auth.get_signing_keys(refresh=True))
+
+    assert first is not None and first == second == third
+    assert fetches == ["config"]
+    assert auth.oidc_cache_state()["cached"] is True
+
+
+def test_concurrent_misses_fetch_the_oidc_keys_once(monkeypatch):
+    fetches = []
+
+    async def fake_config():
+        fetches.append("config")
+        await asyncio.sleep(0.01)
+        return {"issuer": "https://issuer", "jwks_uri": "https://issuer/jwks"}
+
+    async def fake_jwks(config):
+        return {"keys": []}
+
+    monkeypatch.setattr(auth, "get_oidc_config", fake_config)
+    monkeypatch.setattr(auth, "get_jwks", fake_jwks)
+    monkeypatch.setattr(auth, "_oidc_cache", {"config": None, "jwks": None, "fetched_at": None})
+
+    async def burst():
+        monkeypatch.setattr(auth, "_oidc_lock", asyncio.Lock())
+        return await asyncio.gather(*(auth.get_signing_keys() for _ in range(10)))
+
+    results = asyncio.run(burst())
+    assert fetches == ["config"]
+    assert all(result == results[0] for result in results)
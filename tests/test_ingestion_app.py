@@ -0,0 +1,44 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from domain.orm import Report
+from infrastructure.database import SessionLocal
+from infrastructure.web.ingestion_app import app
+
+
+@pytest.fixture
+def ingestion_client():
+    return TestClient(app)
+
+
+def test_ingestion_app_stores_fingerprint_and_report(ingestion_client):
+    response = ingestion_client.post("/fingerprint/", json={
+        "visitorId": "ingest-visitor",
+        "components": {"timezone": {"value": "Europe/Paris"}},
+        "altcha": "test",
+    })
+    assert response.status_code == 200
+
+    response = ingestion_client.post("/report/", json={
+        "visitorId": "ingest-visitor", "page": "/pricing", "altcha": "test",
+    })
+    assert response.status_code == 200
+    assert response.json() == {"message": "Report saved successfully"}
+
+    db = SessionLocal()
+    try:
+        assert db.query(Report).filter(Report.visitorId == "ingest-visitor").count() == 1
+    finally:
+        db.close()
+
+
+def test_ingestion_app_serves_altcha_challenge(ingestion_client):
+    response = ingestion_client.get("/altcha-challenge/")
+    assert response.status_code == 200
+    assert "challenge" in response.json()
+
+
+def test_ingestion_app_does_not_expose_crm_routes(ingestion_client):
+    assert ingestion_client.get("/leads/").status_code == 404
+    assert ingestion_client.post("/lead/", json={}).status_code == 404
+    assert ingestion_client.get("/api/docs").status_code == 404
@@ -0,0 +1,83 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+
+from infrastructure.observability.logs import DebugSampler, JsonFormatter, parse_levels
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import logging
+from infrastructure.observability import configure_logging
+configure_logging()
+logging.getLogger("quiet").info("dropped by LOG_LEVELS")
+logging.getLogger("app").debug("dropped by LOG_DEBUG_SAMPLE")
+logging.getLogger("app").info("lead %s created", 42, extra={"server_timing": {"db": 1.5}})
+try:
+    1 / 0
+except ZeroDivisionError:
+    logging.getLogger("app").exception("failed")
+"""
+
+FORK_SCRIPT = """
+import logging, os, sys
+from infrastructure.observability import configure_logging
+configure_logging()
+logging.getLogger("app").info("before fork")
+pid = os.fork()
+if pid == 0:
+    logging.getLogger("app").info("from worker")
+    sys.exit(0)
+os.waitpid(pid, 0)
+logging.getLogger("app").info("from master")
+"""
+
+
+def run(env: dict, script: str = SCRIPT) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", script], cwd=ROOT, env=dict(os.environ, **env),
+        check=True, capture_output=True, text=True,
+    ).stdout
+
+
+def test_queued_json_logging():
+    out = run({"LOG_FORMAT": "json", "LOG_LEVEL": "DEBUG", "LOG_LEVELS": "quiet=WARNING", "LOG_DEBUG_SAMPLE": "0"})
+    lines = [json.loads(line) for line in out.splitlines()]
+
+    assert [line["message"] for line in lines] == ["lead 42 created", "failed"]
+    assert lines[0]["server_timing"] == {"db": 1.5}
+    assert lines[0]["logger"] == "app"
+    assert "ZeroDivisionError" in lines[1]["exception"]
+
+
+def test_synchronous_text_logging():
+    out = run({"LOG_QUEUE": "0", "LOG_LEVEL": "INFO"})
+    assert " - app - INFO - lead 42 created" in out
+    assert "dropped by LOG_LEVELS" in out
+    assert "dropped by LOG_DEBUG_SAMPLE" not in out
+
+
+def test_forked_workers_get_their_own_listener():
+    out = run({"LOG_FORMAT": "json"}, FORK_SCRIPT)
+    assert [json.loads(line)["message"] for line in out.splitlines()] == ["before fork", "from worker", "from master"]
+
+
+def test_parse_levels():
+    assert parse_levels("sqlalchemy.engine=info, api app=DEBUG,,broken") == {
+        "sqlalchemy.engine": "INFO", "api app": "DEBUG",
+    }
+
+
+def test_debug_sampler_keeps_info_and_above():
+    sampler = DebugSampler(0)
+    record = logging.LogRecord("app", logging.DEBUG, __file__, 1, "debug", None, None)
+    assert not sampler.filter(record)
+    record.levelno = logging.INFO
+    assert sampler.filter(record)
+
+
+def test_json_formatter_without_extra_fields():
+    record = logging.LogRecord("app", logging.WARNING, __file__, 1, "n=%d", (3,), None)
+    assert json.loads(JsonFormatter().format(record)).keys() == {"time", "level", "logger", "message"}
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+import time
+
+from infrastructure.observability import LoopLagMonitor, loop_lag
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from infrastructure.web.app import app
+
+
+def blocking_handler():
+    time.sleep(0.3)
+
+
+async def run_with_monitor(body):
+    monitor = LoopLagMonitor(threshold_ms=100, interval_ms=20)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        await body()
+        await asyncio.sleep(0.05)
+    finally:
+        monitor.stop()
+    return monitor
+
+
+def test_blocking_call_is_logged_with_its_stack(caplog, monkeypatch):
+    # Alembic's fileConfig in the migration tests disables existing loggers.
+    monkeypatch.setattr(loop_lag.logger, "disabled", False)
+
+    async def handler():
+        blocking_handler()
+
+    with caplog.at_level(logging.WARNING, logger="infrastructure.observability.loop_lag"):
+        monitor = asyncio.run(run_with_monitor(handler))
+
+    assert monitor.stalls == 1
+    assert monitor.max_lag >= 0.2
+    assert REGISTRY.get_sample_value("event_loop_lag_seconds") < 0.1  # back to normal after the stall
+    assert "blocking_handler" in caplog.text
+
+
+def test_awaiting_does_not_count_as_a_stall():
+    async def handler():
+        await asyncio.sleep(0.3)
+
+    monitor = asyncio.run(run_with_monitor(handler))
+    assert monitor.stalls == 0
+    assert monitor.max_lag < 0.1
+
+
+def test_api_requests_do_not_block_the_event_loop():
+    with TestClient(app) as client:
+        for path in ("/leads/", "/note-reasons/", "/altcha-challenge/", "/metrics"):
+            assert client.get(path).status_code == 200
+        assert app.state.loop_lag.stalls == 0
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+
+from infrastructure.observability.metrics import record_cache_lookup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def sample(body: str, line_start: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(line_start):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+def test_requests_are_counted_per_route_template(client):
+    counter = 'http_requests_total{method="GET",route="/leads/{lead_id}",status="404"}'
+    before = sample(client.get("/metrics").text, counter)
+
+    assert client.get("/leads/424242").status_code == 404
+    assert client.get("/leads/434343").status_code == 404
+
+    body = client.get("/metrics").text
+    assert sample(body, counter) == before + 2
+    assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/leads/{lead_id}"}' in body
+    assert "http_requests_in_flight" in body
+    assert 'db_pool_connections_in_use{engine="primary"}' in body
+
+
+def test_unknown_paths_share_one_series(client):
+    client.get("/no/such/path")
+    assert 'route="unmatched",status="404"' in client.get("/metrics").text
+
+
+def test_cache_lookups_are_exported(client):
+    record_cache_lookup("test-cache", hit=True)
+    record_cache_lookup("test-cache", hit=False)
+    body = client.get("/metrics").text
+    assert sample(body, 'cache_lookups_total{cache="test-cache",result="hit"}') >= 1
+    assert sample(body, 'cache_lookups_total{cache="test-cache",result="miss"}') >= 1
+
+
+def test_metrics_token(client, monkeypatch):
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+
+def test_metrics_require_a_token_in_production(client, monkeypatch):
+    monkeypatch.setenv("ENV", "production")
+    monkeypatch.delenv("METRICS_TOKEN", raising=False)
+    assert client.get("/metrics").status_code == 403
+
+    monkeypatch.setenv("METRICS_TOKEN", "scrape-secret")
+    assert client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
+
+
+def test_worker_processes_are_aggregated(tmp_path):
+    env = dict(os.environ, PROMETHEUS_MULTIPROC_DIR=str(tmp_path))
+    record = (
+        "from infrastructure.observability.metrics import REQUESTS; "
+        "REQUESTS.labels('GET', '/workers', '200').inc(3)"
+    )
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", record], cwd=ROOT, env=env, check=True)
+
+    render = "from infrastructure.observability.metrics import render_metrics; print(render_metrics()[0].decode())"
+    body = subprocess.run(
+        [sys.executable, "-c", render], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    assert sample(body, 'http_requests_total{method="GET",route="/workers",status="200"}') == 6
@@ -0,0 +1,43 @@
+"""Micro-benchmarks of mappers, scoring and DTO validation against their baselines.
+
+Skipped in the regular run; `pytest -m benchmark` runs them on their own. The
+baselines live in benchmarks/micro_baseline.json: after an intended change,
+refresh them with `python -m benchmarks.micro --update-baseline` on the
+reference machine. MICRO_BENCHMARK_TOLERANCE (3 by default) is how many times
+slower than its baseline a case may get; allocations are machine independent
+and only get a 25% margin.
+
+The cases are named after the baseline file, so collecting this module
+neither imports benchmarks.micro nor builds the cases.
+"""
+
+import json
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+with open(os.path.join(ROOT, "benchmarks", "micro_baseline.json"), encoding="utf-8") as baseline_file:
+    BASELINE = json.load(baseline_file)
+TOLERANCE = float(os.environ.get("MICRO_BENCHMARK_TOLERANCE", "3"))
+
+
+@pytest.fixture(scope="module")
+def micro():
+    from benchmarks import micro
+
+    return micro, micro.cases()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", sorted(BASELINE))
+def test_case_within_baseline(micro, name):
+    module, cases = micro
+    batch, run = cases[name]
+    measured = module.measure(batch, run)
+    baseline = BASELINE[name]
+
+    assert measured["us_per_op"] <= baseline["us_per_op"] * TOLERANCE, measured
+    assert measured["allocs_per_op"] <= baseline["allocs_per_op"] * 1.25 + 1, measured
+    assert measured["peak_bytes_per_op"] <= baseline["peak_bytes_per_op"] * 1.25 + 64, measured
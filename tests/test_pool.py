@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from infrastructure.database import pool_options
+from infrastructure.pool import InstrumentedQueuePool, pool_status
+
+
+@pytest.fixture
+def small_engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=1,
+        pool_timeout=0.2,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_options_read_environment(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "12")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "3")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "600")
+    monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+    options = pool_options()
+    assert options["pool_size"] == 12
+    assert options["max_overflow"] == 3
+    assert options["pool_timeout"] == 2.5
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is False
+
+
+def test_saturated_pool_reports_overflow_waits_and_timeouts(small_engine):
+    held = [small_engine.connect() for _ in range(3)]
+    status = pool_status(small_engine)
+    assert status["in_use"] == 3
+    assert status["overflow"] == 1
+
+    with pytest.raises(PoolTimeoutError):
+        small_engine.connect()
+    status = pool_status(small_engine)
+    assert status["timeouts"] == 1
+    assert status["wait_seconds_max"] >= 0.2
+
+    released = threading.Timer(0.05, held.pop().close)
+    released.start()
+    with small_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    released.join()
+    for connection in held:
+        connection.close()
+
+    status = pool_status(small_engine)
+    assert status["checkouts"] == 4
+    assert status["in_use"] == 0
+
+
+def test_stats_survive_dispose(small_engine):
+    small_engine.connect().close()
+    small_engine.dispose()
+    small_engine.connect().close()
+    assert pool_status(small_engine)["checkouts"] == 2
+
+
+def test_pool_metrics_endpoint(client):
+    response = client.get("/metrics/pool")
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body) == ["primary"]
+    assert body["primary"]["pool_class"] == "InstrumentedQueuePool"
+    assert body["primary"]["size"] == 5
+    assert body["primary"]["checkouts"] >= 1
+
+
+def test_pool_metrics_endpoint_lists_every_engine(client, small_engine, monkeypatch):
+    from infrastructure import database
+
+    monkeypatch.setattr(database, "replica_engine", small_engine)
+    body = client.get("/metrics/pool").json()
+    assert list(body) == ["primary", "replica"]
+    assert body["replica"]["size"] == small_engine.pool.size()
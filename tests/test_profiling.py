@@ -0,0 +1,63 @@
+import pstats
+
+import pytest
+
+from infrastructure.observability import PROFILE_ID_HEADER
+from infrastructure.web import app as app_module
+from infrastructure.web import auth
+from infrastructure.web.auth import TokenData
+
+BEARER = {"Authorization": "Bearer admin-token"}
+
+
+@pytest.fixture
+def profiles(tmp_path, monkeypatch):
+    async def fake_current_user(token):
+        return TokenData(username="testuser")
+
+    monkeypatch.setattr(auth, "get_current_user", fake_current_user)
+    monkeypatch.setenv("ADMIN_USERS", "testuser")
+    monkeypatch.setattr(app_module.profile_store, "directory", str(tmp_path))
+    monkeypatch.setattr(app_module.profile_store, "capacity", 2)
+    return tmp_path
+
+
+def test_flagged_admin_request_is_profiled(client, profiles):
+    response = client.get("/leads/", headers={**BEARER, "X-Profile": "1"})
+
+    assert response.status_code == 200
+    name = response.headers[PROFILE_ID_HEADER]
+    stats = pstats.Stats(str(profiles / name))
+    assert any(function == "list_leads" for _, _, function in stats.stats)
+
+
+def test_query_flag_works_too(client, profiles):
+    response = client.get("/leads/?profile=1", headers=BEARER)
+    assert PROFILE_ID_HEADER in response.headers
+
+
+def test_requests_are_not_profiled_without_flag_or_admin(client, profiles, monkeypatch):
+    assert PROFILE_ID_HEADER not in client.get("/leads/", headers=BEARER).headers
+    assert PROFILE_ID_HEADER not in client.get("/leads/", headers={"X-Profile": "1"}).headers
+
+    monkeypatch.setenv("ADMIN_USERS", "someone-else")
+    assert PROFILE_ID_HEADER not in client.get("/leads/", headers={**BEARER, "X-Profile": "1"}).headers
+    assert list(profiles.iterdir()) == []
+
+
+def test_only_the_most_recent_dumps_are_kept(client, profiles):
+    names = [client.get("/leads/", headers={**BEARER, "X-Profile": "1"}).headers[PROFILE_ID_HEADER] for _ in range(3)]
+    assert sorted(path.name for path in profiles.iterdir()) == sorted(names[1:])
+
+
+def test_admin_lists_and_downloads_dumps(client, profiles):
+    name = client.get("/leads/", headers={**BEARER, "X-Profile": "1"}).headers[PROFILE_ID_HEADER]
+
+    listed = client.get("/admin/profiles")
+    assert listed.status_code == 200
+    assert [entry["name"] for entry in listed.json()] == [name]
+
+    download = client.get(f"/admin/profiles/{name}")
+    assert download.status_code == 200
+    assert download.content == (profiles / name).read_bytes()
+    assert client.get("/admin/profiles/..%2Fsecret.pstats").status_code == 404
@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from domain.orm import Company, Contact, Lead, LeadStatus, LeadUrgency
+from infrastructure.database import GUARDED_LAZY, SessionLocal
+from infrastructure.observability import QUERY_COUNT_HEADER, assert_max_queries, count_queries, max_queries
+
+
+def add_leads(count, prefix="counted"):
+    db = SessionLocal()
+    status = db.query(LeadStatus).filter_by(name="nouveau").one()
+    urgency = db.query(LeadUrgency).filter_by(name="immédiat").one()
+    for i in range(count):
+        company = Company(name=f"{prefix} company {i}", size=100 * i)
+        contact = Contact(name=f"{prefix} contact {i}", email=f"{prefix}{i}@example.com", job_title="CTO")
+        db.add_all([company, contact])
+        db.flush()
+        db.add(Lead(contact_id=contact.id, company_id=company.id, status_id=status.id, urgency_id=urgency.id))
+    db.commit()
+    db.close()
+
+
+def test_count_queries_records_statements():
+    db = SessionLocal()
+    try:
+        with count_queries() as stats:
+            db.query(LeadStatus).all()
+            db.query(LeadUrgency).all()
+        db.query(LeadStatus).all()
+    finally:
+        db.close()
+
+    assert stats.count == 2
+    assert stats.seconds > 0
+    assert "lead_statuses" in stats.statements[0]
+
+
+def test_max_queries_lists_the_statements_over_budget():
+    db = SessionLocal()
+    try:
+        with pytest.raises(AssertionError, match="lead_urgencies"):
+            with max_queries(1):
+                db.query(LeadStatus).all()
+                db.query(LeadUrgency).all()
+    finally:
+        db.close()
+
+
+def test_repeated_statements_are_reported():
+    db = SessionLocal()
+    try:
+        with count_queries() as stats:
+            for name in ("nouveau", "nouveau", "nouveau"):
+                db.query(LeadStatus).filter_by(name=name).all()
+    finally:
+        db.close()
+    assert list(stats.repeated(3).values()) == [3]
+    assert stats.repeated(4) == {}
+
+
+def test_strict_loading_raises_on_lazy_load():
+    assert GUARDED_LAZY == "raise_on_sql"
+    add_leads(1)
+    db = SessionLocal()
+    try:
+        lead = db.query(Lead).one()
+        with pytest.raises(InvalidRequestError):
+            lead.contact
+    finally:
+        db.close()
+
+
+def test_lead_list_query_count_does_not_grow_with_leads(client):
+    add_leads(1)
+    one = client.get("/leads/")
+    add_leads(5, prefix="more")
+    six = client.get("/leads/")
+
+    assert len(six.json()) == 6
+    assert int(six.headers[QUERY_COUNT_HEADER]) == int(one.headers[QUERY_COUNT_HEADER])
+    assert_max_queries(six, 3)
@@ -0,0 +1,92 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from infrastructure import database
+from infrastructure.database import Base
+from infrastructure.persistence.models import FingerprintModel, LeadModel, NoteReasonModel
+from infrastructure.web.app import app
+from infrastructure.web.dependencies import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER
+
+
+@pytest.fixture
+def replica(tmp_path, monkeypatch):
+    """A second SQLite file standing in for the replica, holding different rows."""
+    replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(bind=replica_engine)
+    ReplicaSession = sessionmaker(bind=replica_engine)
+    with ReplicaSession() as session:
+        session.add(NoteReasonModel(name="replica only"))
+        session.commit()
+    monkeypatch.setattr(database, "ReplicaSessionLocal", ReplicaSession)
+    yield
+    replica_engine.dispose()
+
+
+def reason_names(response):
+    assert response.status_code == 200
+    return {reason["name"] for reason in response.json()}
+
+
+def fingerprint_payload():
+    return {"visitorId": "replica-visitor", "components": {}, "altcha": "x"}
+
+
+def test_get_requests_read_from_the_replica(replica):
+    client = TestClient(app)
+    assert reason_names(client.get("/note-reasons/")) == {"replica only"}
+
+
+def test_header_forces_reads_from_the_primary(replica):
+    client = TestClient(app)
+    names = reason_names(client.get("/note-reasons/", headers={READ_PRIMARY_HEADER: "1"}))
+    assert "appel sortant" in names and "replica only" not in names
+
+
+def email_account_payload():
+    return {"name": "replica", "imap_host": "imap.example.com", "imap_username": "u", "imap_password": "p"}
+
+
+def test_reads_stick_to_the_primary_after_a_mutation(replica):
+    client = TestClient(app)
+    response = client.post("/email-accounts/", json=email_account_payload())
+    assert response.status_code == 200
+    assert READ_PRIMARY_COOKIE in response.cookies
+    assert "replica only" not in reason_names(client.get("/note-reasons/"))
+
+    client.cookies.clear()
+    assert reason_names(client.get("/note-reasons/")) == {"replica only"}
+
+
+def test_no_sticky_cookie_without_replica():
+    response = TestClient(app).post("/email-accounts/", json=email_account_payload())
+    assert response.status_code == 200
+    assert READ_PRIMARY_COOKIE not in response.cookies
+
+
+def test_no_sticky_cookie_for_beacons(replica):
+    # Anonymous beacon clients never read from the CRM
+    response = TestClient(app).post("/fingerprint/", json=fingerprint_payload())
+    assert response.status_code == 200
+    assert READ_PRIMARY_COOKIE not in response.cookies
+
+
+def test_replica_sessions_read_the_analytics_tables_from_the_replica(tmp_path, monkeypatch):
+    replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    try:
+        # Analytics shares the primary: everything is read from the replica.
+        monkeypatch.setattr(database, "analytics_engine", database.engine)
+        with database.replica_session_factory(replica_engine)() as session:
+            assert session.get_bind(LeadModel) is replica_engine
+            assert session.get_bind(FingerprintModel) is replica_engine
+
+        # Analytics has its own database, which the replica does not hold.
+        analytics_engine = create_engine(f"sqlite:///{tmp_path / 'analytics.db'}")
+        monkeypatch.setattr(database, "analytics_engine", analytics_engine)
+        with database.replica_session_factory(replica_engine)() as session:
+            assert session.get_bind(LeadModel) is replica_engine
+            assert session.get_bind(FingerprintModel) is analytics_engine
+        analytics_engine.dispose()
+    finally:
+        replica_engine.dispose()
@@ -0,0 +1,70 @@
+import time
+from unittest.mock import patch
+
+from infrastructure.observability import SERVER_TIMING_HEADER, phase
+from infrastructure.observability.timing import _NO_PHASE, Timings, _current
+
+LEAD = {
+    "lead": {
+        "name": "Timed Lead",
+        "email": "timed@example.com",
+        "company_name": "Timed Corp",
+        "positions": [],
+        "concerns": [],
+        "urgency": "immédiat",
+        "conscent": True,
+    },
+    "altcha": "not verified under pytest",
+}
+
+
+def durations(response) -> dict:
+    phases = {}
+    for entry in response.headers[SERVER_TIMING_HEADER].split(", "):
+        name, duration = entry.split(";dur=")
+        phases[name] = float(duration)
+    return phases
+
+
+def slow_send(*args, **kwargs):
+    with phase("smtp"):
+        time.sleep(0.02)
+
+
+def test_lead_submission_breaks_down_its_latency(client):
+    with patch(
+        "application.notification_service.EmailNotificationService.send_lead_notification_email",
+        side_effect=slow_send,
+    ):
+        response = client.post("/lead/", json=LEAD)
+
+    assert response.status_code == 200
+    phases = durations(response)
+    assert set(phases) >= {"db", "smtp", "total"}
+    assert phases["smtp"] >= 20
+    assert phases["total"] >= phases["db"] + phases["smtp"]
+
+
+def test_serialization_is_timed_after_the_endpoint_returns(client):
+    phases = durations(client.get("/leads/"))
+    assert set(phases) == {"db", "serialization", "total"}
+
+
+def test_nested_phases_are_counted_once():
+    timings = Timings()
+    token = _current.set(timings)
+    try:
+        with phase("db"):
+            # A service method calling another: the inner block is not added again.
+            assert phase("db") is _NO_PHASE
+            with phase("smtp"):
+                pass
+    finally:
+        _current.reset(token)
+    assert set(timings.phases) == {"db", "smtp"}
+
+
+def test_phase_is_a_no_op_outside_requests():
+    assert phase("db") is _NO_PHASE
+    with phase("db"):
+        pass
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from infrastructure.observability import SlowQueryLog, redact
+from infrastructure.observability import RequestContextMiddleware, current_route
+from infrastructure.observability.context import _scope
+from infrastructure.web import app as web_app
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'slow.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    yield engine
+    engine.dispose()
+
+
+def test_redact_keeps_only_types():
+    assert redact(("ada@example.com", 3)) == ["str", "int"]
+    assert redact({"email": "ada@example.com"}) == {"email": "str"}
+    assert redact([("a", 1), ("b", 2)]) == {"rows": 2, "first": ["str", "int"]}
+
+
+def test_statements_over_threshold_are_recorded_with_route(sqlite_engine):
+    log = SlowQueryLog(threshold_ms=0, capacity=2)
+    log.install(sqlite_engine)
+    token = _scope.set({"method": "GET", "path": "/items/"})
+    try:
+        with sqlite_engine.connect() as connection:
+            connection.execute(text("SELECT name FROM items WHERE name = :name"), {"name": "secret"})
+    finally:
+        _scope.reset(token)
+
+    [entry] = [e for e in log.entries() if "FROM items" in e["statement"]]
+    assert entry["route"] == "GET /items/"
+    assert entry["parameters"] == ["str"]
+    assert "secret" not in str(entry)
+
+
+def test_route_is_the_matched_template():
+    app = FastAPI()
+    app.add_middleware(RequestContextMiddleware)
+
+    @app.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"route": current_route()}
+
+    with TestClient(app) as client:
+        assert client.get("/items/42").json() == {"route": "GET /items/{item_id}"}
+
+
+def test_buffer_is_bounded(sqlite_engine):
+    log = SlowQueryLog(threshold_ms=0, capacity=3)
+    log.install(sqlite_engine)
+    with sqlite_engine.connect() as connection:
+        for n in range(10):
+            connection.execute(text(f"SELECT {n}"))
+    assert [entry["statement"] for entry in log.entries()] == ["SELECT 9", "SELECT 8", "SELECT 7"]
+
+
+def test_fast_statements_are_not_recorded(sqlite_engine):
+    log = SlowQueryLog(threshold_ms=10_000)
+    log.install(sqlite_engine)
+    with sqlite_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert log.entries() == []
+
+
+def test_slow_selects_are_explained_in_the_background(sqlite_engine):
+    log = SlowQueryLog(threshold_ms=0, explain=True)
+    log.install(sqlite_engine)
+    with sqlite_engine.connect() as connection:
+        connection.execute(text("SELECT name FROM items WHERE id = :id"), {"id": 1})
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        [entry] = [e for e in log.entries() if "FROM items" in e["statement"]]
+        if entry["plan"]:
+            break
+        time.sleep(0.01)
+    assert "items" in entry["plan"]
+    # The EXPLAIN itself is not logged.
+    assert not any(e["statement"].startswith("EXPLAIN") for e in log.entries())
+
+
+def test_slow_query_endpoint_requires_admin(client, monkeypatch):
+    monkeypatch.delenv("ADMIN_USERS", raising=False)
+    assert client.get("/admin/slow-queries").status_code == 403
+
+
+def test_slow_query_endpoint_lists_entries(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_USERS", "someone,testuser")
+    log = SlowQueryLog(threshold_ms=0)
+    log.record(None, "SELECT * FROM leads", (), 0.25)
+    monkeypatch.setattr(web_app.database, "slow_query_log", log)
+
+    response = client.get("/admin/slow-queries")
+
+    assert response.status_code == 200
+    [entry] = response.json()
+    assert entry["statement"] == "SELECT * FROM leads"
+    assert entry["duration_ms"] == 250
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from infrastructure import database
+from infrastructure.sqlite import WriteQueue, configure_sqlite
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path):
+    engine = configure_sqlite(create_engine(
+        f"sqlite:///{tmp_path / 'writes.db'}", connect_args={"check_same_thread": False}
+    ))
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE items (name TEXT UNIQUE)"))
+    yield engine
+    engine.dispose()
+
+
+def count_items(engine):
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT count(*) FROM items")).scalar()
+
+
+def test_connections_use_the_sqlite_profile(sqlite_engine):
+    with sqlite_engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert connection.execute(text("PRAGMA cache_size")).scalar() == -65536
+
+
+def test_savepoint_rollback_keeps_outer_transaction(sqlite_engine):
+    with sqlite_engine.connect().execution_options(sqlite_begin="IMMEDIATE") as connection, connection.begin():
+        connection.execute(text("INSERT INTO items VALUES ('kept')"))
+        savepoint = connection.begin_nested()
+        connection.execute(text("INSERT INTO items VALUES ('dropped')"))
+        savepoint.rollback()
+    assert count_items(sqlite_engine) == 1
+
+
+def test_write_queue_group_commits_concurrent_writes(sqlite_engine):
+    commits = []
+    event.listen(sqlite_engine, "commit", lambda connection: commits.append(1))
+    write_queue = WriteQueue(sqlite_engine)
+    released = threading.Event()
+
+    def insert(n, hold=False):
+        def work(session):
+            if hold:
+                released.wait()
+            session.execute(text("INSERT INTO items VALUES (:n)"), {"n": str(n)})
+        write_queue.submit(work)
+
+    # The first write holds the writer until the 19 others are queued behind it.
+    threads = [threading.Thread(target=insert, args=(0, True))]
+    threads[0].start()
+    while write_queue._jobs.qsize():
+        time.sleep(0.001)
+    threads += [threading.Thread(target=insert, args=(n,)) for n in range(1, 20)]
+    for thread in threads[1:]:
+        thread.start()
+    while write_queue._jobs.qsize() < 19:
+        time.sleep(0.001)
+    released.set()
+    for thread in threads:
+        thread.join()
+    write_queue.close()
+
+    assert count_items(sqlite_engine) == 20
+    assert len(commits) == 2
+
+
+def test_write_queue_isolates_failing_writes(sqlite_engine):
+    write_queue = WriteQueue(sqlite_engine)
+    # Repositories commit themselves: inside the queue that only releases the savepoint.
+    def insert(name):
+        def work(session):
+            session.execute(text("INSERT INTO items VALUES (:name)"), {"name": name})
+            session.commit()
+            return name
+        return work
+
+    assert write_queue.submit(insert("a")) == "a"
+    with pytest.raises(Exception):
+        write_queue.submit(insert("a"))
+    assert write_queue.submit(insert("b")) == "b"
+    write_queue.close()
+    assert count_items(sqlite_engine) == 2
+
+
+def test_write_queue_submit_does_not_wait_forever(sqlite_engine):
+    write_queue = WriteQueue(sqlite_engine, timeout=0.2)
+    released = threading.Event()
+    blocker = threading.Thread(target=write_queue.submit, args=(lambda session: released.wait(),))
+    blocker.start()
+    with pytest.raises(TimeoutError):
+        write_queue.submit(lambda session: None)
+    released.set()
+    blocker.join()
+    write_queue.close()
+
+    # Once the writer thread is gone, submit fails at once.
+    with pytest.raises(RuntimeError):
+        write_queue.submit(lambda session: None)
+
+
+def test_ingestion_writes_go_through_the_queue(client, monkeypatch):
+    monkeypatch.setenv("SQLITE_WRITE_QUEUE", "1")
+    submitted = []
+    submit = WriteQueue.submit
+
+    def spy(write_queue, work):
+        submitted.append(work)
+        return submit(write_queue, work)
+
+    monkeypatch.setattr(WriteQueue, "submit", spy)
+    try:
+        response = client.post("/fingerprint/", json={
+            "visitorId": "queued-visitor", "components": {"timezone": "Europe/Paris"}, "altcha": "x"
+        })
+        assert response.status_code == 200
+        response = client.post("/report/", json={"visitorId": "queued-visitor", "page": "/", "altcha": "x"})
+        assert response.json() == {"message": "Report saved successfully"}
+        assert len(submitted) == 2
+    finally:
+        database.close_write_queue()
@@ -0,0 +1,65 @@
+"""Startup regressions: import time, lazily imported subsystems and first-request latency.
+
+Budgets live in benchmarks/startup_budget.json; `python -m benchmarks.importtime`
+shows where the import time goes when one of these fails.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.importtime import load_budget
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The app logs to stdout from a listener thread, whose lines could mix with the
+# result: the child only logs warnings, and the result line is marked.
+RESULT = "RESULT "
+
+
+def run_fresh(code: str) -> dict:
+    """Run code in a new interpreter (cold imports) and return the JSON it prints after RESULT."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR, env=dict(os.environ, ENV="pytest", LOG_LEVEL="WARNING"),
+        capture_output=True, text=True, check=True,
+    )
+    [line] = [line for line in result.stdout.splitlines() if line.startswith(RESULT)]
+    return json.loads(line[len(RESULT):])
+
+
+def test_app_import_within_budget():
+    measured = run_fresh(
+        "import json, time\n"
+        "started = time.perf_counter()\n"
+        "import infrastructure.web.app\n"
+        "print('RESULT ' + json.dumps({'ms': (time.perf_counter() - started) * 1000}))\n"
+    )
+    assert measured["ms"] <= load_budget()["import_ms"]
+
+
+def test_rarely_used_subsystems_are_imported_lazily():
+    loaded = run_fresh(
+        "import json, sys\n"
+        "import infrastructure.web.app\n"
+        "print('RESULT ' + json.dumps(sorted({m.split('.')[0] for m in sys.modules})))\n"
+    )
+    for package in ("alembic", "altcha"):
+        assert package not in loaded
+
+
+def test_first_request_within_budget():
+    measured = run_fresh(
+        "import json, time\n"
+        "from fastapi.testclient import TestClient\n"
+        "from infrastructure.database import Base, engine\n"
+        "from infrastructure.web.app import app\n"
+        "Base.metadata.create_all(bind=engine)\n"
+        "with TestClient(app) as client:\n"
+        "    started = time.perf_counter()\n"
+        "    response = client.post('/report/', json={'visitorId': 'budget', 'page': '/', 'altcha': 'x'})\n"
+        "    elapsed = (time.perf_counter() - started) * 1000\n"
+        "print('RESULT ' + json.dumps({'status': response.status_code, 'ms': elapsed}))\n"
+    )
+    assert measured["status"] == 200
+    assert measured["ms"] <= load_budget()["first_request_ms"]
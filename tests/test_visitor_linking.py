@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime
+
+from application.fingerprint_service import FingerprintService
+from application.visitor_linking_service import VisitorLinkingService
+from domain.services.minhash_service import MinHashService
+from domain.orm import Lead, Contact, Company, LeadStatus, LeadUrgency, FingerprintLshBucket, VisitorLink
+from infrastructure.database import SessionLocal
+from infrastructure.persistence.repositories.sqlalchemy_fingerprint_repository import SqlAlchemyFingerprintRepository
+
+
+def make_components(version: int, **overrides):
+    components = {
+        f"component{i}": {"value": f"value-{i}", "duration": i}
+        for i in range(30)
+    }
+    components["userAgent"] = {"value": f"Mozilla/5.0 Chrome/{version}", "duration": 0}
+    components.update(overrides)
+    return components
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def fingerprint_service(db):
+    return FingerprintService(SqlAlchemyFingerprintRepository(db), MinHashService())
+
+
+@pytest.fixture
+def linking_service(db):
+    return VisitorLinkingService(SqlAlchemyFingerprintRepository(db), MinHashService(), threshold=0.7)
+
+
+def test_minhash_similarity_tracks_component_overlap():
+    minhash = MinHashService()
+    base = minhash.signature(make_components(120))
+    drifted = minhash.signature(make_components(121))
+    unrelated = minhash.signature({f"other{i}": i for i in range(30)})
+
+    assert minhash.similarity(base, base) == 1.0
+    assert minhash.similarity(base, drifted) > 0.8
+    assert minhash.similarity(base, unrelated) < 0.2
+    assert set(minhash.band_keys(base)) & set(minhash.band_keys(drifted))
+
+
+def test_minhash_signature_is_deterministic():
+    assert MinHashService().signature(make_components(1)) == MinHashService().signature(make_components(1))
+    assert MinHashService().signature({}) is None
+    assert MinHashService().band_keys(None) == []
+
+
+def test_fingerprint_write_stores_lsh_buckets(fingerprint_service, db):
+    fingerprint_service.create_fingerprint("bucket-visitor", make_components(120))
+    buckets = db.query(FingerprintLshBucket).filter_by(visitorId="bucket-visitor").all()
+    assert len(buckets) == MinHashService().bands
+
+    # Rewriting the components replaces the buckets instead of accumulating them
+    fingerprint_service.create_fingerprint("bucket-visitor", make_components(121))
+    assert db.query(FingerprintLshBucket).filter_by(visitorId="bucket-visitor").count() == MinHashService().bands
+
+
+def test_link_visitors_clusters_near_duplicates(fingerprint_service, linking_service, db):
+    fingerprint_service.create_fingerprint("visitor-a", make_components(120))
+    fingerprint_service.create_fingerprint("visitor-b", make_components(121))
+    fingerprint_service.create_fingerprint("visitor-c", {f"other{i}": i for i in range(30)})
+
+    assert linking_service.link_visitors() == 2
+
+    links = {link.visitorId: link.cluster_id for link in db.query(VisitorLink).all()}
+    assert links == {"visitor-a": "visitor-a", "visitor-b": "visitor-a"}
+    assert linking_service.get_linked_visitor_ids("visitor-b") == ["visitor-a"]
+    assert linking_service.get_linked_visitor_ids("visitor-c") == []
+    assert linking_service.get_linked_visitor_ids("unknown") is None
+
+
+def test_link_visitors_signs_legacy_fingerprints(linking_service, db):
+    from domain.orm import Fingerprint
+    db.add_all([
+        Fingerprint(visitorId="legacy-a", components=make_components(99)),
+        Fingerprint(visitorId="legacy-b", components=make_components(100)),
+    ])
+    db.commit()
+
+    assert linking_service.link_visitors() == 2
+    assert db.query(FingerprintLshBucket).filter_by(visitorId="legacy-a").count() > 0
+
+
+def test_get_linked_visitors_endpoint(client, fingerprint_service, db):
+    fingerprint_service.create_fingerprint("endpoint-a", make_components(120))
+    fingerprint_service.create_fingerprint("endpoint-b", make_components(121))
+
+    contact = Contact(name="Linked User", email="linked@example.com")
+    company = Company(name="Linked Company", size=10)
+    db.add_all([contact, company])
+    db.commit()
+    lead = Lead(
+        contact_id=contact.id,
+        company_id=company.id,
+        status_id=db.query(LeadStatus).filter_by(name="nouveau").one().id,
+        urgency_id=db.query(LeadUrgency).filter_by(name="ce mois").one().id,
+        fingerprint_visitor_id="endpoint-b",
+        submission_date=datetime.now()
+    )
+    db.add(lead)
+    db.commit()
+
+    # Matches are found through LSH buckets even before the clustering job ran
+    response = client.get("/visitors/endpoint-a/linked")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["visitor_id"] == "endpoint-a"
+    assert data["linked_visitor_ids"] == ["endpoint-b"]
+    assert [l["contact"]["email"] for l in data["leads"]] == ["linked@example.com"]
+
+    response = client.get("/visitors/unknown-visitor/linked")
+    assert response.status_code == 404
+
+
+def test_crowded_buckets_are_capped_but_still_linked(fingerprint_service, db):
+    for n in range(8):
+        fingerprint_service.create_fingerprint(f"twin-{n}", make_components(120))
+    repository = SqlAlchemyFingerprintRepository(db)
+    buckets = MinHashService().band_keys(repository.find_by_visitor_id("twin-7").minhash_signature)
+
+    candidates = repository.find_lsh_candidates(buckets, "twin-7", per_bucket=2)
+    assert sorted(candidate.visitor_id for candidate in candidates) == ["twin-0", "twin-1"]
+
+    linking = VisitorLinkingService(repository, MinHashService(), threshold=0.7, bucket_candidates=2)
+    assert linking.link_visitors() == 8
+    assert {link.cluster_id for link in db.query(VisitorLink).all()} == {"twin-0"}
@@ -0,0 +1,119 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from application.visitor_session_service import VisitorSessionService
+from domain.orm import Fingerprint, Report, VisitorSession, Lead, Contact, Company, LeadStatus, LeadUrgency
+from infrastructure.database import SessionLocal
+from infrastructure.persistence.repositories.sqlalchemy_report_repository import SqlAlchemyReportRepository
+from infrastructure.persistence.repositories.sqlalchemy_visitor_session_repository import SqlAlchemyVisitorSessionRepository
+
+START = datetime(2026, 1, 5, 9, 0, 0)
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def session_service(db):
+    return VisitorSessionService(
+        SqlAlchemyReportRepository(db),
+        SqlAlchemyVisitorSessionRepository(db),
+        gap=timedelta(minutes=30)
+    )
+
+
+def add_reports(db, visitor_id, visits):
+    """visits: list of (minutes after START, page)."""
+    db.add_all([
+        Report(visitorId=visitor_id, page=page, created_at=START + timedelta(minutes=minutes))
+        for minutes, page in visits
+    ])
+    db.commit()
+
+
+@pytest.fixture
+def visitors(db):
+    db.add_all([
+        Fingerprint(visitorId="session-visitor-1", components={}),
+        Fingerprint(visitorId="session-visitor-2", components={}),
+    ])
+    db.commit()
+
+
+def stored_sessions(db, visitor_id):
+    return db.query(VisitorSession).filter_by(visitorId=visitor_id).order_by(VisitorSession.started_at).all()
+
+
+def test_reconstruct_sessions_splits_on_gap(session_service, db, visitors):
+    add_reports(db, "session-visitor-1", [(0, "/"), (10, "/pricing"), (70, "/blog"), (85, "/contact")])
+    add_reports(db, "session-visitor-2", [(5, "/docs")])
+
+    assert session_service.reconstruct_sessions(batch_size=2) == 5
+
+    sessions = stored_sessions(db, "session-visitor-1")
+    assert [s.pages for s in sessions] == [["/", "/pricing"], ["/blog", "/contact"]]
+    assert sessions[1].report_count == 2
+    assert [s.pages for s in stored_sessions(db, "session-visitor-2")] == [["/docs"]]
+
+
+def test_reconstruct_sessions_is_incremental(session_service, db, visitors):
+    add_reports(db, "session-visitor-1", [(0, "/"), (10, "/pricing")])
+    assert session_service.reconstruct_sessions() == 2
+
+    # Nothing new since the watermark
+    assert session_service.reconstruct_sessions() == 0
+
+    # New reports extend the open session or start a new one
+    add_reports(db, "session-visitor-1", [(20, "/signup"), (120, "/")])
+    assert session_service.reconstruct_sessions() == 2
+
+    db.expire_all()
+    sessions = stored_sessions(db, "session-visitor-1")
+    assert [s.pages for s in sessions] == [["/", "/pricing", "/signup"], ["/"]]
+    assert sessions[0].ended_at.replace(tzinfo=None) == START + timedelta(minutes=20)
+
+
+def test_reconstruct_sessions_leaves_recent_reports_for_the_next_run(db, visitors):
+    # Reports younger than the settle window may sit behind uncommitted ones
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    db.add_all([
+        Report(visitorId="session-visitor-1", page="/", created_at=START),
+        Report(visitorId="session-visitor-1", page="/pricing", created_at=now - timedelta(seconds=5)),
+    ])
+    db.commit()
+    repositories = SqlAlchemyReportRepository(db), SqlAlchemyVisitorSessionRepository(db)
+
+    assert VisitorSessionService(*repositories, settle=timedelta(seconds=60)).reconstruct_sessions() == 1
+    assert VisitorSessionService(*repositories, settle=timedelta(0)).reconstruct_sessions() == 1
+
+
+def test_get_lead_session_path(client, session_service, db, visitors):
+    add_reports(db, "session-visitor-1", [(0, "/"), (5, "/offers"), (9, "/contact"), (300, "/")])
+    session_service.reconstruct_sessions()
+
+    contact = Contact(name="Session User", email="session@example.com")
+    company = Company(name="Session Company", size=10)
+    db.add_all([contact, company])
+    db.commit()
+    lead = Lead(
+        contact_id=contact.id,
+        company_id=company.id,
+        status_id=db.query(LeadStatus).filter_by(name="nouveau").one().id,
+        urgency_id=db.query(LeadUrgency).filter_by(name="ce mois").one().id,
+        fingerprint_visitor_id="session-visitor-1",
+        submission_date=START + timedelta(minutes=10)
+    )
+    db.add(lead)
+    db.commit()
+
+    response = client.get(f"/leads/{lead.id}/session-path")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["visitor_id"] == "session-visitor-1"
+    assert data["pages"] == ["/", "/offers", "/contact"]
+
+    assert client.get("/leads/99999/session-path").status_code == 404
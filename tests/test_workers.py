@@ -0,0 +1,21 @@
+import gc
+
+from infrastructure import database
+from infrastructure.web.workers import init_worker, prepare_master
+
+
+def test_prepare_master_freezes_allocated_objects():
+    try:
+        prepare_master()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_init_worker_drops_inherited_pool_without_closing_it(monkeypatch):
+    calls = []
+    monkeypatch.setattr(database.engine, "dispose", lambda close=True: calls.append(close))
+
+    init_worker()
+
+    assert calls == [False]